@@ -0,0 +1,56 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the loading of ABI files, as a worker loading many contracts at startup
+would do it: the test ABI and a large ABI of 300 endpoints are loaded with a plain
+from_abi and from the on-disk cache of the parsed serializers.
+"""
+
+import json
+from pathlib import Path
+import tempfile
+import time
+
+from mxpyserializer import serializer_cache
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_LOADS = 1000
+N_ENDPOINTS = 300
+
+
+def build_large_abi(abi: dict) -> dict:
+    """
+    Copy the endpoints of an ABI until it holds N_ENDPOINTS endpoints
+    """
+    endpoints = []
+    for i in range(N_ENDPOINTS):
+        endpoint = dict(abi["endpoints"][i % len(abi["endpoints"])])
+        endpoint["name"] = f"{endpoint['name']}_{i}"
+        endpoints.append(endpoint)
+    return {**abi, "endpoints": endpoints}
+
+
+def main():
+    # the benchmark runs on the sources, for which nothing would be cached
+    serializer_cache.get_package_version = lambda: "benchmark"
+    with tempfile.TemporaryDirectory() as directory:
+        small_path = Path("tests/data/mycontract.abi.json")
+        large_path = Path(directory) / "large.abi.json"
+        large_path.write_text(
+            json.dumps(build_large_abi(json.loads(small_path.read_text())))
+        )
+        cache_dir = Path(directory) / "cache"
+
+        for label, file_path in (("test ABI", small_path), ("large ABI", large_path)):
+            AbiSerializer.from_abi(file_path, cache_dir=cache_dir)
+            print(f"from_abi {label} ({N_LOADS} loads)")
+            for mode, kwargs in (("plain", {}), ("cached", {"cache_dir": cache_dir})):
+                start = time.perf_counter()
+                for _ in range(N_LOADS):
+                    AbiSerializer.from_abi(file_path, **kwargs)
+                duration = time.perf_counter() - start
+                print(f"    {mode + ':':8} {duration / N_LOADS * 1e3:.3f} ms per load")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the encoding of many calls of the same endpoint, as done to build an
+airdrop batch: one call of encode_endpoint_inputs per row followed by the
+hex join of the data field, against encode_endpoint_inputs_many.
+"""
+
+from pathlib import Path
+import time
+from typing import Callable
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_ROWS = 50_000
+
+
+def measure(function: Callable, n_runs: int = 3) -> float:
+    """
+    Measure the best duration of several calls of a function
+
+    :param function: function to call
+    :type function: Callable
+    :param n_runs: number of calls, defaults to 3
+    :type n_runs: int, optional
+    :return: best duration in seconds
+    :rtype: float
+    """
+    durations = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    abi_path = Path(__file__).parent.parent / "tests/data/mycontract.abi.json"
+    abi_serializer = AbiSerializer.from_abi(abi_path)
+    rows = [[i * 10**15, i % 2 == 0, "TKN-123456"] for i in range(N_ROWS)]
+
+    def encode_one_by_one():
+        return [
+            "@".join(
+                [
+                    "myEndpoint",
+                    *[
+                        e.hex()
+                        for e in abi_serializer.encode_endpoint_inputs("myEndpoint", r)
+                    ],
+                ]
+            )
+            for r in rows
+        ]
+
+    timings = {
+        "one by one": measure(encode_one_by_one),
+        "many, offsets": measure(
+            lambda: abi_serializer.encode_endpoint_inputs_many("myEndpoint", rows)
+        ),
+        "many, data fields": measure(
+            lambda: abi_serializer.encode_endpoint_inputs_many(
+                "myEndpoint", rows, data_fields=True
+            )
+        ),
+    }
+    print(f"data fields of myEndpoint ({N_ROWS} rows)")
+    for name, duration in timings.items():
+        print(f"    {name:<20}{duration / N_ROWS * 1e6:.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the conversions between public keys and bech32 addresses: the SDK
+Address class against the built-in codec, one address at a time and in batch.
+"""
+
+import os
+import time
+from typing import Callable
+
+from multiversx_sdk_core.address import Address
+import numpy as np
+
+from mxpyserializer import bech32
+
+N_ADDRESSES = 20_000
+
+
+def measure(function: Callable, *args) -> float:
+    """
+    Measure the duration of a function call
+
+    :param function: function to call
+    :type function: Callable
+    :return: duration in seconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    pubkeys = [os.urandom(32) for _ in range(N_ADDRESSES)]
+    pubkeys_array = np.frombuffer(b"".join(pubkeys), dtype=np.uint8).reshape(-1, 32)
+    addresses = [Address(p, "erd").bech32() for p in pubkeys]
+
+    timings = {
+        "encode sdk": measure(lambda: [Address(p, "erd").bech32() for p in pubkeys]),
+        "encode built-in": measure(
+            lambda: [bech32.pubkey_to_bech32(p) for p in pubkeys]
+        ),
+        "encode batch ndarray": measure(bech32.pubkeys_to_bech32, pubkeys_array),
+        "decode sdk": measure(
+            lambda: [Address.from_bech32(a).get_public_key() for a in addresses]
+        ),
+        "decode built-in": measure(bech32.bech32_to_pubkeys, addresses),
+    }
+    print(f"bech32 conversions ({N_ADDRESSES} addresses)")
+    for name, duration in timings.items():
+        print(f"    {name:<22}{duration / N_ADDRESSES * 1e6:.2f} us/address")
+
+
+if __name__ == "__main__":
+    main()
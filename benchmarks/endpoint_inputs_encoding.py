@@ -0,0 +1,83 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the encoding of large argument lists: a batch call taking a few
+thousand Pair structs as a variadic argument, given as a list and as a generator.
+The former implementation copied the values with deepcopy before encoding them,
+the cost of this copy is measured for reference.
+"""
+
+from copy import deepcopy
+import json
+from pathlib import Path
+import time
+from typing import Callable
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_PAIRS = 5_000
+OWNER = "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg"
+
+
+def measure(function: Callable) -> float:
+    """
+    Measure the duration of a function call
+
+    :param function: function to call
+    :type function: Callable
+    :return: duration in seconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    abi_path = Path(__file__).parent.parent / "tests/data/mycontract.abi.json"
+    abi = json.loads(abi_path.read_text(encoding="utf-8"))
+    abi["endpoints"].append(
+        {
+            "name": "setPairs",
+            "mutability": "mutable",
+            "inputs": [{"name": "pairs", "type": "variadic<Pair>", "multi_arg": True}],
+            "outputs": [],
+        }
+    )
+    abi_serializer = AbiSerializer.from_abi_dict(abi)
+
+    def build_pair(i: int) -> dict:
+        return {
+            "pair_id": i,
+            "state": "Active",
+            "enabled": True,
+            "owner": OWNER,
+            "first_token_id": "WEGLD-bd4d79",
+            "second_token_id": "USDC-c76f1f",
+            "lp_token_id": f"LP-{i:06x}",
+            "lp_token_decimal": 18,
+            "first_token_reserve": i * 10**18,
+            "second_token_reserve": i * 10**6,
+            "lp_token_supply": i * 10**18,
+            "lp_token_roles_are_set": True,
+        }
+
+    pairs = [build_pair(i) for i in range(N_PAIRS)]
+    timings = {
+        "deepcopy (former cost)": measure(lambda: deepcopy(pairs)),
+        "encode list": measure(
+            lambda: abi_serializer.encode_endpoint_inputs("setPairs", pairs)
+        ),
+        "encode generator": measure(
+            lambda: abi_serializer.encode_endpoint_inputs(
+                "setPairs", (build_pair(i) for i in range(N_PAIRS))
+            )
+        ),
+    }
+    print(f"encode_endpoint_inputs variadic<Pair> ({N_PAIRS} pairs)")
+    for name, duration in timings.items():
+        print(f"    {name:<24}{duration * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
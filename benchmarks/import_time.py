@@ -0,0 +1,74 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the import time of the serializer, as paid by each new process
+(command line tools, workers, serverless functions cold starts).
+Each measure is done in a fresh interpreter.
+"""
+
+import statistics
+import subprocess  # nosec B404
+import sys
+import time
+
+N_RUNS = 20
+MODULE = "mxpyserializer.abi_serializer"
+# heavy dependencies that must not be imported with the serializer
+LAZY_MODULES = (
+    "multiversx_sdk_core",
+    "multiversx_sdk_network_providers",
+    "numpy",
+    "pyarrow",
+)
+
+
+def measure_import(module: str) -> float:
+    """
+    Measure the time needed by a fresh interpreter to import a module
+
+    :param module: module to import
+    :type module: str
+    :return: import time in seconds
+    :rtype: float
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    output = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return float(output.stdout)
+
+
+def get_loaded_modules(module: str) -> set:
+    """
+    Return the top level modules loaded by the import of a module
+
+    :param module: module to import
+    :type module: str
+    :return: names of the loaded top level modules
+    :rtype: set
+    """
+    code = f"import sys; import {module}; print(' '.join(sys.modules))"
+    output = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return {name.split(".")[0] for name in output.stdout.split()}
+
+
+def main():
+    start = time.perf_counter()
+    timings = [measure_import(MODULE) for _ in range(N_RUNS)]
+    loaded_modules = get_loaded_modules(MODULE)
+    print(f"import {MODULE} ({N_RUNS} fresh interpreters)")
+    print(f"    min:    {min(timings) * 1000:.1f} ms")
+    print(f"    median: {statistics.median(timings) * 1000:.1f} ms")
+    for lazy_module in LAZY_MODULES:
+        status = "loaded" if lazy_module in loaded_modules else "not loaded"
+        print(f"    {lazy_module}: {status}")
+    print(f"total benchmark time: {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the building of the data field of a transaction transferring two
+tokens to an endpoint: the manual hex join of the encoded parts against
+encode_endpoint_input_data.
+"""
+
+from pathlib import Path
+import timeit
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_CALLS = 20_000
+RECEIVER = "erd1qqqqqqqqqqqqqpgqqz6vp9y50ep867vnr296mqf3dduh6guvmvlsu3sujc"
+TRANSFERS = [
+    {"identifier": "ZOG-c66239", "nonce": 0, "amount": 10772407300},
+    {"identifier": "WEGLD-bd4d79", "nonce": 0, "amount": 6182113405711666},
+]
+
+
+def main():
+    abi_path = Path(__file__).parent.parent / "tests/data/mycontract.abi.json"
+    abi_serializer = AbiSerializer.from_abi(abi_path)
+
+    def build_manually() -> str:
+        parts = [
+            abi_serializer.top_encode("Address", RECEIVER),
+            abi_serializer.top_encode("u32", len(TRANSFERS)),
+        ]
+        for transfer in TRANSFERS:
+            parts.append(
+                abi_serializer.top_encode("TokenIdentifier", transfer["identifier"])
+            )
+            parts.append(abi_serializer.top_encode("u64", transfer["nonce"]))
+            parts.append(abi_serializer.top_encode("BigUint", transfer["amount"]))
+        parts.append(abi_serializer.top_encode("utf-8 string", "addLiquidity"))
+        parts.extend(abi_serializer.encode_endpoint_inputs("addLiquidity", [1, 1]))
+        return "@".join(["MultiESDTNFTTransfer", *[p.hex() for p in parts]])
+
+    def build_with_builder() -> str:
+        return abi_serializer.encode_endpoint_input_data(
+            "addLiquidity", [1, 1], TRANSFERS, RECEIVER
+        )
+
+    assert build_manually() == build_with_builder()
+    print(f"MultiESDTNFTTransfer data field ({N_CALLS} calls)")
+    for name, function in [("manual", build_manually), ("builder", build_with_builder)]:
+        duration = min(timeit.repeat(function, number=N_CALLS, repeat=3))
+        print(f"    {name:<10}{duration / N_CALLS * 1e6:.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
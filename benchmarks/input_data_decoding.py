@@ -0,0 +1,52 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the decoding of transaction data fields, as an indexer would do it:
+the data fields are given as strings, as raw bytes and as memoryviews over a single
+buffer holding all of them.
+"""
+
+from pathlib import Path
+import time
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_DATA_FIELDS = 50_000
+
+
+def main():
+    abi_serializer = AbiSerializer.from_abi(Path("tests/data/mycontract.abi.json"))
+    transfers = [
+        {"identifier": "ZOG-c66239", "nonce": 0, "amount": 10772407300},
+        {"identifier": "WEGLD-bd4d79", "nonce": 0, "amount": 6182113405711666},
+    ]
+    receiver = "erd1qqqqqqqqqqqqqpgqqz6vp9y50ep867vnr296mqf3dduh6guvmvlsu3sujc"
+    data_fields = [
+        abi_serializer.encode_endpoint_input_data(
+            "myEndpoint", [i, True, "TKN-123456"], transfers, receiver
+        )
+        for i in range(N_DATA_FIELDS)
+    ]
+    bytes_data_fields = [d.encode() for d in data_fields]
+    buffer = memoryview(b"".join(bytes_data_fields))
+    views = []
+    offset = 0
+    for data_field in bytes_data_fields:
+        views.append(buffer[offset : offset + len(data_field)])
+        offset += len(data_field)
+
+    print(f"decode_endpoint_input_data MultiESDTNFTTransfer ({N_DATA_FIELDS} calls)")
+    for label, inputs in (
+        ("str", data_fields),
+        ("bytes", bytes_data_fields),
+        ("memoryview", views),
+    ):
+        start = time.perf_counter()
+        for input_data in inputs:
+            abi_serializer.decode_endpoint_input_data(input_data)
+        duration = time.perf_counter() - start
+        print(f"    {label + ':':12} {duration / N_DATA_FIELDS * 1e6:.2f} us per call")
+
+
+if __name__ == "__main__":
+    main()
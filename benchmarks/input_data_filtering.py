@@ -0,0 +1,69 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the filtering of transaction data fields before their decoding, as an
+indexer would do it when only one endpoint out of ten is relevant: all the data
+fields are decoded then filtered, or filtered on their raw bytes first.
+"""
+
+from pathlib import Path
+import time
+
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.input_data import InputDataFilter
+
+N_DATA_FIELDS = 50_000
+
+
+def main():
+    abi_serializer = AbiSerializer.from_abi(Path("tests/data/mycontract.abi.json"))
+    transfers = [
+        {"identifier": "ZOG-c66239", "nonce": 0, "amount": 10772407300},
+        {"identifier": "WEGLD-bd4d79", "nonce": 0, "amount": 6182113405711666},
+    ]
+    receiver = "erd1qqqqqqqqqqqqqpgqqz6vp9y50ep867vnr296mqf3dduh6guvmvlsu3sujc"
+    data_fields = [
+        abi_serializer.encode_endpoint_input_data(
+            "myEndpoint", [i, True, "TKN-123456"], transfers, receiver
+        )
+        for i in range(N_DATA_FIELDS)
+    ]
+    # one data field out of ten calls the relevant endpoint
+    relevant_data_field = data_fields[0]
+    data_fields = [
+        d if i % 10 == 0 else d.replace("@6d79456e64706f696e74@", "@6f74686572@")
+        for i, d in enumerate(data_fields)
+    ]
+    input_filter = InputDataFilter(endpoint_names={"myEndpoint"})
+    assert input_filter.matches(relevant_data_field)
+
+    def decode_then_filter():
+        results = []
+        for data_field in data_fields:
+            try:
+                result = abi_serializer.decode_endpoint_input_data(data_field)
+            except Exception:  # pylint: disable=broad-except
+                continue  # other endpoints are unknown to this ABI
+            if result[0] == "myEndpoint":
+                results.append(result)
+        return results
+
+    def filter_then_decode():
+        decode = abi_serializer.decode_endpoint_input_data
+        results = [decode(d, input_filter=input_filter) for d in data_fields]
+        return [r for r in results if r is not None]
+
+    print(f"decode_endpoint_input_data, 10% relevant ({N_DATA_FIELDS} calls)")
+    for label, decode_relevant in (
+        ("decode then filter", decode_then_filter),
+        ("filter then decode", filter_then_decode),
+    ):
+        start = time.perf_counter()
+        results = decode_relevant()
+        duration = time.perf_counter() - start
+        assert len(results) == N_DATA_FIELDS // 10
+        print(f"    {label + ':':20} {duration / N_DATA_FIELDS * 1e6:.2f} us per call")
+
+
+if __name__ == "__main__":
+    main()
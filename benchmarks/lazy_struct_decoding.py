@@ -0,0 +1,55 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the lazy decoding of custom structs: a List of 10k Pair structs (12
+fields) is decoded eagerly and as lazy views, and only two fields of each struct are
+read. Each struct has a different owner, as in the results of a real query.
+"""
+
+import os
+from pathlib import Path
+import time
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_STRUCTS = 10_000
+
+
+def main():
+    abi_serializer = AbiSerializer.from_abi(Path("tests/data/mycontract.abi.json"))
+    data = b"".join(
+        abi_serializer.nested_encode(
+            "Pair",
+            [
+                i,
+                1,
+                True,
+                os.urandom(32),
+                "MMLG-9a907b",
+                "WEGLD-bd4d79",
+                "MMLGWEGLD-830df2",
+                18,
+                129610503061042963410339063,
+                18725608891927287933,
+                2183631501244825989,
+                True,
+            ],
+        )
+        for i in range(N_STRUCTS)
+    )
+
+    print(f"top_decode List<Pair> ({N_STRUCTS} structs), two fields read")
+    for label, lazy_structs in (("eager", False), ("lazy", True)):
+        serializer = abi_serializer.with_options(lazy_structs=lazy_structs)
+        start = time.perf_counter()
+        pairs = serializer.top_decode("List<Pair>", data)
+        reserves = [
+            (p["first_token_reserve"], p["second_token_reserve"]) for p in pairs
+        ]
+        duration = time.perf_counter() - start
+        assert len(reserves) == N_STRUCTS
+        print(f"    {label + ':':7} {duration / N_STRUCTS * 1e6:.2f} us per struct")
+
+
+if __name__ == "__main__":
+    main()
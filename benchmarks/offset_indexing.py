@@ -0,0 +1,69 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the indexing of a List of structs: the offsets of the 10k Pair structs
+of a blob are found by decoding each struct and by reading only their encoded sizes,
+then a single struct is decoded at its offset.
+"""
+
+import os
+from pathlib import Path
+import time
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_STRUCTS = 10_000
+
+
+def main():
+    abi_serializer = AbiSerializer.from_abi(Path("tests/data/mycontract.abi.json"))
+    data = b"".join(
+        abi_serializer.nested_encode(
+            "Pair",
+            [
+                i,
+                1,
+                True,
+                os.urandom(32),
+                "MMLG-9a907b",
+                "WEGLD-bd4d79",
+                "MMLGWEGLD-830df2",
+                18,
+                129610503061042963410339063,
+                18725608891927287933,
+                2183631501244825989,
+                True,
+            ],
+        )
+        for i in range(N_STRUCTS)
+    )
+    view = memoryview(data)
+
+    def index_by_decoding():
+        offsets = []
+        offset = 0
+        for _ in range(N_STRUCTS):
+            offsets.append(offset)
+            _, offset = abi_serializer.nested_decode_at("Pair", view, offset)
+        return offsets
+
+    def index_by_size():
+        offsets = []
+        offset = 0
+        for _ in range(N_STRUCTS):
+            offsets.append(offset)
+            offset += abi_serializer.encoded_size("Pair", view, offset)
+        return offsets
+
+    print(f"offsets of {N_STRUCTS} Pair structs")
+    for label, index in (("decoding", index_by_decoding), ("sizes", index_by_size)):
+        start = time.perf_counter()
+        offsets = index()
+        duration = time.perf_counter() - start
+        pair, _ = abi_serializer.nested_decode_at("Pair", view, offsets[1234])
+        assert pair["pair_id"] == 1234
+        print(f"    {label + ':':10} {duration / N_STRUCTS * 1e6:.2f} us per struct")
+
+
+if __name__ == "__main__":
+    main()
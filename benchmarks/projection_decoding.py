@@ -0,0 +1,51 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the projected decoding: 10k top encoded Pair structs, as returned by a
+view endpoint, are decoded entirely and with a projection on their reserves.
+"""
+
+import os
+from pathlib import Path
+import time
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_STRUCTS = 10_000
+PROJECTION = ["first_token_reserve", "second_token_reserve", "state.name"]
+
+
+def main():
+    abi_serializer = AbiSerializer.from_abi(Path("tests/data/mycontract.abi.json"))
+    payloads = [
+        abi_serializer.top_encode(
+            "Pair",
+            [
+                i,
+                1,
+                True,
+                os.urandom(32),
+                "MMLG-9a907b",
+                "WEGLD-bd4d79",
+                "MMLGWEGLD-830df2",
+                18,
+                129610503061042963410339063,
+                18725608891927287933,
+                2183631501244825989,
+                True,
+            ],
+        )
+        for i in range(N_STRUCTS)
+    ]
+
+    print(f"top_decode Pair ({N_STRUCTS} structs), projection: {PROJECTION}")
+    for label, projection in (("full", None), ("projected", PROJECTION)):
+        start = time.perf_counter()
+        for payload in payloads:
+            abi_serializer.top_decode("Pair", payload, projection=projection)
+        duration = time.perf_counter() - start
+        print(f"    {label + ':':11} {duration / N_STRUCTS * 1e6:.2f} us per struct")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the streaming decoding of a large variadic result: a query returning a
+variadic<multi<u64,BigUint>> of 500k elements is aggregated with top_decode and
+with iter_top_decode, and the peak memory of the decoding is compared.
+"""
+
+import time
+import tracemalloc
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+N_ELEMENTS = 500_000
+
+
+def main():
+    abi_serializer = AbiSerializer()
+    type_name = "variadic<multi<u64,BigUint>>"
+    parts = []
+    for i in range(N_ELEMENTS):
+        parts.append(i.to_bytes(8, "big"))
+        parts.append((i * 10**18).to_bytes(16, "big").lstrip(b"\x00"))
+
+    print(f"{type_name} ({N_ELEMENTS} elements), sum of the amounts")
+    for label, decode in (
+        ("top_decode", abi_serializer.top_decode),
+        ("iter_top_decode", abi_serializer.iter_top_decode),
+    ):
+        tracemalloc.start()
+        start = time.perf_counter()
+        total = sum(amount for _, amount in decode(type_name, parts))
+        duration = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert total == sum(i * 10**18 for i in range(N_ELEMENTS))
+        print(f"    {label + ':':17} {duration:.3f} s, peak {peak / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+author: Etienne Wallet
+
+Benchmark of the decoding of large multi-valued results: a query returning a
+variadic<multi<Address,BigUint>> of 100k elements, as a list of 200k parts.
+"""
+
+import os
+import time
+
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.data_models import AbiIO
+
+N_ELEMENTS = 100_000
+
+
+def main():
+    abi_serializer = AbiSerializer(address_format="bytes")
+    data_parts = []
+    for i in range(N_ELEMENTS):
+        data_parts.append(os.urandom(32))
+        data_parts.append((i * 10**18).to_bytes(16, "big").lstrip(b"\x00"))
+    io_list = [AbiIO(type="u32"), AbiIO("variadic<multi<Address,BigUint>>", "", True)]
+    parts = [N_ELEMENTS.to_bytes(4, "big"), *data_parts]
+
+    start = time.perf_counter()
+    results = abi_serializer.decode_io(io_list, parts)
+    duration = time.perf_counter() - start
+
+    assert len(results) == 1 + N_ELEMENTS
+    assert len(parts) == 1 + 2 * N_ELEMENTS, "the input parts must not be mutated"
+    print(f"decode_io variadic<multi<Address,BigUint>> ({N_ELEMENTS} elements)")
+    print(f"    total:   {duration:.3f} s")
+    print(f"    element: {duration / N_ELEMENTS * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,22 +6,48 @@ and deserialize complex types
 """
 
 from __future__ import annotations
-from copy import deepcopy
-from dataclasses import asdict
 import json
-
 from pathlib import Path
-import re
-from typing import Any, Dict, List, Optional, Tuple, Union, Iterable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from multiversx_sdk_core import Address
-from multiversx_sdk_core.errors import ErrBadPubkeyLength
-from multiversx_sdk_network_providers.contract_query_response import (
-    ContractQueryResponse,
+from mxpyserializer import (
+    basic_type,
+    batch_encoding,
+    codec_plan,
+    columnar,
+    errors,
+    field_projection,
+    input_data,
+    parallel,
+    serializer_cache,
+)
+from mxpyserializer.data_models import (
+    AbiEndpoint,
+    AbiIO,
+    AbiVariant,
+    AbiField,
+    AbiStruct,
+    AbiEnum,
 )
+from mxpyserializer.lazy_struct import LazyStruct
+from mxpyserializer.struct_layout import FieldsLayout, build_fields_layout
+from mxpyserializer.type_tree import TypeNode, parse_type
 
-from mxpyserializer import basic_type, errors
-from mxpyserializer.data_models import AbiEndpoint, AbiField, AbiStruct, AbiEnum
+if TYPE_CHECKING:
+    from multiversx_sdk_network_providers.contract_query_response import (
+        ContractQueryResponse,
+    )
 
 
 class AbiSerializer:
@@ -35,10 +61,94 @@ class AbiSerializer:
         endpoints: Optional[Dict[str, AbiEndpoint]] = None,
         structs: Optional[Dict[str, AbiStruct]] = None,
         enums: Optional[Dict[str, AbiEnum]] = None,
+        numpy_mode: bool = False,
+        address_format: str = "bech32",
+        lazy_structs: bool = False,
     ):
         self.endpoints = {} if endpoints is None else endpoints
         self.structs = {} if structs is None else structs
         self.enums = {} if enums is None else enums
+        # decode the lists, arrays and variadics of fixed size integers as ndarrays
+        self.numpy_mode = numpy_mode
+        # format of the decoded addresses: "bech32", "bytes", "hex" or "lazy"
+        basic_type.get_address_converter(address_format)
+        self.address_format = address_format
+        # decode the custom structs as views that decode their fields when read
+        self.lazy_structs = lazy_structs
+        self._type_nodes: Dict[str, TypeNode] = {}
+        # type trees decoding only some fields, keyed by type name and projection
+        self._projected_nodes: Dict[Tuple[str, Tuple[str, ...]], TypeNode] = {}
+        # compiled codecs, keyed by the frozen model they were compiled from. They
+        # are built on first use, or all at once by compile(), so that serializers
+        # of contracts that are rarely called stay small in memory.
+        self._endpoint_plans: Dict[AbiEndpoint, codec_plan.EndpointPlan] = {}
+        # outputs codecs decoding only some fields, keyed by endpoint and projection
+        self._projected_plans: Dict[
+            Tuple[AbiEndpoint, Tuple[str, ...]], Tuple[codec_plan.IOPlan, ...]
+        ] = {}
+        self._struct_layouts: Dict[AbiStruct, FieldsLayout] = {}
+        self._variant_layouts: Dict[AbiVariant, FieldsLayout] = {}
+        # nested encoding size of the custom types, None if it depends on the value
+        self._static_sizes: Dict[str, Optional[int]] = {}
+
+    def __getstate__(self) -> Dict:
+        # only the definitions and the options are pickled, the caches are rebuilt
+        return {
+            "abi": self.to_dict(),
+            "numpy_mode": self.numpy_mode,
+            "address_format": self.address_format,
+            "lazy_structs": self.lazy_structs,
+        }
+
+    def __setstate__(self, state: Dict):
+        restored = AbiSerializer.from_dict(state["abi"])
+        restored.numpy_mode = state["numpy_mode"]
+        restored.address_format = state["address_format"]
+        restored.lazy_structs = state.get("lazy_structs", False)
+        self.__dict__.update(restored.__dict__)
+
+    def with_options(
+        self,
+        numpy_mode: Optional[bool] = None,
+        address_format: Optional[str] = None,
+        lazy_structs: Optional[bool] = None,
+    ) -> AbiSerializer:
+        """
+        Return a serializer using the given decoding options. The returned serializer
+        shares the definitions and the caches of this one, so it is cheap to create
+        for a single call. This instance is returned if the options are unchanged.
+
+        :param numpy_mode: if the lists of fixed size integers should be decoded as
+            ndarrays, defaults to the mode of this serializer
+        :type numpy_mode: Optional[bool], optional
+        :param address_format: format of the decoded addresses ("bech32", "bytes",
+            "hex" or "lazy"), defaults to the format of this serializer
+        :type address_format: Optional[str], optional
+        :param lazy_structs: if the custom structs should be decoded as lazy views,
+            defaults to the mode of this serializer
+        :type lazy_structs: Optional[bool], optional
+        :return: serializer with the given options
+        :rtype: AbiSerializer
+        """
+        if numpy_mode is None:
+            numpy_mode = self.numpy_mode
+        if address_format is None:
+            address_format = self.address_format
+        if lazy_structs is None:
+            lazy_structs = self.lazy_structs
+        if (
+            numpy_mode == self.numpy_mode
+            and address_format == self.address_format
+            and lazy_structs == self.lazy_structs
+        ):
+            return self
+        basic_type.get_address_converter(address_format)
+        serializer = object.__new__(AbiSerializer)
+        serializer.__dict__.update(self.__dict__)
+        serializer.numpy_mode = numpy_mode
+        serializer.address_format = address_format
+        serializer.lazy_structs = lazy_structs
+        return serializer
 
     def to_dict(self) -> Dict:
         """
@@ -48,9 +158,9 @@ class AbiSerializer:
         :rtype: Dict
         """
         return {
-            "endpoints": {e: asdict(v) for e, v in self.endpoints.items()},
-            "structs": {e: asdict(v) for e, v in self.structs.items()},
-            "enums": {e: asdict(v) for e, v in self.enums.items()},
+            "endpoints": {e: v.to_dict() for e, v in self.endpoints.items()},
+            "structs": {e: v.to_dict() for e, v in self.structs.items()},
+            "enums": {e: v.to_dict() for e, v in self.enums.items()},
         }
 
     @staticmethod
@@ -108,18 +218,233 @@ class AbiSerializer:
         return AbiSerializer(endpoints, structs, enums)
 
     @classmethod
-    def from_abi(cls, abi_file_path: Path) -> AbiSerializer:
+    def from_abi(
+        cls, abi_file_path: Path, cache_dir: Optional[Path] = None
+    ) -> AbiSerializer:
         """
-        Read an ABI file and construct an AbiSerializer instance accordingly
+        Read an ABI file and construct an AbiSerializer instance accordingly.
+        If a cache directory is given, the parsed models and type trees are stored
+        in it, keyed by the SHA-256 of the ABI file and the package version, and
+        are loaded from it on the next calls instead of being parsed again. Nothing
+        is cached if the package is not installed, as its version is unknown.
 
         :param abi_file_path: path to the ABI file
         :type abi_file_path: Path
+        :param cache_dir: directory of the compiled serializers, defaults to None
+        :type cache_dir: Optional[Path], optional
         :return: instance generated from the file
         :rtype: AbiSerializer
         """
-        with open(abi_file_path.as_posix(), "r", encoding="utf-8") as file:
-            raw_content = json.load(file)
-        return cls.from_abi_dict(raw_content)
+        with open(abi_file_path.as_posix(), "rb") as file:
+            abi_content = file.read()
+        if cache_dir is None:
+            return cls.from_abi_dict(json.loads(abi_content))
+
+        cache_path = serializer_cache.get_cache_path(cache_dir, abi_content)
+        if cache_path is None:
+            return cls.from_abi_dict(json.loads(abi_content))
+        state = serializer_cache.load_state(cache_path)
+        if state is not None:
+            serializer = cls(state["endpoints"], state["structs"], state["enums"])
+            serializer._type_nodes.update(state["type_nodes"])
+            return serializer
+        serializer = cls.from_abi_dict(json.loads(abi_content))
+        serializer.compile()
+        state = {
+            "endpoints": serializer.endpoints,
+            "structs": serializer.structs,
+            "enums": serializer.enums,
+            "type_nodes": serializer._type_nodes,
+        }
+        serializer_cache.store_state(cache_path, state)
+        return serializer
+
+    def compile(self):
+        """
+        Build the type trees and the fields layouts of all the custom types and
+        the codec plans of all the endpoints, so that no parsing is left for the
+        first calls. Without it, each codec is built the first time it is used,
+        which keeps the memory of a serializer low when only a few endpoints of
+        the contract are called. Types that are not supported are left uncompiled
+        and only raise an error when used.
+        """
+        for endpoint_name in self.endpoints:
+            try:
+                self.get_endpoint_plan(endpoint_name)
+            except errors.UnknownType:
+                pass
+        for type_name in self.structs:
+            try:
+                self.get_type_node(type_name)
+                self.get_struct_layout(type_name)
+                self.get_static_size(type_name)
+            except errors.UnknownType:
+                pass
+        for type_name, abi_enum in self.enums.items():
+            try:
+                self.get_type_node(type_name)
+                for variant in abi_enum.variants:
+                    self.get_variant_layout(variant)
+                self.get_static_size(type_name)
+            except errors.UnknownType:
+                pass
+
+    def get_type_node(self, type_name: str) -> TypeNode:
+        """
+        Return the type tree corresponding to a type name. Each type name is parsed
+        only once and the resulting tree is cached by the serializer.
+
+        :param type_name: name of the type to parse
+        :type type_name: str
+        :return: root node of the type tree
+        :rtype: TypeNode
+        """
+        try:
+            return self._type_nodes[type_name]
+        except KeyError:
+            node = parse_type(type_name, self.structs, self.enums)
+            self._type_nodes[type_name] = node
+            return node
+
+    def get_projected_type_node(
+        self, type_name: str, projection: Union[str, Sequence[str]]
+    ) -> TypeNode:
+        """
+        Return the type tree decoding only the selected fields of a type. Each
+        projection is compiled only once and cached by the serializer.
+
+        :param type_name: name of the type to decode
+        :type type_name: str
+        :param projection: paths of the fields to decode, such as "state.name", or
+            a single path
+        :type projection: Union[str, Sequence[str]]
+        :return: type tree of the projected values
+        :rtype: TypeNode
+        """
+        projection = field_projection.to_paths_tuple(projection)
+        key = (type_name, projection)
+        try:
+            return self._projected_nodes[key]
+        except KeyError:
+            node = field_projection.build_projected_node(
+                self,
+                self.get_type_node(type_name),
+                field_projection.parse_projection(projection),
+            )
+            self._projected_nodes[key] = node
+            return node
+
+    def get_endpoint_plan(self, endpoint_name: str) -> codec_plan.EndpointPlan:
+        """
+        Return the codec plan of an endpoint. Plans are built on first use, or by
+        compile(), and are then reused for each call.
+
+        :param endpoint_name: name of the endpoint
+        :type endpoint_name: str
+        :return: codec plan of the endpoint
+        :rtype: codec_plan.EndpointPlan
+        """
+        try:
+            endpoint = self.endpoints[endpoint_name]
+        except KeyError as err:
+            raise errors.UnknownEndpoint(endpoint_name) from err
+        try:
+            return self._endpoint_plans[endpoint]
+        except KeyError:
+            plan = codec_plan.build_endpoint_plan(endpoint, self.get_type_node)
+            self._endpoint_plans[endpoint] = plan
+            return plan
+
+    def get_struct_layout(self, type_name: str) -> FieldsLayout:
+        """
+        Return the layout of the fields of a custom struct. Each layout is built
+        only once and cached by the serializer.
+
+        :param type_name: name of the struct
+        :type type_name: str
+        :return: layout of the fields of the struct
+        :rtype: FieldsLayout
+        """
+        try:
+            type_definition = self.structs[type_name]
+        except KeyError as err:
+            raise errors.UnknownStruct(type_name) from err
+        try:
+            return self._struct_layouts[type_definition]
+        except KeyError:
+            layout = build_fields_layout(type_definition.fields, self.get_type_node)
+            self._struct_layouts[type_definition] = layout
+            return layout
+
+    def get_variant_layout(self, variant: AbiVariant) -> FieldsLayout:
+        """
+        Return the layout of the fields of a variant of a custom enum. Each layout
+        is built only once and cached by the serializer.
+
+        :param variant: variant of the enum
+        :type variant: AbiVariant
+        :return: layout of the fields of the variant
+        :rtype: FieldsLayout
+        """
+        try:
+            return self._variant_layouts[variant]
+        except KeyError:
+            layout = build_fields_layout(variant.fields, self.get_type_node)
+            self._variant_layouts[variant] = layout
+            return layout
+
+    def get_static_size(self, type_name: str) -> Optional[int]:
+        """
+        Return the nested encoding size shared by all the values of a type, or None
+        if the size depends on the value. Custom structs have a static size when all
+        their fields have one and custom enums when all their variants have fields of
+        the same size. Sizes are computed only once and cached by the serializer.
+
+        :param type_name: name of the type
+        :type type_name: str
+        :return: size of the nested encoded values
+        :rtype: Optional[int]
+        """
+        try:
+            return self._static_sizes[type_name]
+        except KeyError:
+            pass
+        abi_enum = self.enums.get(type_name)
+        if type_name in self.structs:
+            size = self.get_struct_layout(type_name).get_static_size(self)
+        elif abi_enum is not None:
+            variant_sizes = {
+                self.get_variant_layout(v).get_static_size(self) if v.fields else 0
+                for v in abi_enum.variants
+            }
+            size = None
+            if len(variant_sizes) == 1 and None not in variant_sizes:
+                size = 1 + variant_sizes.pop()
+        else:
+            size = self.get_type_node(type_name).get_static_size(self)
+        self._static_sizes[type_name] = size
+        return size
+
+    def encoded_size(self, type_name: str, data: Any, offset: int = 0) -> int:
+        """
+        Return the size of a nested encoded value without decoding it. Values with a
+        static size are jumped over at once and the others are skipped by reading
+        only their length prefixes, counts and discriminants. This allows to index
+        the elements of a large List blob and to decode only the ones needed.
+
+        :param type_name: name of the type of the value
+        :type type_name: str
+        :param data: data containing the value
+        :type data: bytes-like object (bytes, bytearray, mmap, memoryview, ...)
+        :param offset: position of the value in the data, defaults to 0
+        :type offset: int
+        :return: number of bytes of the nested encoded value
+        :rtype: int
+        """
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        node = self.get_type_node(type_name)
+        return node.nested_skip_at(self, data, offset) - offset
 
     def decode_iterable(
         self, inner_types: List[str], data: bytes
@@ -135,11 +460,34 @@ class AbiSerializer:
         :return: list of decoded values and the left over bytes
         :rtype: Tuple[List[Any], bytes]
         """
+        decoded_values, offset = self.decode_iterable_at(
+            inner_types, memoryview(data), 0
+        )
+        return decoded_values, data[offset:]
+
+    def decode_iterable_at(
+        self, inner_types: List[str], data: memoryview, offset: int
+    ) -> Tuple[List[Any], int]:
+        """
+        Decodes a part of the input data as a concatenation of nested encoded elements,
+        starting at the given offset. Returns the offset of the left over.
+
+        :param inner_types: types of the concatenated elements to retrieve, in order.
+        :type inner_types: List[str]
+        :param data: data containing the values to extract
+        :type data: memoryview
+        :param offset: position of the first element in the data
+        :type offset: int
+        :return: list of decoded values and the offset following them
+        :rtype: Tuple[List[Any], int]
+        """
         decoded_values = []
         for inner_type in inner_types:
-            result, data = self.nested_decode(inner_type, data)
+            result, offset = self.get_type_node(inner_type).nested_decode_at(
+                self, data, offset
+            )
             decoded_values.append(result)
-        return decoded_values, data
+        return decoded_values, offset
 
     def top_encode_iterable(self, inner_types: List[str], value: List[Any]) -> bytes:
         """
@@ -152,12 +500,28 @@ class AbiSerializer:
         :return: encoded value
         :rtype: bytes
         """
-        encoded_value = bytes()
+        buffer = bytearray()
+        self.top_encode_iterable_into(inner_types, value, buffer)
+        return bytes(buffer)
+
+    def top_encode_iterable_into(
+        self, inner_types: List[str], value: List[Any], buffer: bytearray
+    ):
+        """
+        Encode the input value as a concatenation of nested encoded elements and
+        append it to the given buffer.
+
+        :param inner_types: types of the concatenated elements to encode, in order.
+        :type inner_types: List[str]
+        :param value: list containing the values to encode
+        :type value: List[Any]
+        :param buffer: buffer to append the encoded value to
+        :type buffer: bytearray
+        """
         if len(value) != len(inner_types):
             raise errors.ElementsNumberMismatch(value, inner_types)
         for inner_type, inner_value in zip(inner_types, value):
-            encoded_value += self.nested_encode(inner_type, inner_value)
-        return encoded_value
+            self.get_type_node(inner_type).nested_encode_into(self, inner_value, buffer)
 
     def top_decode_iterable(self, inner_type: str, data: bytes) -> List[Any]:
         """
@@ -170,11 +534,7 @@ class AbiSerializer:
         :return: list of decoded values
         :rtype: List[Any]
         """
-        decoded_values = []
-        while len(data) > 0:
-            result, data = self.nested_decode(inner_type, data)
-            decoded_values.append(result)
-        return decoded_values
+        return self.get_type_node(f"List<{inner_type}>").top_decode_bytes(self, data)
 
     def nested_decode_fields(
         self, fields: List[AbiField], data: bytes
@@ -191,11 +551,35 @@ class AbiSerializer:
                 and the left over bytes
         :rtype: Tuple[Dict[str, Any], bytes]
         """
+        decoded_values, offset = self.nested_decode_fields_at(
+            fields, memoryview(data), 0
+        )
+        return decoded_values, data[offset:]
+
+    def nested_decode_fields_at(
+        self, fields: List[AbiField], data: memoryview, offset: int
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Decodes a part of the input data as a concatenation of nested encoded elements,
+        starting at the given offset. Returns the offset of the left over.
+
+        :param fields: each field  must contains the keys "name" and "type"
+        :type fields: List[AbiField]
+        :param data: data containing the values to extract
+        :type data: memoryview
+        :param offset: position of the first field in the data
+        :type offset: int
+        :return: tuple of a Dict of field name with their decoded values
+                and the offset following them
+        :rtype: Tuple[Dict[str, Any], int]
+        """
         decoded_values = {}
         for field in fields:
-            result, data = self.nested_decode(field.type, data)
+            result, offset = self.get_type_node(field.type).nested_decode_at(
+                self, data, offset
+            )
             decoded_values[field.name] = result
-        return decoded_values, data
+        return decoded_values, offset
 
     def decode_custom_struct(
         self, type_name: str, data: bytes
@@ -212,12 +596,33 @@ class AbiSerializer:
         :return: decoded structure and the left over bytes
         :rtype: Tuple[Dict[str, Any], bytes]
         """
-        try:
-            type_definition = self.structs[type_name]
-        except KeyError as err:
-            raise errors.UnknownStruct(type_name) from err
+        decoded_struct, offset = self.decode_custom_struct_at(
+            type_name, memoryview(data), 0
+        )
+        return decoded_struct, data[offset:]
 
-        return self.nested_decode_fields(type_definition.fields, data)
+    def decode_custom_struct_at(
+        self, type_name: str, data: memoryview, offset: int
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Decodes a part of the input data assuming it is a custom struct defined in the
+        ABI, starting at the given offset. Returns the offset of the left over.
+
+        :param type_name: name of the type of the value to extract from the data
+        :type type_name: str
+        :param data: data containing the value to extract
+        :type data: memoryview
+        :param offset: position of the struct in the data
+        :type offset: int
+        :return: decoded structure and the offset following it
+        :rtype: Tuple[Dict[str, Any], int]
+        """
+        layout = self.get_struct_layout(type_name)
+        if self.lazy_structs:
+            view = LazyStruct(self, layout, data, offset)
+            return view, view.end
+        values, offset = layout.decode_at(self, data, offset)
+        return dict(zip(layout.names, values)), offset
 
     def encode_custom_struct(self, type_name: str, data: Union[Dict, List]) -> bytes:
         """
@@ -231,22 +636,40 @@ class AbiSerializer:
         :return: encoded struct
         :rtype: bytes
         """
+        buffer = bytearray()
+        self.encode_custom_struct_into(type_name, data, buffer)
+        return bytes(buffer)
+
+    def encode_custom_struct_into(
+        self, type_name: str, data: Union[Dict, List], buffer: bytearray
+    ):
+        """
+        Encodes the input data assuming it is a custom struct defined in the
+        ABI and append it to the given buffer.
+
+        :param type_name: name of the type of the value to extract from the data
+        :type type_name: str
+        :param data: data to encode
+        :type data: Union[Dict, List]
+        :param buffer: buffer to append the encoded struct to
+        :type buffer: bytearray
+        """
         try:
             type_definition = self.structs[type_name]
         except KeyError as err:
             raise errors.UnknownStruct(type_name) from err
         if len(data) != len(type_definition.fields):
             raise errors.ElementsNumberMismatch(data, type_definition.fields)
-        if isinstance(data, List):
-            data = {field.name: d for field, d in zip(type_definition.fields, data)}
-        results = bytes()
-        for field in type_definition.fields:
-            try:
-                value = data[field.name]
-            except KeyError as err:
-                raise errors.MissingStuctField(type_name, field.name) from err
-            results += self.nested_encode(field.type, value)
-        return results
+        layout = self.get_struct_layout(type_name)
+        if not isinstance(data, List):
+            values = []
+            for field_name in layout.names:
+                try:
+                    values.append(data[field_name])
+                except KeyError as err:
+                    raise errors.MissingStuctField(type_name, field_name) from err
+            data = values
+        layout.encode_into(self, data, buffer)
 
     def decode_custom_enum(
         self, type_name: str, data: bytes
@@ -263,37 +686,93 @@ class AbiSerializer:
         :return: decoded enum and the left over bytes
         :rtype: Tuple[Dict[str, Any], bytes]
         """
+        decoded_enum, offset = self.decode_custom_enum_at(
+            type_name, memoryview(data), 0
+        )
+        return decoded_enum, data[offset:]
+
+    def _read_enum_variant_at(
+        self, type_name: str, data: memoryview, offset: int
+    ) -> Tuple[AbiVariant, int]:
+        """
+        Read the discriminant of a nested encoded custom enum and return the
+        selected variant along with the offset of its values
+
+        :param type_name: name of the enum
+        :type type_name: str
+        :param data: data containing the enum
+        :type data: memoryview
+        :param offset: position of the enum in the data
+        :type offset: int
+        :return: selected variant and the offset following the discriminant
+        :rtype: Tuple[AbiVariant, int]
+        """
         try:
             abi_enum = self.enums[type_name]
         except KeyError as err:
             raise errors.UnknownEnum(type_name) from err
 
-        if len(data) == 0:  # Top encoding case for discriminant 0
+        if offset == len(data):  # Top encoding case for discriminant 0
             discriminant = 0
         else:
-            discriminant, data = basic_type.nested_decode_basic("i8", data)
-
-        selected_variant = None
-        for variant in abi_enum.variants:
-            if variant.discriminant == discriminant:
-                selected_variant = variant
-                break
+            discriminant, offset = basic_type.nested_decode_basic_at("i8", data, offset)
 
+        selected_variant = abi_enum.variants_by_discriminant.get(discriminant)
         if selected_variant is None:
             raise errors.UnknownEnumDiscriminant(type_name, discriminant)
+        return selected_variant, offset
 
+    def decode_custom_enum_at(
+        self, type_name: str, data: memoryview, offset: int
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Decodes a part of the input data assuming it is a custom enum defined in the
+        ABI, starting at the given offset. Returns the offset of the left over.
+
+        :param type_name: name of the type of the value to extract from the data
+        :type type_name: str
+        :param data: data containing the value to extract
+        :type data: memoryview
+        :param offset: position of the enum in the data
+        :type offset: int
+        :return: decoded enum and the offset following it
+        :rtype: Tuple[Dict[str, Any], int]
+        """
+        selected_variant, offset = self._read_enum_variant_at(type_name, data, offset)
         if len(selected_variant.fields):
-            inner_types = [f.type for f in selected_variant.fields]
-            inner_values, data = self.decode_iterable(inner_types, data)
+            inner_values, offset = self.get_variant_layout(selected_variant).decode_at(
+                self, data, offset
+            )
         else:
             inner_values = None
 
         decoded_enum = {
             "name": selected_variant.name,
-            "discriminant": discriminant,
+            "discriminant": selected_variant.discriminant,
             "values": inner_values,
         }
-        return decoded_enum, data
+        return decoded_enum, offset
+
+    def skip_custom_enum_at(self, type_name: str, data: memoryview, offset: int) -> int:
+        """
+        Return the offset following a nested encoded custom enum, without decoding
+        the values of its variant
+
+        :param type_name: name of the enum
+        :type type_name: str
+        :param data: data containing the enum to skip
+        :type data: memoryview
+        :param offset: position of the enum in the data
+        :type offset: int
+        :return: offset following the enum
+        :rtype: int
+        """
+        selected_variant, offset = self._read_enum_variant_at(type_name, data, offset)
+        if len(selected_variant.fields):
+            offset = self.get_variant_layout(selected_variant).skip_at(
+                self, data, offset
+            )
+        return offset
 
     def encode_custom_enum(
         self, type_name: str, value: Any, top_encode: bool = False
@@ -313,6 +792,28 @@ class AbiSerializer:
         :return: encoded enum
         :rtype: bytes
         """
+        buffer = bytearray()
+        self.encode_custom_enum_into(type_name, value, buffer, top_encode)
+        return bytes(buffer)
+
+    def encode_custom_enum_into(
+        self, type_name: str, value: Any, buffer: bytearray, top_encode: bool = False
+    ):
+        """
+        Encode the input data assuming it is a custom enum defined in the
+        ABI and append it to the given buffer.
+
+        :param type_name: name of the type of the value to extract from the data
+        :type type_name: str
+        :param value: value to encode. Can be the discriminant, the name. If the enum
+            variant must contains inner values, then it should be passed as a Dict
+            containing the keys 'values' and one of 'discriminant' or 'name'
+        :type value: Any
+        :param buffer: buffer to append the encoded enum to
+        :type buffer: bytearray
+        :param top_encode: is the encoding should be a top or a nested encoding
+        :type top_encode: bool, default to False
+        """
         try:
             abi_enum = self.enums[type_name]
         except KeyError as err:
@@ -330,34 +831,33 @@ class AbiSerializer:
                 f"Enum value should be an int, a str or a dict, got {type(value)}"
             )
 
-        selected_variant = None
-        for variant in abi_enum.variants:
-            if variant.discriminant == discriminant or variant.name == name:
-                selected_variant = variant
-                break
-
+        selected_variant = abi_enum.variants_by_discriminant.get(discriminant)
+        if selected_variant is None:
+            selected_variant = abi_enum.variants_by_name.get(name)
         if selected_variant is None:
             raise errors.EnumVariantNotFound(type_name, name, discriminant)
 
         if top_encode and selected_variant.discriminant == 0 and inner_values is None:
-            return bytes()
+            return
 
-        encoded_discriminant = basic_type.nested_encode_basic(
-            "i8", selected_variant.discriminant
-        )
+        if len(selected_variant.fields) and not isinstance(inner_values, list):
+            raise TypeError(
+                "Expected a list of inner values for variant "
+                f"{selected_variant.discriminant} of the enum {type_name}"
+            )
+        basic_type.nested_encode_basic_into("i8", selected_variant.discriminant, buffer)
         if len(selected_variant.fields):
-            if not isinstance(inner_values, list):
-                raise TypeError(
-                    "Expected a list of inner values for variant "
-                    f"{selected_variant.discriminant} of the enum {type_name}"
+            if len(inner_values) != len(selected_variant.fields):
+                raise errors.ElementsNumberMismatch(
+                    inner_values, selected_variant.field_types
                 )
-            inner_types = [f.type for f in selected_variant.fields]
-            encoded_inner_values = self.top_encode_iterable(inner_types, inner_values)
-        else:
-            encoded_inner_values = bytes()
-        return encoded_discriminant + encoded_inner_values
+            self.get_variant_layout(selected_variant).encode_into(
+                self, inner_values, buffer
+            )
 
-    def nested_decode(self, type_name: str, data: bytes) -> Tuple[Any, bytes]:
+    def nested_decode(
+        self, type_name: str, data: bytes, address_format: Optional[str] = None
+    ) -> Tuple[Any, bytes]:
         """
         Decodes a part of the input data assuming a nested-encoded
         format. Returns the left over.
@@ -366,44 +866,51 @@ class AbiSerializer:
         :type type_name: str
         :param data: data containing the value to extract
         :type data: bytes
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
         :return: decoded value and the left over bytes
         :rtype: Tuple[Any, bytes]
         """
-        if type_name in basic_type.BASIC_TYPES:
-            return basic_type.nested_decode_basic(type_name, data)
-
-        list_pattern = re.match(r"^List<(.*)>$", type_name)
-        if list_pattern is not None:
-            inner_type_name = list_pattern.groups()[0]
-            list_size, data = basic_type.nested_decode_basic("u32", data)
-            return self.decode_iterable(list_size * [inner_type_name], data)
-
-        array_pattern = re.match(r"^array(\d+)<(.*)>$", type_name)
-        if array_pattern is not None:
-            array_size = int(array_pattern.groups()[0])
-            inner_type_name = array_pattern.groups()[1]
-            return self.decode_iterable(array_size * [inner_type_name], data)
-
-        tuple_pattern = re.match(r"^tuple<(.*)>$", type_name)
-        if tuple_pattern is not None:
-            inner_types = tuple_pattern.groups()[0].replace(" ", "").split(",")
-            return self.decode_iterable(inner_types, data)
-
-        option_pattern = re.match(r"^Option<(.*)>$", type_name)
-        if option_pattern is not None:
-            is_some, data = basic_type.nested_decode_basic("bool", data)
-            if is_some:
-                inner_type_name = option_pattern.groups()[0]
-                return self.nested_decode(inner_type_name, data)
-            return None, data
-
-        if type_name in self.structs:
-            return self.decode_custom_struct(type_name, data)
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.nested_decode(type_name, data)
+        result, offset = self.get_type_node(type_name).nested_decode_at(
+            self, memoryview(data), 0
+        )
+        return result, data[offset:]
 
-        if type_name in self.enums:
-            return self.decode_custom_enum(type_name, data)
+    def nested_decode_at(
+        self,
+        type_name: str,
+        data: Any,
+        offset: int = 0,
+        address_format: Optional[str] = None,
+    ) -> Tuple[Any, int]:
+        """
+        Decodes a part of the input data assuming a nested-encoded format, starting
+        at the given offset. The data is read through a memoryview: only the decoded
+        values are materialized and the buffer itself is never copied.
+        Returns the offset of the left over.
 
-        raise errors.UnknownType(type_name)
+        :param type_name: name of the type of the value to extract from the data
+        :type type_name: str
+        :param data: data containing the value to extract
+        :type data: bytes-like object (bytes, bytearray, mmap, memoryview, ...)
+        :param offset: position of the value in the data, defaults to 0
+        :type offset: int
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
+        :return: decoded value and the offset following it
+        :rtype: Tuple[Any, int]
+        """
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.nested_decode_at(type_name, data, offset)
+        if not isinstance(data, memoryview):
+            data = memoryview(data)
+        return self.get_type_node(type_name).nested_decode_at(self, data, offset)
 
     def nested_encode(self, type_name: str, value: Any) -> bytes:
         """
@@ -416,52 +923,30 @@ class AbiSerializer:
         :return: encoded value
         :rtype: bytes
         """
-        if type_name in basic_type.BASIC_TYPES:
-            return basic_type.nested_encode_basic(type_name, value)
-
-        list_pattern = re.match(r"^List<(.*)>$", type_name)
-        if list_pattern is not None:
-            if not isinstance(value, Iterable):
-                raise TypeError("Value to encode must be an iterable for List type")
-            inner_type_name = list_pattern.groups()[0]
-            list_size = len(value)
-            encoded_list_size = basic_type.nested_encode_basic("u32", list_size)
-            encoded_value = self.top_encode_iterable(
-                list_size * [inner_type_name], value
-            )
-            return encoded_list_size + encoded_value
-
-        array_pattern = re.match(r"^array(\d+)<(.*)>$", type_name)
-        if array_pattern is not None:
-            if not isinstance(value, Iterable):
-                raise TypeError("Value to encode must be an iterable for array type")
-            array_size = int(array_pattern.groups()[0])
-            inner_type_name = array_pattern.groups()[1]
-            return self.top_encode_iterable(array_size * [inner_type_name], value)
-
-        tuple_pattern = re.match(r"^tuple<(.*)>$", type_name)
-        if tuple_pattern is not None:
-            if not isinstance(value, Iterable):
-                raise TypeError("Value to encode must be an iterable for tuple type")
-            inner_types = tuple_pattern.groups()[0].replace(" ", "").split(",")
-            return self.top_encode_iterable(inner_types, value)
-
-        option_pattern = re.match(r"^Option<(.*)>$", type_name)
-        if option_pattern is not None:
-            if value is None:
-                return basic_type.nested_encode_basic("bool", False)
-            option_encoding = basic_type.nested_encode_basic("bool", True)
-            inner_type_name = option_pattern.groups()[0]
-            return option_encoding + self.nested_encode(inner_type_name, value)
+        return self.get_type_node(type_name).nested_encode(self, value)
 
-        if type_name in self.structs:
-            return self.encode_custom_struct(type_name, value)
-        if type_name in self.enums:
-            return self.encode_custom_enum(type_name, value)
+    def encode_into(self, type_name: str, value: Any, buffer: bytearray):
+        """
+        Encode the input value assuming a nested-encoded format and append it to
+        the given buffer. The whole value tree is written into this single buffer,
+        which can be reused across several calls.
 
-        raise errors.UnknownType(type_name)
+        :param type_name: name of the type of the value to encode into
+        :type type_name: str
+        :param value: value to encode
+        :type value: Any
+        :param buffer: buffer to append the encoded value to
+        :type buffer: bytearray
+        """
+        self.get_type_node(type_name).nested_encode_into(self, value, buffer)
 
-    def top_decode(self, type_name: str, data: Union[List[bytes], bytes]) -> Any:
+    def top_decode(
+        self,
+        type_name: str,
+        data: Union[List[bytes], bytes],
+        address_format: Optional[str] = None,
+        projection: Union[str, Sequence[str], None] = None,
+    ) -> Any:
         """
         Decodes a part of the input data assuming a top-encoded
         format
@@ -469,62 +954,53 @@ class AbiSerializer:
         :param type_name: name of the type of the value to extract from the data
         :type type_name: str
         :param data: data containing the value to extract
-        :type data: bytes
+        :type data: Union[List[bytes], bytes-like object]
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
+        :param projection: paths of the fields to decode, such as "state.name", or
+            a single path. The other fields are skipped without being decoded.
+            Defaults to all fields
+        :type projection: Union[str, Sequence[str], None], optional
         :return: decoded value
         :rtype: Any
         """
-        if isinstance(data, List):
-            variadic_multi_pattern = re.match(r"^variadic<multi<(.*)>>$", type_name)
-            if variadic_multi_pattern is not None:
-                inner_types = (
-                    variadic_multi_pattern.groups()[0].replace(" ", "").split(",")
-                )
-                if len(data) % len(inner_types) != 0:
-                    raise errors.MultiElementsNumberMismatch(data, inner_types)
-                results = []
-                while len(data) > 0:
-                    sub_results = []
-                    for inner_type in inner_types:
-                        sub_results.append(self.top_decode(inner_type, data.pop(0)))
-                    results.append(sub_results)
-                return results
-
-            variadic_pattern = re.match(r"^variadic<(.*)>$", type_name)
-            if variadic_pattern is not None:
-                inner_type = variadic_pattern.groups()[0]
-                return [self.top_decode(inner_type, sd) for sd in data]
-
-            # at this point, the data should not be a list of bytes
-            if len(data) == 0:
-                data = None
-            elif len(data) == 1:
-                data = data[0]
-            else:
-                raise TypeError(f"Data should not be a list for type {type_name}")
-
-        if type_name in basic_type.BASIC_TYPES:
-            return basic_type.top_decode_basic(type_name, data)
-
-        optional_pattern = re.match(r"^optional<(.*)>$", type_name)
-        if optional_pattern is not None:
-            if data is None or len(data) == 0:
-                return None
-            inner_type_name = optional_pattern.groups()[0]
-            return self.top_decode(inner_type_name, data)
-
-        list_pattern = re.match(r"^List<(.*)>$", type_name)
-        if list_pattern is not None:
-            inner_type_name = list_pattern.groups()[0]
-            return self.top_decode_iterable(inner_type_name, data)
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.top_decode(type_name, data, projection=projection)
+        if projection is not None:
+            return self.get_projected_type_node(type_name, projection).top_decode(
+                self, data
+            )
+        return self.get_type_node(type_name).top_decode(self, data)
 
-        if type_name.startswith("Option") and len(data) == 0:
-            return None
+    def iter_top_decode(
+        self,
+        type_name: str,
+        data: Union[Iterable[bytes], bytes],
+        address_format: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """
+        Decodes a top encoded List or variadic value element by element. The
+        elements are decoded only when they are consumed: they can be filtered or
+        aggregated without holding all of them, and the decoding stops if the
+        iteration stops. The NumPy mode does not apply to this decoding.
 
-        # for other cases, we can directly use the nested_decode function
-        result, data = self.nested_decode(type_name, data)
-        if len(data) != 0:
-            raise errors.LeftOverData(data)
-        return result
+        :param type_name: name of the List or variadic type to decode
+        :type type_name: str
+        :param data: data containing the values to extract, as bytes for a List and
+            as an iterable of parts for a variadic
+        :type data: Union[Iterable[bytes], bytes-like object]
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
+        :return: iterator over the decoded elements
+        :rtype: Iterator[Any]
+        """
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.iter_top_decode(type_name, data)
+        return self.get_type_node(type_name).iter_top_decode(self, data)
 
     def top_encode(self, type_name: str, value: Any) -> Union[bytes, List[bytes], None]:
         """
@@ -537,67 +1013,60 @@ class AbiSerializer:
         :return: encoded value (None if no encoding, for optional value for example)
         :rtype: Union[bytes, List[bytes], None]
         """
-        variadic_multi_pattern = re.match(r"^variadic<multi<(.*)>>$", type_name)
-        if variadic_multi_pattern is not None:
-            if not isinstance(value, Iterable):
-                raise TypeError("Value to encode must be an iterable for variadic type")
-            inner_types = variadic_multi_pattern.groups()[0].replace(" ", "").split(",")
-            encoded_value = []
-            for multi in value:
-                if not isinstance(multi, Iterable):
-                    raise TypeError(
-                        "Value to encode must be an iterable for multi type"
-                    )
-                if len(multi) != len(inner_types):
-                    raise errors.ElementsNumberMismatch(multi, inner_types)
-                for inner_value, inner_type in zip(multi, inner_types):
-                    encoded_value.append(self.top_encode(inner_type, inner_value))
-            return encoded_value
-
-        variadic_pattern = re.match(r"^variadic<(.*)>$", type_name)
-        if variadic_pattern is not None:
-            if not isinstance(value, Iterable):
-                raise TypeError("Value to encode must be an iterable for variadic type")
-            inner_type = variadic_pattern.groups()[0]
-            encoded_value = []
-            for inner_value in value:
-                encoded_value.append(self.top_encode(inner_type, inner_value))
-            return encoded_value
-
-        list_pattern = re.match(r"^List<(.*)>$", type_name)
-        if list_pattern is not None:
-            if not isinstance(value, Iterable):
-                raise TypeError("Value to encode must be an iterable for List type")
-            inner_type_name = list_pattern.groups()[0]
-            return self.top_encode_iterable(len(value) * [inner_type_name], value)
-
-        optional_pattern = re.match(r"^optional<(.*)>$", type_name)
-        if optional_pattern is not None:
-            if value is None:
-                return None
-            if isinstance(value, (list, tuple)):
-                if len(value) == 0:
-                    return None
-                value = value[0]
-            inner_type_name = optional_pattern.groups()[0]
-            return self.top_encode(inner_type_name, value)
-
-        if type_name.startswith("Option<") and value is None:
-            return bytes()
-
-        if type_name in self.enums:
-            return self.encode_custom_enum(type_name, value, True)
-
-        if type_name in basic_type.BASIC_TYPES:
-            return basic_type.top_encode_basic(type_name, value)
-
-        # for other cases, we can directly use the nested_decode function
-        return self.nested_encode(type_name, value)
+        return self.get_type_node(type_name).top_encode(self, value)
+
+    def decode_columns(
+        self,
+        type_name: str,
+        payloads: Iterable[bytes],
+        record_batch: bool = False,
+        address_format: Optional[str] = None,
+    ) -> Any:
+        """
+        Decode many top encoded values of the same custom struct into one column per
+        field. The columns of fixed size integers and booleans are NumPy arrays and
+        the other columns are lists. The parts of a variadic<Struct> result can be
+        given directly as payloads.
+
+        :param type_name: name of the struct to decode
+        :type type_name: str
+        :param payloads: top encoded values of the struct
+        :type payloads: Iterable[bytes]
+        :param record_batch: if the columns should be returned as a pyarrow
+            RecordBatch, defaults to False
+        :type record_batch: bool, optional
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
+        :return: columns by field name or a RecordBatch
+        :rtype: Union[Dict[str, Any], pyarrow.RecordBatch]
+        """
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.decode_columns(type_name, payloads, record_batch)
+        try:
+            fields = self.structs[type_name].fields
+        except KeyError as err:
+            raise errors.UnknownStruct(type_name) from err
+        layout = self.get_struct_layout(type_name)
+        rows = []
+        for payload in payloads:
+            data = memoryview(payload)
+            values, offset = layout.decode_at(self, data, 0)
+            if offset != len(data):
+                raise errors.LeftOverData(bytes(data[offset:]))
+            rows.append(values)
+        columns = columnar.build_columns(fields, rows)
+        if record_batch:
+            return columnar.to_record_batch(fields, columns)
+        return columns
 
     def decode_contract_query_response(
         self,
         endpoint_name: str,
         query_response: ContractQueryResponse,
+        address_format: Optional[str] = None,
+        projection: Union[str, Sequence[str], None] = None,
     ) -> Any:
         """
         Decode the response of a contract query by relying on the ABI definition
@@ -607,187 +1076,274 @@ class AbiSerializer:
         :type endpoint_name: str
         :param query_response: response from the contract query
         :type query_response: ContractQueryResponse
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
+        :param projection: paths of the fields to decode in the custom types
+            results, such as "state.name", or a single path. The other fields are
+            skipped without being decoded and the other results are decoded
+            entirely. Defaults to all fields
+        :type projection: Union[str, Sequence[str], None], optional
         :return: decoded results
         :rtype: Any
         """
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.decode_contract_query_response(
+                endpoint_name, query_response, projection=projection
+            )
         if query_response.return_code != "ok":
             raise ValueError(
                 f"Query failed: {query_response.return_code}, "
                 f"{query_response.return_message}"
             )
+        if projection is None:
+            outputs_plan = self.get_endpoint_plan(endpoint_name).outputs
+        else:
+            outputs_plan = self.get_projected_outputs_plan(endpoint_name, projection)
+        bytes_data_parts = query_response.get_return_data_parts()
+        return codec_plan.decode_parts(self, outputs_plan, bytes_data_parts)
+
+    def get_projected_outputs_plan(
+        self, endpoint_name: str, projection: Union[str, Sequence[str]]
+    ) -> Tuple[codec_plan.IOPlan, ...]:
+        """
+        Return the codecs of the outputs of an endpoint, decoding only the selected
+        fields of the custom types outputs. Each projection is resolved only once
+        and cached by the serializer.
+
+        :param endpoint_name: name of the endpoint
+        :type endpoint_name: str
+        :param projection: paths of the fields to decode, such as "state.name", or
+            a single path
+        :type projection: Union[str, Sequence[str]]
+        :return: resolved codecs of the outputs
+        :rtype: Tuple[codec_plan.IOPlan, ...]
+        """
         try:
             endpoint = self.endpoints[endpoint_name]
         except KeyError as err:
             raise errors.UnknownEndpoint(endpoint_name) from err
+        projection = field_projection.to_paths_tuple(projection)
+        key = (endpoint, projection)
+        try:
+            return self._projected_plans[key]
+        except KeyError:
+            pass
+
+        def get_type_node(type_name: str) -> TypeNode:
+            if field_projection.has_fields(self.get_type_node(type_name)):
+                return self.get_projected_type_node(type_name, projection)
+            return self.get_type_node(type_name)
+
+        outputs_plan = codec_plan.build_io_plan(endpoint.outputs, get_type_node)
+        self._projected_plans[key] = outputs_plan
+        return outputs_plan
+
+    def iter_decode_contract_query_response(
+        self,
+        endpoint_name: str,
+        query_response: ContractQueryResponse,
+        address_format: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """
+        Decode the response of a contract query by relying on the ABI definition,
+        yielding the results one by one. The elements of a variadic result are
+        decoded only when they are consumed, and a List result is yielded as an
+        iterator over its elements, decoded in the same way.
+
+        :param endpoint_name: name of the endpoint that was called during the query
+        :type endpoint_name: str
+        :param query_response: response from the contract query
+        :type query_response: ContractQueryResponse
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
+        :return: iterator over the decoded results
+        :rtype: Iterator[Any]
+        """
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.iter_decode_contract_query_response(
+                endpoint_name, query_response
+            )
+        if query_response.return_code != "ok":
+            raise ValueError(
+                f"Query failed: {query_response.return_code}, "
+                f"{query_response.return_message}"
+            )
+        plan = self.get_endpoint_plan(endpoint_name)
         bytes_data_parts = query_response.get_return_data_parts()
-        return self.decode_io(endpoint.outputs, bytes_data_parts)
+        return codec_plan.iter_decode_parts(self, plan.outputs, bytes_data_parts)
 
     def decode_io(
-        self, io_list: List[Dict], bytes_data_parts: List[bytes]
+        self,
+        io_list: List[Union[AbiIO, Dict]],
+        bytes_data_parts: List[bytes],
+        address_format: Optional[str] = None,
     ) -> List[Any]:
         """
         Decode a list of bytes parts based on a list of inputs or outputs types
 
-        :param io_list: orders list of types definitions to expect
-        :type io_list: List[Dict]
+        :param io_list: orders list of types definitions to expect, as AbiIO or as
+            dictionnaries from an ABI file
+        :type io_list: List[Union[AbiIO, Dict]]
         :param bytes_data_parts: data to decode
         :type bytes_data_parts: List[bytes]
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
         :return: decoded data
         :rtype: List[Any]
         """
-        decoded_results = []
-        for io_element in io_list:
-            io_type = io_element["type"]
-            is_multiresults = (
-                io_element.get("multi_result", False)
-                or io_element.get("multi_arg", False)
-            ) and not io_type.startswith("optional")
-            if is_multiresults:
-                bytes_data, bytes_data_parts = bytes_data_parts, []
-            elif len(bytes_data_parts) == 0:  # option value case
-                bytes_data = b""
-            else:
-                bytes_data = bytes_data_parts.pop(0)
-            decoded_output = self.top_decode(io_type, bytes_data)
-            if is_multiresults:
-                if decoded_output is not None:
-                    decoded_results.extend(decoded_output)
-            else:
-                if not io_type.startswith("optional") or decoded_output is not None:
-                    decoded_results.append(decoded_output)
-        if len(bytes_data_parts) > 0:
-            raise errors.LeftOverData(bytes_data_parts)
-        return decoded_results
-
-    def encode_endpoint_inputs(self, endpoint_name: str, values: List) -> List[bytes]:
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.decode_io(io_list, bytes_data_parts)
+        io_list = [e if isinstance(e, AbiIO) else AbiIO.from_dict(e) for e in io_list]
+        io_plan = codec_plan.build_io_plan(io_list, self.get_type_node)
+        return codec_plan.decode_parts(self, io_plan, bytes_data_parts)
+
+    def encode_endpoint_inputs(
+        self, endpoint_name: str, values: Iterable
+    ) -> List[bytes]:
         """
-        Encode given values into the expected types of an endpoint
+        Encode given values into the expected types of an endpoint. The values can
+        be any sequence or iterator, such as a generator streaming the values of a
+        variadic input, and are not modified.
 
         :param endpoint_name: name of the endpoint
         :type endpoint_name: str
         :param values: values to encode
-        :type values: List
+        :type values: Iterable
         :return: values encoded as inputs
         :rtype: List[bytes]
         """
-        try:
-            endpoint = self.endpoints[endpoint_name]
-        except KeyError as err:
-            raise errors.UnknownEndpoint(endpoint_name) from err
-        values_copy = deepcopy(values)
-        encoded_inputs = []
-        for endpoint_input in endpoint.inputs:
-            to_encode_type = endpoint_input["type"]
-            is_multi_arg = endpoint_input.get(
-                "multi_arg", False
-            ) and not to_encode_type.startswith("optional")
-            if is_multi_arg:
-                to_encode, values_copy = values_copy, []
-            else:
-                try:
-                    to_encode = values_copy.pop(0)
-                except IndexError:
-                    to_encode = None
-            encoded_input = self.top_encode(to_encode_type, to_encode)
-            if is_multi_arg:
-                if encoded_input is not None:
-                    encoded_inputs.extend(encoded_input)
-            else:
-                if (
-                    not to_encode_type.startswith("optional")
-                    or encoded_input is not None
-                ):
-                    encoded_inputs.append(encoded_input)
-        return encoded_inputs
+        plan = self.get_endpoint_plan(endpoint_name)
+        return codec_plan.encode_values(self, plan.inputs, values)
+
+    def encode_endpoint_inputs_many(
+        self, endpoint_name: str, rows: Iterable[Iterable], data_fields: bool = False
+    ) -> Union[batch_encoding.EncodedRows, List[str]]:
+        """
+        Encode the inputs of many calls of the same endpoint. The endpoint plan is
+        resolved once and all the encoded inputs are written into a single buffer.
+
+        :param endpoint_name: name of the endpoint
+        :type endpoint_name: str
+        :param rows: values of the inputs of each call
+        :type rows: Iterable[Iterable]
+        :param data_fields: if the data field of each call ("endpoint@arg1@arg2...")
+            should be returned instead of the encoded inputs, defaults to False
+        :type data_fields: bool, optional
+        :return: encoded inputs of the calls, with their offsets in the shared
+            buffer, or the data field of each call
+        :rtype: Union[batch_encoding.EncodedRows, List[str]]
+        """
+        encoded_rows = batch_encoding.encode_rows(self, endpoint_name, rows)
+        if data_fields:
+            return encoded_rows.get_data_fields()
+        return encoded_rows
 
     def decode_endpoint_input_data(
-        self, raw_input_data: str
-    ) -> Tuple[str, List[Dict], List[Any]]:
+        self,
+        raw_input_data: Union[str, bytes, bytearray, memoryview],
+        address_format: Optional[str] = None,
+        input_filter: Optional[input_data.InputDataFilter] = None,
+    ) -> Optional[Tuple[str, List[Dict], List[Any]]]:
         """
         Decode the input data of a transaction that calls an endpoint of
-        the smart-contract
+        the smart-contract. The raw bytes of the data field, or a memoryview over a
+        larger buffer, can be given directly to avoid building strings.
 
         :param raw_input_data: full input data (not b64 encoded)
-        :type raw_input_data: str
-        :return: endpoint name, Esdt transfers, list of decoded inputs
-        :rtype: Tuple[str, List[Dict], List[Any]]
-        """
-        data_parts = raw_input_data.split("@")
-        transfers = []
-        decoded_inputs = []
-        if len(data_parts) == 0:
-            return transfers, decoded_inputs
-
-        # first decode if there is any transfer
-        first_function = data_parts.pop(0)  # first function is not serialized
-        if first_function == "ESDTTransfer":
-            transfers.append(
-                {
-                    "identifier": self.top_decode(
-                        "TokenIdentifier", bytes.fromhex(data_parts.pop(0))
-                    ),
-                    "nonce": 0,
-                    "amount": self.top_decode(
-                        "BigUint", bytes.fromhex(data_parts.pop(0))
-                    ),
-                }
-            )
-            endpoint_name = self.top_decode(
-                "utf-8 string", bytes.fromhex(data_parts.pop(0))
-            )
-        elif first_function == "MultiESDTNFTTransfer":
-            first_part = bytes.fromhex(data_parts.pop(0))
-            try:
-                Address.from_hex(first_part.hex(), "erd").bech32()  # receiver
-                n_transfers = self.top_decode("u32", bytes.fromhex(data_parts.pop(0)))
-            except ErrBadPubkeyLength:
-                n_transfers = self.top_decode("u32", first_part)
-
-            for _ in range(n_transfers):
-                transfers.append(
-                    {
-                        "identifier": self.top_decode(
-                            "TokenIdentifier", bytes.fromhex(data_parts.pop(0))
-                        ),
-                        "nonce": self.top_decode(
-                            "u64", bytes.fromhex(data_parts.pop(0))
-                        ),
-                        "amount": self.top_decode(
-                            "BigUint", bytes.fromhex(data_parts.pop(0))
-                        ),
-                    }
-                )
-            endpoint_name = self.top_decode(
-                "utf-8 string", bytes.fromhex(data_parts.pop(0))
-            )
-        elif first_function == "ESDTNFTTransfer":
-            transfers.append(
-                {
-                    "identifier": self.top_decode(
-                        "TokenIdentifier", bytes.fromhex(data_parts.pop(0))
-                    ),
-                    "nonce": self.top_decode("u64", bytes.fromhex(data_parts.pop(0))),
-                    "amount": self.top_decode(
-                        "BigUint", bytes.fromhex(data_parts.pop(0))
-                    ),
-                }
-            )
-            Address.from_hex(
-                bytes.fromhex(data_parts.pop(0)).hex(), "erd"
-            ).bech32()  # receiver
-            endpoint_name = self.top_decode(
-                "utf-8 string", bytes.fromhex(data_parts.pop(0))
-            )
-        else:
-            endpoint_name = first_function
+        :type raw_input_data: Union[str, bytes, bytearray, memoryview]
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
+        :param input_filter: filter checked on the raw data field before decoding
+            it, defaults to None
+        :type input_filter: Optional[input_data.InputDataFilter], optional
+        :return: endpoint name, Esdt transfers, list of decoded inputs, None if the
+            data field does not match the filter
+        :rtype: Optional[Tuple[str, List[Dict], List[Any]]]
+        """
+        if input_filter is not None and not input_filter.matches(raw_input_data):
+            return None
+        if address_format is not None:
+            serializer = self.with_options(address_format=address_format)
+            return serializer.decode_endpoint_input_data(raw_input_data)
+        return input_data.decode_input_data(self, raw_input_data)
 
-        # then decode the inputs
-        try:
-            endpoint = self.endpoints[endpoint_name]
-        except KeyError as err:
-            raise errors.UnknownEndpoint(endpoint_name) from err
+    def encode_endpoint_input_data(
+        self,
+        endpoint_name: str,
+        values: Iterable,
+        transfers: Optional[List[Dict]] = None,
+        receiver: Optional[Any] = None,
+    ) -> str:
+        """
+        Build the input data of a transaction that calls an endpoint of the
+        smart-contract, with optional ESDT transfers. This is the reverse of
+        decode_endpoint_input_data.
+
+        :param endpoint_name: name of the endpoint to call
+        :type endpoint_name: str
+        :param values: values of the inputs of the endpoint
+        :type values: Iterable
+        :param transfers: ESDT transfers, as dictionaries with the keys
+            "identifier", "amount" and optionally "nonce", defaults to None
+        :type transfers: Optional[List[Dict]], optional
+        :param receiver: address of the contract, required to transfer tokens with
+            a nonce or several tokens, defaults to None
+        :type receiver: Optional[Any], optional
+        :return: input data (not b64 encoded)
+        :rtype: str
+        """
+        return input_data.encode_input_data(
+            self, endpoint_name, values, transfers, receiver
+        )
 
-        decoded_inputs = self.decode_io(
-            endpoint.inputs, [bytes.fromhex(e) for e in data_parts]
+    def decode_many_input_data(
+        self,
+        raw_inputs: Iterable[str],
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+        max_pending_chunks: Optional[int] = None,
+        address_format: Optional[str] = None,
+        input_filter: Optional[input_data.InputDataFilter] = None,
+    ) -> Iterator[Optional[Tuple[str, List[Dict], List[Any]]]]:
+        """
+        Decode the input data of many transactions over a pool of processes. The
+        serializer is sent once to each worker and the results are yielded in the
+        order of the inputs. At most max_pending_chunks chunks are in flight at any
+        time, so the inputs can be a lazy iterable of any size.
+
+        :param raw_inputs: full input data of the transactions (not b64 encoded)
+        :type raw_inputs: Iterable[str]
+        :param workers: number of worker processes, defaults to the number of CPUs.
+            With 0, the inputs are decoded in the current process
+        :type workers: Optional[int], optional
+        :param chunk_size: number of inputs sent to a worker at once,
+            defaults to 1000
+        :type chunk_size: int, optional
+        :param max_pending_chunks: maximum number of chunks being decoded or
+            waiting to be yielded, defaults to twice the number of workers
+        :type max_pending_chunks: Optional[int], optional
+        :param address_format: format of the decoded addresses for this call only,
+            defaults to the format of the serializer
+        :type address_format: Optional[str], optional
+        :param input_filter: filter checked on the raw data fields before decoding
+            them, defaults to None
+        :type input_filter: Optional[input_data.InputDataFilter], optional
+        :return: endpoint name, Esdt transfers and decoded inputs of each
+            transaction, None for the transactions that do not match the filter
+        :rtype: Iterator[Optional[Tuple[str, List[Dict], List[Any]]]]
+        """
+        return parallel.decode_many_input_data(
+            self.with_options(address_format=address_format),
+            raw_inputs,
+            workers,
+            chunk_size,
+            max_pending_chunks,
+            input_filter,
         )
-        return endpoint_name, transfers, decoded_inputs
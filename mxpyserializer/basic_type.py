@@ -4,13 +4,20 @@ author: Etienne Wallet
 This module contains the functions to serialize and deserialize basic types
 """
 
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
 import re
-from typing import Tuple, Union
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 
-from multiversx_sdk_core.address import Address
-from multiversx_sdk_core.constants import INTEGER_MAX_NUM_BYTES
+from mxpyserializer import bech32, errors
 
-from mxpyserializer import errors
+if TYPE_CHECKING:
+    from multiversx_sdk_core.address import Address
+
+# byte length used by the SDK to encode unsigned integers (INTEGER_MAX_NUM_BYTES)
+INTEGER_MAX_NUM_BYTES = 64
 
 BASIC_TYPES = (
     "bytes",
@@ -34,6 +41,270 @@ BASIC_TYPES = (
     "utf-8string",
 )
 
+# bytes length and signedness of the fixed size integer types
+INTEGER_TYPES = {
+    "u8": (1, False),
+    "u16": (2, False),
+    "u32": (4, False),
+    "usize": (4, False),
+    "u64": (8, False),
+    "i8": (1, True),
+    "i16": (2, True),
+    "i32": (4, True),
+    "isize": (4, True),
+    "i64": (8, True),
+}
+
+# nested encoding size of the basic types that are not prefixed by their size
+FIXED_SIZES = {
+    **{type_name: specs[0] for type_name, specs in INTEGER_TYPES.items()},
+    "bool": 1,
+    "Address": 32,
+}
+# basic types nested encoded with their size (u32) followed by their content
+SIZE_PREFIXED_TYPES = frozenset(BASIC_TYPES) - FIXED_SIZES.keys()
+
+
+def get_integer_type_specs(type_name: str) -> Optional[Tuple[int, bool]]:
+    """
+    Return the bytes length and the signedness of an integer type, or None if the
+    type is not an integer type
+
+    :param type_name: name of the type
+    :type type_name: str
+    :return: bytes length and signedness of the integer type
+    :rtype: Optional[Tuple[int, bool]]
+    """
+    try:
+        return INTEGER_TYPES[type_name]
+    except KeyError:
+        pass
+    if type_name in BASIC_TYPES:  # basic type that is not an integer
+        return None
+    integer_pattern = re.match(r"^([ui])(\d+)$", type_name.replace("size", "32"))
+    if integer_pattern is None:
+        return None
+    groups = integer_pattern.groups()
+    type_number = int(groups[1])
+    if type_number % 8 != 0:
+        raise ValueError(f"Invalid integer type: {type_number}")
+    return type_number // 8, groups[0] == "i"
+
+
+# maximum number of addresses kept in each direction of the conversion cache
+DEFAULT_ADDRESS_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Statistics of an LRU cache
+    """
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of the lookups that were found in the cache
+
+        :return: hit rate between 0 and 1, 0 if the cache was never used
+        :rtype: float
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+def get_sdk_address_class() -> type:
+    """
+    Import the Address class of the SDK. It is only needed to recognise SDK
+    addresses given as values to encode.
+
+    :return: Address class of multiversx_sdk_core
+    :rtype: type
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from multiversx_sdk_core.address import Address as SdkAddress
+
+    return SdkAddress
+
+
+# cached conversions: "decode" from public key to bech32, "encode" the reverse
+_ADDRESS_CACHES = {
+    "decode": lru_cache(DEFAULT_ADDRESS_CACHE_SIZE)(bech32.pubkey_to_bech32),
+    "encode": lru_cache(DEFAULT_ADDRESS_CACHE_SIZE)(bech32.bech32_to_pubkey),
+}
+
+
+def set_address_cache_size(maxsize: Optional[int]):
+    """
+    Replace the caches of the conversions between public keys and bech32 addresses
+    by empty caches of the given size
+
+    :param maxsize: maximum number of addresses kept in each direction. 0 disables
+        the caches and None removes the size limit
+    :type maxsize: Optional[int]
+    """
+    _ADDRESS_CACHES["decode"] = lru_cache(maxsize)(bech32.pubkey_to_bech32)
+    _ADDRESS_CACHES["encode"] = lru_cache(maxsize)(bech32.bech32_to_pubkey)
+
+
+def clear_address_cache():
+    """
+    Empty the caches of the conversions between public keys and bech32 addresses
+    and reset their statistics
+    """
+    for cached_conversion in _ADDRESS_CACHES.values():
+        cached_conversion.cache_clear()
+
+
+def get_address_cache_stats() -> Dict[str, CacheStats]:
+    """
+    Return the statistics of the caches of the conversions between public keys and
+    bech32 addresses
+
+    :return: statistics of the decoding (pubkey to bech32) and of the encoding
+        (bech32 to pubkey) caches
+    :rtype: Dict[str, CacheStats]
+    """
+    return {
+        direction: CacheStats(*cached_conversion.cache_info())
+        for direction, cached_conversion in _ADDRESS_CACHES.items()
+    }
+
+
+def decode_address(pubkey: bytes) -> str:
+    """
+    Convert the public key of an address into its bech32 representation. The most
+    recent conversions are cached.
+
+    :param pubkey: public key of the address (32 bytes)
+    :type pubkey: bytes
+    :return: bech32 address
+    :rtype: str
+    """
+    return _ADDRESS_CACHES["decode"](pubkey)
+
+
+class LazyAddress:
+    """
+    Lightweight address holding only the public key. The bech32 representation is
+    computed on first request.
+    """
+
+    __slots__ = ("pubkey", "_bech32")
+
+    def __init__(self, pubkey: bytes):
+        self.pubkey = pubkey
+        self._bech32 = None
+
+    def bech32(self) -> str:
+        """
+        Return the bech32 representation of the address
+
+        :return: bech32 address
+        :rtype: str
+        """
+        if self._bech32 is None:
+            self._bech32 = decode_address(self.pubkey)
+        return self._bech32
+
+    def hex(self) -> str:
+        """
+        Return the hex representation of the public key
+
+        :return: hex public key
+        :rtype: str
+        """
+        return self.pubkey.hex()
+
+    def __bytes__(self) -> bytes:
+        return self.pubkey
+
+    def __str__(self) -> str:
+        return self.bech32()
+
+    def __repr__(self) -> str:
+        return f"LazyAddress({self.pubkey.hex()})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyAddress):
+            return self.pubkey == other.pubkey
+        if isinstance(other, bytes):
+            return self.pubkey == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.pubkey)
+
+
+def check_pubkey(pubkey: bytes) -> bytes:
+    """
+    Check that a public key has the length of an address
+
+    :param pubkey: public key to check
+    :type pubkey: bytes
+    :return: checked public key
+    :rtype: bytes
+    """
+    bech32.check_pubkey_length(pubkey)
+    return pubkey
+
+
+# conversions of a public key into each address output format
+ADDRESS_FORMATS = {
+    "bech32": decode_address,
+    "bytes": check_pubkey,
+    "hex": lambda pubkey: check_pubkey(pubkey).hex(),
+    "lazy": lambda pubkey: LazyAddress(check_pubkey(pubkey)),
+}
+
+
+def get_address_converter(address_format: str) -> Callable[[bytes], Any]:
+    """
+    Return the function converting a public key into the given address format
+
+    :param address_format: one of "bech32", "bytes", "hex" or "lazy"
+    :type address_format: str
+    :return: conversion function
+    :rtype: Callable[[bytes], Any]
+    """
+    try:
+        return ADDRESS_FORMATS[address_format]
+    except KeyError as err:
+        raise errors.UnknownAddressFormat(address_format) from err
+
+
+def encode_address(address: Union[str, bytes, Address, LazyAddress]) -> bytes:
+    """
+    Convert an address into its public key. The most recent conversions of bech32
+    addresses are cached.
+
+    :param address: bech32 address, hex or raw public key, Address or LazyAddress
+    :type address: Union[str, bytes, Address, LazyAddress]
+    :return: public key of the address (32 bytes)
+    :rtype: bytes
+    """
+    if isinstance(address, str):
+        if len(address) == 64:  # hex public key, a bech32 address is shorter
+            return bytes.fromhex(address)
+        return _ADDRESS_CACHES["encode"](address)
+    if isinstance(address, (bytes, bytearray, memoryview)):
+        return check_pubkey(bytes(address))
+    if isinstance(address, LazyAddress):
+        return address.pubkey
+    # an SDK Address can only exist if the SDK was already imported
+    if "multiversx_sdk_core.address" in sys.modules and isinstance(
+        address, get_sdk_address_class()
+    ):
+        return address.get_public_key()
+    raise ValueError(
+        f"Address type expected an Adress or a bech32 strin but got {address}"
+    )
+
 
 def get_bytes_element_from_size(data: bytes) -> Tuple[bytes, bytes]:
     """
@@ -50,6 +321,25 @@ def get_bytes_element_from_size(data: bytes) -> Tuple[bytes, bytes]:
     return data[:element_size], data[element_size:]
 
 
+def get_bytes_element_at(data: memoryview, offset: int) -> Tuple[memoryview, int]:
+    """
+    Extract an element from the data by assuming that the element starts at
+    the given offset with its encoded size (usize).
+    (data[offset:] = <size><element><left_over>)
+    The element is returned as a view on the data, no bytes are copied.
+
+    :param data: data to extract a part from
+    :type data: memoryview
+    :param offset: position of the element in the data
+    :type offset: int
+    :return: view on the extracted part and the offset of the left over part
+    :rtype: Tuple[memoryview, int]
+    """
+    element_size, offset = nested_decode_integer_at(data, offset, 4, False)
+    end = offset + element_size
+    return data[offset:end], end
+
+
 def nested_decode_integer(
     data: bytes, type_bytes_length: int, signed: bool
 ) -> Tuple[int, bytes]:
@@ -78,6 +368,34 @@ def nested_decode_integer(
     )
 
 
+def nested_decode_integer_at(
+    data: memoryview, offset: int, type_bytes_length: int, signed: bool
+) -> Tuple[int, int]:
+    """
+    Decodes a part of the input data into an integer value assuming big endian
+    and nested-encoded format, starting at the given offset.
+    Returns the offset of the left over.
+
+    :param data: data to decode
+    :type data: memoryview
+    :param offset: position of the integer in the data
+    :type offset: int
+    :param type_bytes_length: bytes length of the wanted result type
+    :type type_bytes_length: int
+    :param signed: if the encoded data is signed or not
+    :type signed: bool
+    :return: decoded value and the offset following it
+    :rtype: Tuple[int, int]
+    """
+    end = offset + type_bytes_length
+    if len(data) < end:
+        raise ValueError(
+            f"Not enough data to decode {bytes(data[offset:])} into an integer "
+            f"of length {type_bytes_length}"
+        )
+    return int.from_bytes(data[offset:end], byteorder="big", signed=signed), end
+
+
 def nested_encode_integer(value: int, type_bytes_length: int, signed: bool) -> bytes:
     """
     Encode an integer in a nested encoded format
@@ -111,15 +429,15 @@ def top_encode_integer(value: int, signed: bool) -> bytes:
     """
     if not signed and value < 0:
         raise ValueError("Can not encode a negative number as an unsigned integer")
+    # numpy integers, as decoded in numpy mode, have no bit_length
+    value = int(value)
     if signed:
         byte_length = (value.bit_length() + 8) // 8
     else:
         byte_length = INTEGER_MAX_NUM_BYTES
 
-    return (
-        int(value)
-        .to_bytes(byte_length, byteorder="big", signed=signed)
-        .lstrip(bytes([0]))
+    return value.to_bytes(byte_length, byteorder="big", signed=signed).lstrip(
+        bytes([0])
     )
 
 
@@ -137,35 +455,51 @@ def nested_decode_basic(
     :return: decoded value and the left over bytes
     :rtype: Tuple[Union[int, str, bool], bytes]
     """
+    value, offset = nested_decode_basic_at(type_name, memoryview(data), 0)
+    return value, data[offset:]
+
+
+def nested_decode_basic_at(
+    type_name: str, data: memoryview, offset: int
+) -> Tuple[Union[int, str, bool, bytes], int]:
+    """
+    Decodes a part of the input data into a basic type assuming a nested-encoded
+    format, starting at the given offset. Only the decoded value is materialized,
+    the data itself is never copied.
+    Returns the offset of the left over.
+
+    :param type_name: name of the type of the value to extract from the data
+    :type type_name: str
+    :param data: data containing the value to extract
+    :type data: memoryview
+    :param offset: position of the value in the data
+    :type offset: int
+    :return: decoded value and the offset following it
+    :rtype: Tuple[Union[int, str, bool, bytes], int]
+    """
+    integer_specs = INTEGER_TYPES.get(type_name)
+    if integer_specs is not None:
+        return nested_decode_integer_at(data, offset, *integer_specs)
+
     if type_name == "bytes":
-        element, data = get_bytes_element_from_size(data)
-        return element, data
+        element, offset = get_bytes_element_at(data, offset)
+        return bytes(element), offset
     if type_name == "bool":
-        value, data = nested_decode_basic("u8", data)
+        value, offset = nested_decode_integer_at(data, offset, 1, False)
         if value not in (0, 1):
             raise ValueError(f"Expected a boolean but found the value {value}")
-        return bool(value), data
-
-    integer_pattern = re.match(r"^([ui])(\d+)$", type_name.replace("size", "32"))
-    if integer_pattern is not None:
-        groups = integer_pattern.groups()
-        signed = groups[0] == "i"
-        type_number = int(groups[1])
-        if type_number % 8 != 0:
-            raise ValueError(f"Invalid integer type: {type_number}")
-        type_bytes_length = type_number // 8
-        return nested_decode_integer(data, type_bytes_length, signed)
+        return bool(value), offset
 
     if type_name == "BigUint":
-        element, data = get_bytes_element_from_size(data)
-        return int.from_bytes(element, byteorder="big"), data
+        element, offset = get_bytes_element_at(data, offset)
+        return int.from_bytes(element, byteorder="big"), offset
     if type_name == "BigInt":
-        element, data = get_bytes_element_from_size(data)
-        return int.from_bytes(element, byteorder="big", signed=True), data
+        element, offset = get_bytes_element_at(data, offset)
+        return int.from_bytes(element, byteorder="big", signed=True), offset
 
     if type_name == "Address":
-        hex_address, data = data[:32].hex(), data[32:]
-        return Address.from_hex(hex_address, "erd").bech32(), data
+        end = offset + 32
+        return decode_address(bytes(data[offset:end])), end
 
     if type_name in (
         "TokenIdentifier",
@@ -173,12 +507,85 @@ def nested_decode_basic(
         "utf-8 string",
         "utf-8string",
     ):
-        element, data = get_bytes_element_from_size(data)
-        return element.decode("utf-8"), data
+        element, offset = get_bytes_element_at(data, offset)
+        return str(element, "utf-8"), offset
+
+    integer_specs = get_integer_type_specs(type_name)
+    if integer_specs is not None:
+        return nested_decode_integer_at(data, offset, *integer_specs)
 
     raise errors.UnknownType(type_name)
 
 
+def check_skipped_size(
+    type_name: str, data: memoryview, offset: int, value_size: int
+) -> int:
+    """
+    Check that the data holds a value of the given size at the given offset
+
+    :param type_name: name of the type of the value to skip
+    :type type_name: str
+    :param data: data containing the value to skip
+    :type data: memoryview
+    :param offset: position of the value in the data
+    :type offset: int
+    :param value_size: encoded size of the value
+    :type value_size: int
+    :return: offset following the value
+    :rtype: int
+    """
+    end = offset + value_size
+    if len(data) < end:
+        raise ValueError(
+            f"Not enough data to skip a value of type {type_name}: expected "
+            f"{value_size} bytes but got {len(data) - offset}"
+        )
+    return end
+
+
+def get_fixed_size(type_name: str) -> Optional[int]:
+    """
+    Return the nested encoding size of a basic type, or None if the values of the
+    type are prefixed by their size
+
+    :param type_name: name of the basic type
+    :type type_name: str
+    :return: size of the encoded values
+    :rtype: Optional[int]
+    """
+    value_size = FIXED_SIZES.get(type_name)
+    if value_size is None and type_name not in SIZE_PREFIXED_TYPES:
+        integer_specs = get_integer_type_specs(type_name)
+        if integer_specs is None:
+            raise errors.UnknownType(type_name)
+        value_size = integer_specs[0]
+    return value_size
+
+
+def nested_skip_basic_at(type_name: str, data: memoryview, offset: int) -> int:
+    """
+    Return the offset following a nested encoded basic value, without decoding
+    the value: fixed size values are jumped over and only the size prefix of the
+    other values is read.
+
+    :param type_name: name of the type of the value to skip
+    :type type_name: str
+    :param data: data containing the value to skip
+    :type data: memoryview
+    :param offset: position of the value in the data
+    :type offset: int
+    :return: offset following the value
+    :rtype: int
+    """
+    value_size = FIXED_SIZES.get(type_name)
+    if value_size is None:
+        if type_name in SIZE_PREFIXED_TYPES:
+            value_size, offset = nested_decode_integer_at(data, offset, 4, False)
+        else:
+            value_size = get_fixed_size(type_name)
+    return check_skipped_size(type_name, data, offset, value_size)
+
+
 def top_decode_basic(type_name: str, data: bytes) -> Union[int, str, bool, Address]:
     """
     Decodes the input data into a basic type assuming a top-encoded
@@ -189,12 +596,12 @@ def top_decode_basic(type_name: str, data: bytes) -> Union[int, str, bool, Addre
     :param type_name: name of the type of the value to extract from the data
     :type type_name: str
     :param data: data containing the value to extract
-    :type data: bytes
+    :type data: bytes-like object (bytes, bytearray, memoryview, ...)
     :return: decoded value
     :rtype: Union[int, str, bool]
     """
     if type_name == "bytes":
-        return data
+        return bytes(data)
     if type_name == "bool":
         value = int.from_bytes(data, byteorder="big")
         if value not in (0, 1):
@@ -208,7 +615,7 @@ def top_decode_basic(type_name: str, data: bytes) -> Union[int, str, bool, Addre
         return int.from_bytes(data, byteorder="big", signed=True)
 
     if type_name == "Address":
-        return Address.from_hex(data.hex(), "erd").bech32()
+        return decode_address(bytes(data))
 
     if type_name in (
         "TokenIdentifier",
@@ -216,7 +623,7 @@ def top_decode_basic(type_name: str, data: bytes) -> Union[int, str, bool, Addre
         "utf-8 string",
         "utf-8string",
     ):
-        return data.decode("utf-8")
+        return str(data, "utf-8")
 
     raise errors.UnknownType(type_name)
 
@@ -234,56 +641,66 @@ def nested_encode_basic(
     :return: encoded value
     :rtype: bytes
     """
-    if type_name == "bytes":
-        encoded_value = top_encode_basic("bytes", value)
-        encoded_size = nested_encode_basic("u32", len(encoded_value))
-        return encoded_size + encoded_value
-    if type_name == "bool":
-        int_value = int(value)
-        if int_value not in (0, 1):
-            raise ValueError(f"Expected a boolean but found the value {value}")
-        return nested_encode_basic("u8", int_value)
+    buffer = bytearray()
+    nested_encode_basic_into(type_name, value, buffer)
+    return bytes(buffer)
 
-    integer_pattern = re.match(r"^([ui])(\d+)$", type_name.replace("size", "32"))
-    if integer_pattern is not None:
-        groups = integer_pattern.groups()
-        signed = groups[0] == "i"
-        type_number = int(groups[1])
-        if type_number % 8 != 0:
-            raise ValueError(f"Invalid integer type: {type_number}")
-        type_bytes_length = type_number // 8
-        return nested_encode_integer(value, type_bytes_length, signed)
 
-    if type_name == "BigUint":
-        encoded_value = top_encode_integer(value, False)
-        encoded_size = nested_encode_basic("u32", len(encoded_value))
-        return encoded_size + encoded_value
+def write_sized_element(element: bytes, buffer: bytearray):
+    """
+    Append an element to the buffer, prefixed by its encoded size (usize)
 
-    if type_name == "BigInt":
-        encoded_value = top_encode_integer(value, True)
-        encoded_size = nested_encode_basic("u32", len(encoded_value))
-        return encoded_size + encoded_value
+    :param element: element to write
+    :type element: bytes
+    :param buffer: buffer to append the element to
+    :type buffer: bytearray
+    """
+    buffer += len(element).to_bytes(4, byteorder="big")
+    buffer += element
 
-    if type_name == "Address":
-        if isinstance(value, Address):
-            return bytes.fromhex(value.to_hex())
-        if isinstance(value, str):
-            return bytes.fromhex(Address.from_bech32(value).to_hex())
-        raise ValueError(
-            f"Address type expected an Adress or a bech32 string but got {value}"
-        )
 
-    if type_name in (
+def nested_encode_basic_into(
+    type_name: str, value: Union[int, str, bool, Address, bytes], buffer: bytearray
+):
+    """
+    Encode a basic data under its nested encoded format and append it to the
+    given buffer
+
+    :param type_name: name of the target encoded type for the value
+    :type type_name: str
+    :param value: value to encode
+    :type value: Union[int, str, bool, Address, bytes]
+    :param buffer: buffer to append the encoded value to
+    :type buffer: bytearray
+    """
+    integer_specs = INTEGER_TYPES.get(type_name)
+    if integer_specs is not None:
+        buffer += nested_encode_integer(value, *integer_specs)
+    elif type_name == "bool":
+        int_value = int(value)
+        if int_value not in (0, 1):
+            raise ValueError(f"Expected a boolean but found the value {value}")
+        buffer.append(int_value)
+    elif type_name == "BigUint":
+        write_sized_element(top_encode_integer(value, False), buffer)
+    elif type_name == "BigInt":
+        write_sized_element(top_encode_integer(value, True), buffer)
+    elif type_name == "Address":
+        buffer += encode_address(value)
+    elif type_name in (
         "TokenIdentifier",
         "EgldOrEsdtTokenIdentifier",
         "utf-8 string",
         "utf-8string",
     ):
-        encoded_value = str(value).encode("utf-8")
-        encoded_size = nested_encode_basic("u32", len(encoded_value))
-        return encoded_size + encoded_value
-
-    raise errors.UnknownType(type_name)
+        write_sized_element(str(value).encode("utf-8"), buffer)
+    elif type_name == "bytes":
+        write_sized_element(top_encode_basic("bytes", value), buffer)
+    else:
+        integer_specs = get_integer_type_specs(type_name)
+        if integer_specs is None:
+            raise errors.UnknownType(type_name)
+        buffer += nested_encode_integer(value, *integer_specs)
 
 
 def top_encode_basic(type_name: str, value: Union[int, str, bool, Address]) -> bytes:
@@ -300,6 +717,8 @@ def top_encode_basic(type_name: str, value: Union[int, str, bool, Address]) -> b
     if type_name == "bytes":
         if isinstance(value, bytes):
             return value
+        if isinstance(value, (bytearray, memoryview)):
+            return bytes(value)
         if isinstance(value, int):
             return top_encode_basic("u8", value)
         if isinstance(value, list):
@@ -320,13 +739,7 @@ def top_encode_basic(type_name: str, value: Union[int, str, bool, Address]) -> b
         return top_encode_integer(value, True)
 
     if type_name == "Address":
-        if isinstance(value, Address):
-            return bytes.fromhex(value.to_hex())
-        if isinstance(value, str):
-            return bytes.fromhex(Address.from_bech32(value).to_hex())
-        raise ValueError(
-            f"Address type expected an Adress or a bech32 strin but got {value}"
-        )
+        return encode_address(value)
 
     if type_name in (
         "TokenIdentifier",
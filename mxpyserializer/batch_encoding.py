@@ -0,0 +1,95 @@
+"""
+author: Etienne Wallet
+
+This module contains the batch encoding of the inputs of an endpoint: the inputs of
+many calls are encoded with a single resolution of the endpoint plan and written
+into one shared buffer. The parts of each call are located by their offsets.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, List
+
+from mxpyserializer import codec_plan
+
+if TYPE_CHECKING:
+    from mxpyserializer.abi_serializer import AbiSerializer
+
+
+@dataclass(frozen=True)
+class EncodedRows:
+    """
+    Encoded inputs of many calls of an endpoint, stored in a single buffer.
+    The part j of the buffer spans from part_offsets[j] to part_offsets[j + 1] and
+    the parts of the row i are the parts row_offsets[i] to row_offsets[i + 1] - 1.
+    """
+
+    endpoint_name: str
+    buffer: bytes
+    part_offsets: List[int]
+    row_offsets: List[int]
+
+    def __len__(self) -> int:
+        return len(self.row_offsets) - 1
+
+    def get_parts(self, row_index: int) -> List[memoryview]:
+        """
+        Return the encoded inputs of a call, as views over the shared buffer
+
+        :param row_index: index of the call
+        :type row_index: int
+        :return: encoded inputs of the call
+        :rtype: List[memoryview]
+        """
+        view = memoryview(self.buffer)
+        offsets = self.part_offsets
+        return [
+            view[offsets[j] : offsets[j + 1]]
+            for j in range(self.row_offsets[row_index], self.row_offsets[row_index + 1])
+        ]
+
+    def get_data_fields(self) -> List[str]:
+        """
+        Return the data fields of all the calls ("endpoint@arg1@arg2..."). The
+        buffer is converted to hex once and each argument is a slice of it.
+
+        :return: data field of each call
+        :rtype: List[str]
+        """
+        hex_buffer = self.buffer.hex()
+        hex_offsets = [2 * offset for offset in self.part_offsets]
+        hex_parts = [
+            hex_buffer[start:end] for start, end in zip(hex_offsets, hex_offsets[1:])
+        ]
+        row_offsets = self.row_offsets
+        prefix = self.endpoint_name + "@"
+        return [
+            prefix + "@".join(hex_parts[start:end]) if start < end else prefix[:-1]
+            for start, end in zip(row_offsets, row_offsets[1:])
+        ]
+
+
+def encode_rows(
+    serializer: AbiSerializer, endpoint_name: str, rows: Iterable[Iterable]
+) -> EncodedRows:
+    """
+    Encode the inputs of many calls of an endpoint into a single buffer
+
+    :param serializer: serializer holding the custom types definitions
+    :type serializer: AbiSerializer
+    :param endpoint_name: name of the endpoint
+    :type endpoint_name: str
+    :param rows: values of the inputs of each call
+    :type rows: Iterable[Iterable]
+    :return: encoded inputs of the calls
+    :rtype: EncodedRows
+    """
+    inputs = serializer.get_endpoint_plan(endpoint_name).inputs
+    encode_values_into = codec_plan.encode_values_into
+    buffer = bytearray()
+    part_offsets = [0]
+    row_offsets = [0]
+    for row in rows:
+        encode_values_into(serializer, inputs, row, buffer, part_offsets)
+        row_offsets.append(len(part_offsets) - 1)
+    return EncodedRows(endpoint_name, bytes(buffer), part_offsets, row_offsets)
@@ -0,0 +1,247 @@
+"""
+author: Etienne Wallet
+
+This module contains a bech32 codec specialized for the addresses of the chain: the
+human readable part is always "erd" and the payload is always a 32 bytes public key.
+With a fixed payload size, the checksum is an affine function of the payload bytes:
+it is computed with one table lookup per byte instead of running the generic
+polynomial over each character. The tables are built on first use.
+"""
+
+from functools import lru_cache
+import re
+from typing import Any, Iterable, List, Tuple
+
+from mxpyserializer import errors
+
+HRP = "erd"
+PUBKEY_LENGTH = 32
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+# 256 bits of payload padded to 52 characters of 5 bits, then 6 checksum characters
+N_DATA_CHARS = 52
+N_CHECKSUM_CHARS = 6
+ADDRESS_LENGTH = len(HRP) + 1 + N_DATA_CHARS + N_CHECKSUM_CHARS
+GENERATORS = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+ADDRESS_PATTERN = re.compile(f"{HRP}1[{CHARSET}]{{{N_DATA_CHARS + N_CHECKSUM_CHARS}}}")
+# bech32 characters to base 32 digits, so that int() parses the data part at once
+TO_BASE32_DIGITS = str.maketrans(CHARSET, "0123456789abcdefghijklmnopqrstuv")
+# pairs of characters for each 10 bits value
+CHARACTER_PAIRS = tuple(a + b for a in CHARSET for b in CHARSET)
+
+
+def polymod_step(checksum: int, value: int) -> int:
+    """
+    Feed one 5 bits value to the bech32 checksum polynomial
+
+    :param checksum: current state of the checksum
+    :type checksum: int
+    :param value: 5 bits value
+    :type value: int
+    :return: next state of the checksum
+    :rtype: int
+    """
+    top = checksum >> 25
+    checksum = ((checksum & 0x1FFFFFF) << 5) ^ value
+    for i, generator in enumerate(GENERATORS):
+        if (top >> i) & 1:
+            checksum ^= generator
+    return checksum
+
+
+@lru_cache(maxsize=None)
+def get_checksum_tables() -> Tuple[int, Tuple[Tuple[int, ...], ...]]:
+    """
+    Build the checksum of the null public key and the contribution of each byte
+    value at each position of the public key. As the checksum polynomial is linear,
+    the checksum of a public key is the null checksum xored with the contributions
+    of its bytes.
+
+    :return: checksum of the null public key and contributions by byte position
+    :rtype: Tuple[int, Tuple[Tuple[int, ...], ...]]
+    """
+    base = 1
+    for value in [ord(c) >> 5 for c in HRP] + [0] + [ord(c) & 31 for c in HRP]:
+        base = polymod_step(base, value)
+    for _ in range(N_DATA_CHARS + N_CHECKSUM_CHARS):
+        base = polymod_step(base, 0)
+    base ^= 1
+
+    # contribution of each bit of a data character, from the last character
+    char_contributions = []
+    contributions = []
+    for bit in range(5):
+        contribution = 1 << bit
+        for _ in range(N_CHECKSUM_CHARS):
+            contribution = polymod_step(contribution, 0)
+        contributions.append(contribution)
+    char_contributions.append(contributions)
+    for _ in range(N_DATA_CHARS - 1):
+        contributions = [polymod_step(c, 0) for c in contributions]
+        char_contributions.append(contributions)
+    char_contributions.reverse()
+
+    # contribution of each byte value, by position in the public key
+    tables = []
+    for position in range(PUBKEY_LENGTH):
+        bit_contributions = []
+        for bit in range(8):  # from the least significant bit
+            stream_index = 8 * position + 7 - bit
+            char_index, char_bit = divmod(stream_index, 5)
+            bit_contributions.append(char_contributions[char_index][4 - char_bit])
+        table = [0] * 256
+        for byte_value in range(1, 256):
+            lowest_bit = (byte_value & -byte_value).bit_length() - 1
+            table[byte_value] = (
+                table[byte_value & (byte_value - 1)] ^ bit_contributions[lowest_bit]
+            )
+        tables.append(tuple(table))
+    return base, tuple(tables)
+
+
+def compute_checksum(pubkey: bytes) -> int:
+    """
+    Compute the bech32 checksum of a public key
+
+    :param pubkey: public key of 32 bytes
+    :type pubkey: bytes
+    :return: checksum as a 30 bits integer
+    :rtype: int
+    """
+    checksum, tables = get_checksum_tables()
+    for table, byte_value in zip(tables, pubkey):
+        checksum ^= table[byte_value]
+    return checksum
+
+
+def check_pubkey_length(pubkey: bytes):
+    """
+    Check that a public key has the length of an address
+
+    :param pubkey: public key to check
+    :type pubkey: bytes
+    """
+    if len(pubkey) != PUBKEY_LENGTH:
+        raise ValueError(
+            f"Expected a public key of {PUBKEY_LENGTH} bytes but got {len(pubkey)}"
+        )
+
+
+def pubkey_to_bech32(pubkey: bytes) -> str:
+    """
+    Encode a public key into an erd bech32 address
+
+    :param pubkey: public key of 32 bytes
+    :type pubkey: bytes
+    :return: bech32 address
+    :rtype: str
+    """
+    check_pubkey_length(pubkey)
+    # 26 pairs of characters: the 256 bits and 4 bits of padding, then 3 pairs
+    # for the 30 bits of checksum
+    value = (int.from_bytes(pubkey, "big") << 34) | compute_checksum(pubkey)
+    return (
+        HRP
+        + "1"
+        + "".join(
+            CHARACTER_PAIRS[(value >> shift) & 1023] for shift in range(280, -10, -10)
+        )
+    )
+
+
+def bech32_to_pubkey(address: str) -> bytes:
+    """
+    Decode an erd bech32 address into its public key
+
+    :param address: bech32 address
+    :type address: str
+    :return: public key of 32 bytes
+    :rtype: bytes
+    """
+    if address.isupper():
+        address = address.lower()
+    if ADDRESS_PATTERN.fullmatch(address) is None:
+        raise errors.BadBech32Address(address)
+    value = int(address[len(HRP) + 1 :].translate(TO_BASE32_DIGITS), 32)
+    if (value >> 30) & 15:  # padding bits
+        raise errors.BadBech32Address(address)
+    pubkey = (value >> 34).to_bytes(PUBKEY_LENGTH, "big")
+    if compute_checksum(pubkey) != value & 0x3FFFFFFF:
+        raise errors.BadBech32Address(address)
+    return pubkey
+
+
+def pubkeys_to_bech32(pubkeys: Any) -> List[str]:
+    """
+    Encode many public keys into erd bech32 addresses. A NumPy array of shape
+    (n, 32) and dtype uint8 is encoded with vectorized operations, other iterables
+    are encoded one public key at a time.
+
+    :param pubkeys: public keys of 32 bytes or array of shape (n, 32)
+    :type pubkeys: Union[Iterable[bytes], np.ndarray]
+    :return: bech32 addresses
+    :rtype: List[str]
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from mxpyserializer import numpy_codec
+
+    if numpy_codec.is_ndarray(pubkeys):
+        return _encode_pubkeys_array(pubkeys)
+    return [pubkey_to_bech32(bytes(pubkey)) for pubkey in pubkeys]
+
+
+def bech32_to_pubkeys(addresses: Iterable[str]) -> List[bytes]:
+    """
+    Decode many erd bech32 addresses into their public keys
+
+    :param addresses: bech32 addresses
+    :type addresses: Iterable[str]
+    :return: public keys of 32 bytes
+    :rtype: List[bytes]
+    """
+    return [bech32_to_pubkey(address) for address in addresses]
+
+
+def _encode_pubkeys_array(pubkeys: Any) -> List[str]:
+    # pylint: disable-next=import-outside-toplevel
+    from mxpyserializer.numpy_codec import require_numpy
+
+    numpy = require_numpy("the batch bech32 encoding of arrays")
+    if pubkeys.ndim != 2 or pubkeys.shape[1] != PUBKEY_LENGTH:
+        raise ValueError(
+            f"Expected an array of shape (n, {PUBKEY_LENGTH}) but got {pubkeys.shape}"
+        )
+    pubkeys = pubkeys.astype(numpy.uint8, copy=False)
+    n_pubkeys = pubkeys.shape[0]
+    base, tables = get_checksum_tables()
+
+    checksums = numpy.full(n_pubkeys, base, dtype=numpy.uint32)
+    tables_array = numpy.array(tables, dtype=numpy.uint32)
+    for position in range(PUBKEY_LENGTH):
+        checksums ^= tables_array[position][pubkeys[:, position]]
+
+    # 5 bits groups of the public keys with their padding, then of the checksums
+    bits = numpy.unpackbits(pubkeys, axis=1)
+    bits = numpy.concatenate([bits, numpy.zeros((n_pubkeys, 4), numpy.uint8)], 1)
+    weights = numpy.array([16, 8, 4, 2, 1], dtype=numpy.uint8)
+    data_groups = (bits.reshape(n_pubkeys, N_DATA_CHARS, 5) * weights).sum(
+        axis=2, dtype=numpy.uint8
+    )
+    shifts = numpy.arange(5 * (N_CHECKSUM_CHARS - 1), -5, -5, dtype=numpy.uint32)
+    checksum_groups = ((checksums[:, None] >> shifts) & 31).astype(numpy.uint8)
+
+    charset = numpy.frombuffer(CHARSET.encode(), dtype=numpy.uint8)
+    prefix = numpy.frombuffer(f"{HRP}1".encode(), dtype=numpy.uint8)
+    characters = numpy.concatenate(
+        [
+            numpy.broadcast_to(prefix, (n_pubkeys, len(prefix))),
+            charset[data_groups],
+            charset[checksum_groups],
+        ],
+        axis=1,
+    )
+    text = characters.tobytes().decode("ascii")
+    return [
+        text[i : i + ADDRESS_LENGTH]
+        for i in range(0, n_pubkeys * ADDRESS_LENGTH, ADDRESS_LENGTH)
+    ]
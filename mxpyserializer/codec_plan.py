@@ -0,0 +1,361 @@
+"""
+author: Etienne Wallet
+
+This module contains the codec plans of the endpoints: for each input or output of
+an endpoint, the decoder and encoder to use are resolved once, along with the
+variadic and optional handling, so that they can be executed directly at each call.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from mxpyserializer import errors, numpy_codec
+from mxpyserializer.data_models import AbiEndpoint, AbiIO
+from mxpyserializer.type_tree import (
+    ListTypeNode,
+    OptionalTypeNode,
+    TypeNode,
+    VariadicTypeNode,
+)
+
+if TYPE_CHECKING:
+    from mxpyserializer.abi_serializer import AbiSerializer
+
+
+@dataclass(frozen=True)
+class IOPlan:
+    """
+    Resolved codec of an input or an output of an endpoint
+    """
+
+    type_name: str
+    is_multi: bool
+    is_optional: bool
+    # variadic values can be encoded from an iterator, without building a list
+    is_variadic: bool
+    # List values are yielded as lazy iterators by the streaming decoding
+    is_list: bool
+    decode: Callable[[AbiSerializer, Union[List[bytes], bytes]], Any]
+    # decodes the elements of List and variadic values one by one, for the streaming
+    # decoding
+    iter_decode: Callable[[AbiSerializer, Iterable[bytes]], Iterator[Any]]
+    encode: Callable[[AbiSerializer, Any], Union[bytes, List[bytes], None]]
+    # appends single part values to a buffer, for the batch encoding
+    encode_into: Callable[[AbiSerializer, Any, bytearray], None]
+
+
+@dataclass(frozen=True)
+class EndpointPlan:
+    """
+    Resolved codecs of the inputs and the outputs of an endpoint
+    """
+
+    name: str
+    inputs: Tuple[IOPlan, ...]
+    outputs: Tuple[IOPlan, ...]
+
+
+def build_io_plan(
+    io_list: Sequence[AbiIO], get_type_node: Callable[[str], TypeNode]
+) -> Tuple[IOPlan, ...]:
+    """
+    Resolve the codecs of a list of inputs or outputs types definitions
+
+    :param io_list: ordered list of types definitions
+    :type io_list: Sequence[AbiIO]
+    :param get_type_node: function returning the type tree of a type name
+    :type get_type_node: Callable[[str], TypeNode]
+    :return: resolved codecs, in the same order
+    :rtype: Tuple[IOPlan, ...]
+    """
+    io_plan = []
+    for io_element in io_list:
+        node = get_type_node(io_element.type)
+        is_optional = isinstance(node, OptionalTypeNode)
+        is_multi = io_element.is_multi and not is_optional
+        io_plan.append(
+            IOPlan(
+                type_name=node.name,
+                is_multi=is_multi,
+                is_optional=is_optional,
+                is_variadic=isinstance(node, VariadicTypeNode),
+                is_list=isinstance(node, ListTypeNode) and not is_multi,
+                decode=node.top_decode,
+                iter_decode=node.iter_top_decode,
+                encode=node.top_encode,
+                encode_into=node.top_encode_into,
+            )
+        )
+    return tuple(io_plan)
+
+
+def build_endpoint_plan(
+    endpoint: AbiEndpoint, get_type_node: Callable[[str], TypeNode]
+) -> EndpointPlan:
+    """
+    Resolve the codecs of the inputs and the outputs of an endpoint
+
+    :param endpoint: endpoint to resolve
+    :type endpoint: AbiEndpoint
+    :param get_type_node: function returning the type tree of a type name
+    :type get_type_node: Callable[[str], TypeNode]
+    :return: plan of the endpoint
+    :rtype: EndpointPlan
+    """
+    return EndpointPlan(
+        name=endpoint.name,
+        inputs=build_io_plan(endpoint.inputs, get_type_node),
+        outputs=build_io_plan(endpoint.outputs, get_type_node),
+    )
+
+
+class MultiValueReader:
+    """
+    Cursor over the top encoded parts of a multi-valued data (query results,
+    arguments of a transaction). Parts are read by index: reading is done in
+    constant time and the given parts are never modified.
+    """
+
+    __slots__ = ("parts", "position")
+
+    def __init__(self, parts: Sequence[Any], position: int = 0):
+        self.parts = parts
+        self.position = position
+
+    def has_next(self) -> bool:
+        """
+        Check if some parts are left to read
+
+        :return: True if at least one part is left
+        :rtype: bool
+        """
+        return self.position < len(self.parts)
+
+    def read(self) -> Any:
+        """
+        Read the next part
+
+        :return: next part
+        :rtype: Any
+        """
+        try:
+            part = self.parts[self.position]
+        except IndexError as err:
+            raise IndexError(
+                f"Expected at least {self.position + 1} parts but got {len(self.parts)}"
+            ) from err
+        self.position += 1
+        return part
+
+    def read_remaining(self) -> List[Any]:
+        """
+        Read all the parts left
+
+        :return: parts left, as a new list
+        :rtype: List[Any]
+        """
+        remaining = list(self.parts[self.position :])
+        self.position = len(self.parts)
+        return remaining
+
+    def iter_remaining(self) -> Iterator[Any]:
+        """
+        Read all the parts left, without copying them in a new list
+
+        :return: iterator over the parts left
+        :rtype: Iterator[Any]
+        """
+        remaining = islice(self.parts, self.position, None)
+        self.position = len(self.parts)
+        return remaining
+
+
+def decode_parts(
+    serializer: AbiSerializer,
+    io_plan: Tuple[IOPlan, ...],
+    bytes_data_parts: Sequence[Any],
+    part_decoder: Optional[Callable[[Any], bytes]] = None,
+) -> List[Any]:
+    """
+    Decode a list of bytes parts by running the decoders of a plan. The given
+    parts are not modified. Parts in another encoding (such as the hex encoded
+    arguments of a transaction) are converted by the part decoder, only when the
+    plan reads them.
+
+    :param serializer: serializer holding the custom types definitions
+    :type serializer: AbiSerializer
+    :param io_plan: resolved codecs of the expected inputs or outputs
+    :type io_plan: Tuple[IOPlan, ...]
+    :param bytes_data_parts: data to decode
+    :type bytes_data_parts: Sequence[Any]
+    :param part_decoder: function converting a part into bytes, defaults to None
+        for parts that are already bytes
+    :type part_decoder: Optional[Callable[[Any], bytes]], optional
+    :return: decoded data
+    :rtype: List[Any]
+    """
+    reader = MultiValueReader(bytes_data_parts)
+    decoded_results = []
+    for io_element in io_plan:
+        if io_element.is_multi:
+            bytes_data = reader.read_remaining()
+            if part_decoder is not None:
+                bytes_data = [part_decoder(p) for p in bytes_data]
+        elif not reader.has_next():  # option value case
+            bytes_data = b""
+        elif part_decoder is not None:
+            bytes_data = part_decoder(reader.read())
+        else:
+            bytes_data = reader.read()
+        decoded_output = io_element.decode(serializer, bytes_data)
+        if io_element.is_multi:
+            if numpy_codec.is_ndarray(decoded_output):
+                # the NumPy mode decodes a variadic of integers as a single result
+                decoded_results.append(decoded_output)
+            elif decoded_output is not None:
+                decoded_results.extend(decoded_output)
+        elif not io_element.is_optional or decoded_output is not None:
+            decoded_results.append(decoded_output)
+    if reader.has_next():
+        left_over = reader.read_remaining()
+        if part_decoder is not None:
+            left_over = [part_decoder(p) for p in left_over]
+        raise errors.LeftOverData(left_over)
+    return decoded_results
+
+
+def iter_decode_parts(
+    serializer: AbiSerializer,
+    io_plan: Tuple[IOPlan, ...],
+    bytes_data_parts: Sequence[bytes],
+) -> Iterator[Any]:
+    """
+    Decode a list of bytes parts by running the decoders of a plan, yielding the
+    decoded values one by one. The elements of a variadic value are decoded only
+    when they are consumed, so that they never need to be held in a list. A List
+    value is yielded as an iterator that decodes its elements in the same way.
+
+    :param serializer: serializer holding the custom types definitions
+    :type serializer: AbiSerializer
+    :param io_plan: resolved codecs of the expected inputs or outputs
+    :type io_plan: Tuple[IOPlan, ...]
+    :param bytes_data_parts: data to decode
+    :type bytes_data_parts: Sequence[bytes]
+    :return: iterator over the decoded data
+    :rtype: Iterator[Any]
+    """
+    reader = MultiValueReader(bytes_data_parts)
+    for io_element in io_plan:
+        if io_element.is_variadic and io_element.is_multi:
+            yield from io_element.iter_decode(serializer, reader.iter_remaining())
+            continue
+        if io_element.is_multi:
+            bytes_data = reader.read_remaining()
+        elif not reader.has_next():  # option value case
+            bytes_data = b""
+        else:
+            bytes_data = reader.read()
+        if io_element.is_list:
+            yield io_element.iter_decode(serializer, bytes_data)
+            continue
+        decoded_output = io_element.decode(serializer, bytes_data)
+        if io_element.is_multi:
+            if decoded_output is not None:
+                yield from decoded_output
+        elif not io_element.is_optional or decoded_output is not None:
+            yield decoded_output
+    if reader.has_next():
+        raise errors.LeftOverData(reader.read_remaining())
+
+
+def encode_values(
+    serializer: AbiSerializer, io_plan: Tuple[IOPlan, ...], values: Iterable
+) -> List[bytes]:
+    """
+    Encode values by running the encoders of a plan. The values are read once, in
+    order, and are not copied nor modified: they can be given by a generator, in
+    which case the values of a variadic input are encoded as they are produced.
+
+    :param serializer: serializer holding the custom types definitions
+    :type serializer: AbiSerializer
+    :param io_plan: resolved codecs of the expected inputs
+    :type io_plan: Tuple[IOPlan, ...]
+    :param values: values to encode
+    :type values: Iterable
+    :return: encoded values
+    :rtype: List[bytes]
+    """
+    values_iterator = iter(values)
+    encoded_inputs = []
+    for io_element in io_plan:
+        if io_element.is_variadic and io_element.is_multi:
+            to_encode = values_iterator
+        elif io_element.is_multi:
+            to_encode = list(values_iterator)
+        else:
+            to_encode = next(values_iterator, None)
+        encoded_input = io_element.encode(serializer, to_encode)
+        if io_element.is_multi:
+            if encoded_input is not None:
+                encoded_inputs.extend(encoded_input)
+        elif not io_element.is_optional or encoded_input is not None:
+            encoded_inputs.append(encoded_input)
+    return encoded_inputs
+
+
+def encode_values_into(
+    serializer: AbiSerializer,
+    io_plan: Tuple[IOPlan, ...],
+    values: Iterable,
+    buffer: bytearray,
+    part_offsets: List[int],
+):
+    """
+    Encode values by running the encoders of a plan and append them to a buffer.
+    The end offset of each encoded part is appended to the given offsets, so that
+    the parts of many calls can share a single buffer.
+
+    :param serializer: serializer holding the custom types definitions
+    :type serializer: AbiSerializer
+    :param io_plan: resolved codecs of the expected inputs
+    :type io_plan: Tuple[IOPlan, ...]
+    :param values: values to encode
+    :type values: Iterable
+    :param buffer: buffer to append the encoded parts to
+    :type buffer: bytearray
+    :param part_offsets: end offsets of the parts already in the buffer
+    :type part_offsets: List[int]
+    """
+    values_iterator = iter(values)
+    for io_element in io_plan:
+        if io_element.is_multi or io_element.is_optional:
+            if io_element.is_variadic and io_element.is_multi:
+                to_encode = values_iterator
+            elif io_element.is_multi:
+                to_encode = list(values_iterator)
+            else:
+                to_encode = next(values_iterator, None)
+            encoded_input = io_element.encode(serializer, to_encode)
+            if encoded_input is None:
+                continue
+            if not io_element.is_multi:
+                encoded_input = (encoded_input,)
+            for encoded_part in encoded_input:
+                buffer += encoded_part
+                part_offsets.append(len(buffer))
+        else:
+            io_element.encode_into(serializer, next(values_iterator, None), buffer)
+            part_offsets.append(len(buffer))
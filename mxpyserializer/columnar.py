@@ -0,0 +1,90 @@
+"""
+author: Etienne Wallet
+
+This module contains the columnar output of the batch decoding: many values of the
+same struct are returned as one column per field instead of one dict per value.
+Fixed size numeric columns are stored in NumPy arrays and the columns can be
+converted into a pyarrow RecordBatch. NumPy and pyarrow are only imported when
+these features are used.
+"""
+
+from typing import Any, Dict, List, Sequence
+
+from mxpyserializer import errors, numpy_codec
+from mxpyserializer.data_models import AbiField
+
+# arrow types of the columns that are not stored in NumPy arrays
+ARROW_BASIC_TYPES = {
+    "BigUint": "string",
+    "BigInt": "string",
+    "Address": "string",
+    "TokenIdentifier": "string",
+    "EgldOrEsdtTokenIdentifier": "string",
+    "utf-8 string": "string",
+    "utf-8string": "string",
+    "bytes": "binary",
+}
+
+
+def build_columns(fields: Sequence[AbiField], rows: List[List[Any]]) -> Dict[str, Any]:
+    """
+    Transpose decoded rows into one column per field. The columns of fixed size
+    integers and booleans are NumPy arrays, the others are lists.
+
+    :param fields: fields of the decoded struct, in order
+    :type fields: Sequence[AbiField]
+    :param rows: decoded values of each struct, in the fields order
+    :type rows: List[List[Any]]
+    :return: columns of the struct, by field name
+    :rtype: Dict[str, Any]
+    """
+    numpy_codec.require_numpy("the columnar decoding")
+    if len(rows) > 0:
+        transposed_rows = list(zip(*rows))
+    else:
+        transposed_rows = [()] * len(fields)
+    columns = {}
+    for field, column in zip(fields, transposed_rows):
+        if field.type in numpy_codec.NUMPY_DTYPES:
+            columns[field.name] = numpy_codec.to_array(field.type, column)
+        elif field.type == "bool":
+            columns[field.name] = numpy_codec.to_array("bool", column)
+        else:
+            columns[field.name] = list(column)
+    return columns
+
+
+def to_record_batch(fields: Sequence[AbiField], columns: Dict[str, Any]) -> Any:
+    """
+    Convert columns into a pyarrow RecordBatch. Big integers are converted into
+    strings as they can exceed the arrow integer types and addresses are stored as
+    strings, or as binary if they were decoded as raw public keys.
+
+    :param fields: fields of the decoded struct, in order
+    :type fields: Sequence[AbiField]
+    :param columns: columns of the struct, by field name
+    :type columns: Dict[str, Any]
+    :return: record batch with one column per field
+    :rtype: pa.RecordBatch
+    """
+    try:
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    except ImportError as err:  # pragma: no cover
+        raise errors.MissingOptionalDependency(
+            "pyarrow", "the RecordBatch output"
+        ) from err
+    arrays = []
+    for field in fields:
+        column = columns[field.name]
+        arrow_type = ARROW_BASIC_TYPES.get(field.type)
+        if field.type == "Address" and len(column) > 0:
+            # addresses decoded as raw public keys are kept as binary
+            if isinstance(column[0], bytes):
+                arrow_type = "binary"
+        if arrow_type == "string":
+            arrays.append(pa.array([str(v) for v in column], type=pa.string()))
+        elif arrow_type == "binary":
+            arrays.append(pa.array(column, type=pa.binary()))
+        else:
+            arrays.append(pa.array(column))
+    return pa.RecordBatch.from_arrays(arrays, names=[f.name for f in fields])
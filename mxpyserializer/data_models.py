@@ -1,14 +1,130 @@
 """
 author: Etienne Wallet
 
-This module contains the dataclasses describing the data elements used by the package
+This module contains the dataclasses describing the data elements used by the package.
+The models are frozen, slotted and hashable: they can be shared between threads and
+are used as keys of the compiled codecs.
 """
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def get_field_names(model_class: type, init_only: bool) -> Tuple[str, ...]:
+    """
+    Return the names of the compared fields or of the init fields of a dataclass.
+    The names are looked up once per class, as listing the fields of a dataclass
+    is slow compared to hashing or pickling a model.
+
+    :param model_class: dataclass
+    :type model_class: type
+    :param init_only: if the init fields should be returned instead of the
+        compared fields
+    :type init_only: bool
+    :return: names of the fields, in order
+    :rtype: Tuple[str, ...]
+    """
+    return tuple(
+        f.name for f in fields(model_class) if (f.init if init_only else f.compare)
+    )
+
+
+def compute_hash(instance: Any) -> int:
+    """
+    Compute the hash of a dataclass instance from its compared fields and store it
+    in the instance. The models compute their hash when they are first used as a
+    key, so that the next lookups do not rehash their whole content and the models
+    that are never used as keys do not pay for it.
+
+    :param instance: dataclass instance
+    :type instance: Any
+    :return: hash of the instance
+    :rtype: int
+    """
+    names = get_field_names(type(instance), False)
+    instance_hash = hash(tuple(getattr(instance, n) for n in names))
+    object.__setattr__(instance, "_hash", instance_hash)
+    return instance_hash
+
+
+def get_init_arguments(instance: Any) -> Tuple:
+    """
+    Return the arguments given to the constructor of a dataclass instance. Models
+    are pickled through their constructor: models with a stored hash must compute
+    it again, as the hash of strings changes from one process to another, and
+    calling the constructor is faster than the default state restoration of the
+    slotted dataclasses.
+
+    :param instance: dataclass instance
+    :type instance: Any
+    :return: values of the init fields, in order
+    :rtype: Tuple
+    """
+    return tuple(getattr(instance, n) for n in get_field_names(type(instance), True))
+
+
+@dataclass(frozen=True, slots=True)
+class AbiIO:
+    """
+    Represents an input or an output of an endpoint
+    """
+
+    type: str
+    name: str = ""
+    multi_arg: bool = False
+    multi_result: bool = False
+
+    def __reduce__(self):
+        return self.__class__, get_init_arguments(self)
+
+    @property
+    def is_multi(self) -> bool:
+        """
+        If the input or output holds several top encoded values
+
+        :return: True for multi arguments and multi results
+        :rtype: bool
+        """
+        return self.multi_arg or self.multi_result
+
+    def to_dict(self) -> Dict:
+        """
+        Export this instance as a Dict
+
+        :return: instance as dict
+        :rtype: Dict
+        """
+        data = {"type": self.type}
+        if self.name:
+            data["name"] = self.name
+        if self.multi_arg:
+            data["multi_arg"] = True
+        if self.multi_result:
+            data["multi_result"] = True
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict) -> AbiIO:
+        """
+        Parse a dictionnary into an instance of this class
+
+        :param data: data to parse
+        :type data: Dict
+        :return: instance of the class
+        :rtype: AbiIO
+        """
+        return AbiIO(
+            type=data["type"],
+            name=data.get("name", ""),
+            multi_arg=data.get("multi_arg", False),
+            multi_result=data.get("multi_result", False),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class AbiEndpoint:
     """
     Represents an endpoint defined in an ABI file
@@ -16,9 +132,34 @@ class AbiEndpoint:
 
     name: str
     mutability: str
-    inputs: List[Dict]
-    outputs: List[Dict]
-    docs: List[str]
+    inputs: Tuple[AbiIO, ...]
+    outputs: Tuple[AbiIO, ...]
+    docs: Tuple[str, ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            return compute_hash(self)
+
+    def __reduce__(self):
+        return self.__class__, get_init_arguments(self)
+
+    def to_dict(self) -> Dict:
+        """
+        Export this instance as a Dict
+
+        :return: instance as dict
+        :rtype: Dict
+        """
+        return {
+            "name": self.name,
+            "mutability": self.mutability,
+            "inputs": [i.to_dict() for i in self.inputs],
+            "outputs": [o.to_dict() for o in self.outputs],
+            "docs": list(self.docs),
+        }
 
     @staticmethod
     def from_dict(data: Dict) -> AbiEndpoint:
@@ -33,13 +174,13 @@ class AbiEndpoint:
         return AbiEndpoint(
             name=data["name"],
             mutability=data["mutability"],
-            inputs=data["inputs"],
-            outputs=data["outputs"],
-            docs=data.get("docs", []),
+            inputs=tuple(AbiIO.from_dict(i) for i in data["inputs"]),
+            outputs=tuple(AbiIO.from_dict(o) for o in data["outputs"]),
+            docs=tuple(data.get("docs", [])),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AbiField:
     """
     Represents a field for a struct or a variant
@@ -47,7 +188,19 @@ class AbiField:
 
     name: str
     type: str
-    docs: List[str]
+    docs: Tuple[str, ...]
+
+    def __reduce__(self):
+        return self.__class__, get_init_arguments(self)
+
+    def to_dict(self) -> Dict:
+        """
+        Export this instance as a Dict
+
+        :return: instance as dict
+        :rtype: Dict
+        """
+        return {"name": self.name, "type": self.type, "docs": list(self.docs)}
 
     @staticmethod
     def from_dict(data: Dict) -> AbiField:
@@ -62,19 +215,42 @@ class AbiField:
         return AbiField(
             name=data["name"],
             type=data["type"],
-            docs=data.get("docs", []),
+            docs=tuple(data.get("docs", [])),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AbiStruct:
     """
     Represents an struct defined in an ABI file
     """
 
     name: str
-    fields: List[AbiField]
-    docs: List[str]
+    fields: Tuple[AbiField, ...]
+    docs: Tuple[str, ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            return compute_hash(self)
+
+    def __reduce__(self):
+        return self.__class__, get_init_arguments(self)
+
+    def to_dict(self) -> Dict:
+        """
+        Export this instance as a Dict
+
+        :return: instance as dict
+        :rtype: Dict
+        """
+        return {
+            "name": self.name,
+            "fields": [f.to_dict() for f in self.fields],
+            "docs": list(self.docs),
+        }
 
     @staticmethod
     def from_dict(data: Dict) -> AbiStruct:
@@ -88,12 +264,12 @@ class AbiStruct:
         """
         return AbiStruct(
             name=data["name"],
-            fields=[AbiField.from_dict(f) for f in data["fields"]],
-            docs=data.get("docs", []),
+            fields=tuple(AbiField.from_dict(f) for f in data["fields"]),
+            docs=tuple(data.get("docs", [])),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AbiVariant:
     """
     Represents a variant for an ABI enum
@@ -101,7 +277,35 @@ class AbiVariant:
 
     name: str
     discriminant: int
-    fields: List[AbiField]
+    fields: Tuple[AbiField, ...]
+    # types of the fields, in order
+    field_types: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "field_types", tuple(f.type for f in self.fields))
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            return compute_hash(self)
+
+    def __reduce__(self):
+        return self.__class__, get_init_arguments(self)
+
+    def to_dict(self) -> Dict:
+        """
+        Export this instance as a Dict
+
+        :return: instance as dict
+        :rtype: Dict
+        """
+        return {
+            "name": self.name,
+            "discriminant": self.discriminant,
+            "fields": [f.to_dict() for f in self.fields],
+        }
 
     @staticmethod
     def from_dict(data: Dict) -> AbiVariant:
@@ -116,19 +320,62 @@ class AbiVariant:
         return AbiVariant(
             name=data["name"],
             discriminant=data["discriminant"],
-            fields=[AbiField.from_dict(f) for f in data.get("fields", [])],
+            fields=tuple(AbiField.from_dict(f) for f in data.get("fields", [])),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AbiEnum:
     """
     Represents an enum defined in an ABI file
     """
 
     name: str
-    variants: List[AbiVariant]
-    docs: List[str]
+    variants: Tuple[AbiVariant, ...]
+    docs: Tuple[str, ...]
+    # read-only indexes of the variants, built once to find a variant in constant
+    # time
+    variants_by_discriminant: Mapping[int, AbiVariant] = field(
+        init=False, repr=False, compare=False
+    )
+    variants_by_name: Mapping[str, AbiVariant] = field(
+        init=False, repr=False, compare=False
+    )
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "variants_by_discriminant",
+            MappingProxyType({v.discriminant: v for v in self.variants}),
+        )
+        object.__setattr__(
+            self,
+            "variants_by_name",
+            MappingProxyType({v.name: v for v in self.variants}),
+        )
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            return compute_hash(self)
+
+    def __reduce__(self):
+        return self.__class__, get_init_arguments(self)
+
+    def to_dict(self) -> Dict:
+        """
+        Export this instance as a Dict
+
+        :return: instance as dict
+        :rtype: Dict
+        """
+        return {
+            "name": self.name,
+            "variants": [v.to_dict() for v in self.variants],
+            "docs": list(self.docs),
+        }
 
     @staticmethod
     def from_dict(data: Dict) -> AbiEnum:
@@ -142,6 +389,6 @@ class AbiEnum:
         """
         return AbiEnum(
             name=data["name"],
-            variants=[AbiVariant.from_dict(v) for v in data["variants"]],
-            docs=data.get("docs", []),
+            variants=tuple(AbiVariant.from_dict(v) for v in data["variants"]),
+            docs=tuple(data.get("docs", [])),
         )
@@ -5,7 +5,25 @@ This module contains the custom errors defined for this package
 """
 
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
+
+
+def rebuild_error(error_class: type, args: Tuple) -> Exception:
+    """
+    Rebuild an error of this package from its final arguments, without calling
+    its constructor again. Used when an error is unpickled, for example when it
+    is raised in a worker process.
+
+    :param error_class: class of the error
+    :type error_class: type
+    :param args: arguments of the error, as stored in its args attribute
+    :type args: Tuple
+    :return: rebuilt error
+    :rtype: Exception
+    """
+    error = error_class.__new__(error_class)
+    Exception.__init__(error, *args)
+    return error
 
 
 class MxPySerializerException(Exception):
@@ -13,6 +31,9 @@ class MxPySerializerException(Exception):
     Root class for all custom errors of this package
     """
 
+    def __reduce__(self):
+        return rebuild_error, (self.__class__, self.args)
+
 
 class UnknownCustomTypeType(MxPySerializerException):
     """
@@ -133,3 +154,50 @@ class UnknownEndpoint(MxPySerializerException):
     def __init__(self, unknown_endpoint: str) -> None:
         message = f"Unknown endpoint: {unknown_endpoint}"
         super().__init__(message)
+
+
+class MissingOptionalDependency(MxPySerializerException):
+    """
+    To be raised when a feature needs an optional package that is not installed
+    """
+
+    def __init__(self, package: str, feature: str) -> None:
+        message = (
+            f"The package {package} is required for {feature}. "
+            f"Install it with: pip install {package}"
+        )
+        super().__init__(message)
+
+
+class UnknownAddressFormat(MxPySerializerException):
+    """
+    To be raised when an address output format is unknown
+    """
+
+    def __init__(self, address_format: str) -> None:
+        message = (
+            f"Unknown address format: {address_format}, expected one of "
+            "bech32, bytes, hex or lazy"
+        )
+        super().__init__(message)
+
+
+class BadBech32Address(MxPySerializerException):
+    """
+    To be raised when a string is not a valid erd bech32 address
+    """
+
+    def __init__(self, address: str) -> None:
+        message = f"Bad bech32 address: {address}"
+        super().__init__(message)
+
+
+class BadProjection(MxPySerializerException):
+    """
+    To be raised when a projection selects a field that the decoded type does not
+    have
+    """
+
+    def __init__(self, type_name: str, path: str) -> None:
+        message = f"The type {type_name} has no field {path} to select"
+        super().__init__(message)
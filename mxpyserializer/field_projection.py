@@ -0,0 +1,198 @@
+"""
+author: Etienne Wallet
+
+This module contains the projected decoding of the custom types: only the fields
+selected by paths such as "first_token_reserve" or "state.name" are decoded, the
+other fields are skipped by reading their encoded size, without building their
+values.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple, Union
+
+from mxpyserializer import errors
+from mxpyserializer.struct_layout import FieldsLayout
+from mxpyserializer.type_tree import (
+    ArrayTypeNode,
+    EnumTypeNode,
+    ListTypeNode,
+    OptionalTypeNode,
+    OptionTypeNode,
+    StructTypeNode,
+    TypeNode,
+    VariadicTypeNode,
+)
+
+if TYPE_CHECKING:
+    from mxpyserializer.abi_serializer import AbiSerializer
+
+
+# keys of the decoded enums
+ENUM_KEYS = ("name", "discriminant", "values")
+
+# nodes holding values of an inner type: the projection applies to each value
+CONTAINER_NODES = (
+    ListTypeNode,
+    ArrayTypeNode,
+    OptionTypeNode,
+    OptionalTypeNode,
+    VariadicTypeNode,
+)
+
+
+@dataclass(frozen=True)
+class ProjectedStructTypeNode(TypeNode):
+    """
+    Node of a custom struct of which only some fields are decoded. The fields that
+    are not selected are skipped.
+    """
+
+    layout: FieldsLayout
+    # for each segment of the layout, the selected fields as their name, their
+    # position in the segment and the node decoding them
+    selections: Tuple[Tuple[Tuple[str, int, TypeNode], ...], ...]
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[Dict[str, Any], int]:
+        start = offset
+        decoded_values = {}
+        for segment, size, selection in zip(
+            self.layout.segments, self.layout.segment_sizes, self.selections
+        ):
+            if size is not None:
+                for name, position, node in selection:
+                    decoded_values[name], _ = node.nested_decode_at(
+                        serializer, data, offset + position
+                    )
+                offset += size
+            elif selection:
+                name, _, node = selection[0]
+                decoded_values[name], offset = node.nested_decode_at(
+                    serializer, data, offset
+                )
+            else:
+                offset = segment.nested_skip_at(serializer, data, offset)
+        self.layout.check_end(data, start, offset)
+        return decoded_values, offset
+
+
+@dataclass(frozen=True)
+class ProjectedEnumTypeNode(TypeNode):
+    """
+    Node of a custom enum of which only some keys of the decoded value are kept
+    """
+
+    keys: Tuple[str, ...]
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[Dict[str, Any], int]:
+        decoded_enum, offset = serializer.decode_custom_enum_at(self.name, data, offset)
+        return {key: decoded_enum[key] for key in self.keys}, offset
+
+
+def to_paths_tuple(paths: Union[str, Iterable[str]]) -> Tuple[str, ...]:
+    """
+    Convert the paths given to a projection into a tuple. A single path given as a
+    string is a tuple of one path, and not the tuple of its characters.
+
+    :param paths: paths of the fields to select, such as "state.name"
+    :type paths: Union[str, Iterable[str]]
+    :return: tuple of the paths
+    :rtype: Tuple[str, ...]
+    """
+    if isinstance(paths, str):
+        return (paths,)
+    return tuple(paths)
+
+
+def parse_projection(paths: Iterable[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Parse paths of fields into a tree, where each field maps to the tree of its
+    selected sub-fields or to None if it is selected entirely
+
+    :param paths: paths of the fields to select, such as "state.name"
+    :type paths: Iterable[str]
+    :return: tree of the selected fields
+    :rtype: Dict[str, Optional[Dict]]
+    """
+    tree = {}
+    for path in paths:
+        keys = path.split(".")
+        current = tree
+        for key in keys[:-1]:
+            if key in current and current[key] is None:
+                break  # the parent field is already selected entirely
+            current = current.setdefault(key, {})
+        else:
+            current[keys[-1]] = None
+    return tree
+
+
+def has_fields(node: TypeNode) -> bool:
+    """
+    Check if a projection can be applied to the values of a type
+
+    :param node: type tree of the values
+    :type node: TypeNode
+    :return: True for the custom types and the containers of custom types
+    :rtype: bool
+    """
+    while isinstance(node, CONTAINER_NODES):
+        node = node.inner
+    return isinstance(node, (StructTypeNode, EnumTypeNode))
+
+
+def build_projected_node(
+    serializer: AbiSerializer, node: TypeNode, tree: Dict[str, Optional[Dict]]
+) -> TypeNode:
+    """
+    Build the type tree decoding only the selected fields of the values of a type.
+    Containers apply the projection to each of their values.
+
+    :param serializer: serializer holding the custom types definitions
+    :type serializer: AbiSerializer
+    :param node: type tree of the values
+    :type node: TypeNode
+    :param tree: tree of the selected fields, as returned by parse_projection
+    :type tree: Dict[str, Optional[Dict]]
+    :return: type tree of the projected values
+    :rtype: TypeNode
+    """
+    if isinstance(node, CONTAINER_NODES):
+        return replace(node, inner=build_projected_node(serializer, node.inner, tree))
+
+    if isinstance(node, EnumTypeNode):
+        for key, sub_tree in tree.items():
+            if key not in ENUM_KEYS or sub_tree is not None:
+                raise errors.BadProjection(node.name, key)
+        return ProjectedEnumTypeNode(
+            node.name, tuple(k for k in ENUM_KEYS if k in tree)
+        )
+
+    if not isinstance(node, StructTypeNode):
+        raise errors.BadProjection(node.name, next(iter(tree)))
+
+    layout = serializer.get_struct_layout(node.name)
+    for key in tree:
+        if key not in layout.indexes:
+            raise errors.BadProjection(node.name, key)
+    selections = []
+    field_index = 0
+    for segment, size in zip(layout.segments, layout.segment_sizes):
+        positions = segment.field_offsets if size is not None else (0,)
+        selection = []
+        for position in positions:
+            name = layout.names[field_index]
+            if name in tree:
+                field_node = layout.field_nodes[field_index]
+                if tree[name] is not None:
+                    field_node = build_projected_node(
+                        serializer, field_node, tree[name]
+                    )
+                selection.append((name, position, field_node))
+            field_index += 1
+        selections.append(tuple(selection))
+    return ProjectedStructTypeNode(node.name, layout, tuple(selections))
@@ -0,0 +1,307 @@
+"""
+author: Etienne Wallet
+
+This module contains the decoding and the building of the data field of the
+transactions calling an endpoint ("endpoint@arg1@arg2..."), including the ESDT
+transfers prefixes (ESDTTransfer, ESDTNFTTransfer and MultiESDTNFTTransfer), and
+the filtering of the data fields on their endpoint and transferred tokens before
+they are decoded.
+"""
+
+from __future__ import annotations
+import binascii
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from mxpyserializer import basic_type, bech32, codec_plan
+
+if TYPE_CHECKING:
+    from mxpyserializer.abi_serializer import AbiSerializer
+
+
+def split_input_data(
+    raw_input_data: Union[str, bytes, bytearray, memoryview]
+) -> List[Union[str, bytes, bytearray]]:
+    """
+    Split a data field on its separators. Strings, bytes and bytearrays are split
+    as they are, memoryviews are copied first as they can not be split.
+
+    :param raw_input_data: full input data (not b64 encoded)
+    :type raw_input_data: Union[str, bytes, bytearray, memoryview]
+    :return: parts of the data field, still hex encoded
+    :rtype: List[Union[str, bytes, bytearray]]
+    """
+    if isinstance(raw_input_data, str):
+        return raw_input_data.split("@")
+    if isinstance(raw_input_data, memoryview):
+        raw_input_data = raw_input_data.tobytes()
+    return raw_input_data.split(b"@")
+
+
+def decode_input_data(
+    serializer: AbiSerializer, raw_input_data: Union[str, bytes, bytearray, memoryview]
+) -> Tuple[str, List[Dict], List[Any]]:
+    """
+    Decode the input data of a transaction that calls an endpoint of
+    the smart-contract. The data field can be given as a string or as raw bytes,
+    including a memoryview over a larger buffer. It is split once, and each part is
+    hex decoded only when it is read: the arguments are hex decoded one by one by
+    the plan of the endpoint, and the receivers of MultiESDTNFTTransfer are skipped
+    without being hex decoded.
+
+    :param serializer: serializer holding the definitions of the contract
+    :type serializer: AbiSerializer
+    :param raw_input_data: full input data (not b64 encoded)
+    :type raw_input_data: Union[str, bytes, bytearray, memoryview]
+    :return: endpoint name, Esdt transfers, list of decoded inputs
+    :rtype: Tuple[str, List[Dict], List[Any]]
+    """
+    # a single split in C is faster than searching the separators from Python, the
+    # parts stay hex encoded until they are read
+    reader = codec_plan.MultiValueReader(split_input_data(raw_input_data))
+    unhexlify = binascii.unhexlify
+    transfers = []
+
+    # first decode if there is any transfer
+    first_function = reader.read()  # first function is not serialized
+    if not isinstance(first_function, str):
+        first_function = first_function.decode()
+    if first_function == "ESDTTransfer":
+        transfers.append(
+            {
+                "identifier": serializer.top_decode(
+                    "TokenIdentifier", unhexlify(reader.read())
+                ),
+                "nonce": 0,
+                "amount": serializer.top_decode("BigUint", unhexlify(reader.read())),
+            }
+        )
+        endpoint_name = serializer.top_decode("utf-8 string", unhexlify(reader.read()))
+    elif first_function == "MultiESDTNFTTransfer":
+        first_part = reader.read()
+        if len(first_part) == 2 * bech32.PUBKEY_LENGTH:  # receiver, not decoded
+            first_part = reader.read()
+        n_transfers = serializer.top_decode("u32", unhexlify(first_part))
+
+        for _ in range(n_transfers):
+            transfers.append(
+                {
+                    "identifier": serializer.top_decode(
+                        "TokenIdentifier", unhexlify(reader.read())
+                    ),
+                    "nonce": serializer.top_decode("u64", unhexlify(reader.read())),
+                    "amount": serializer.top_decode(
+                        "BigUint", unhexlify(reader.read())
+                    ),
+                }
+            )
+        endpoint_name = serializer.top_decode("utf-8 string", unhexlify(reader.read()))
+    elif first_function == "ESDTNFTTransfer":
+        transfers.append(
+            {
+                "identifier": serializer.top_decode(
+                    "TokenIdentifier", unhexlify(reader.read())
+                ),
+                "nonce": serializer.top_decode("u64", unhexlify(reader.read())),
+                "amount": serializer.top_decode("BigUint", unhexlify(reader.read())),
+            }
+        )
+        bech32.check_pubkey_length(unhexlify(reader.read()))  # receiver
+        endpoint_name = serializer.top_decode("utf-8 string", unhexlify(reader.read()))
+    else:
+        endpoint_name = first_function
+
+    # then decode the inputs
+    plan = serializer.get_endpoint_plan(endpoint_name)
+    decoded_inputs = codec_plan.decode_parts(
+        serializer, plan.inputs, reader.read_remaining(), unhexlify
+    )
+    return endpoint_name, transfers, decoded_inputs
+
+
+def to_names_set(names: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """
+    Convert the names given to a filter into a set. A single name given as a string
+    is a set of one name, and not the set of its characters.
+
+    :param names: names to convert, or None to match any name
+    :type names: Optional[Iterable[str]]
+    :return: set of the names, None if no names were given
+    :rtype: Optional[FrozenSet[str]]
+    """
+    if names is None:
+        return None
+    if isinstance(names, str):
+        return frozenset((names,))
+    return frozenset(names)
+
+
+@dataclass(frozen=True)
+class InputDataFilter:
+    """
+    Predicate on the endpoint name and on the identifiers of the transferred tokens
+    of transactions data fields. The names and identifiers are compiled once into
+    their raw and hex encoded forms, so that the data fields are matched without
+    decoding any of their parts. A data field matches when all the given criteria
+    match: it calls one of the endpoint names, and it transfers at least one of the
+    token identifiers. A criterion left to None matches any data field.
+    """
+
+    endpoint_names: Optional[FrozenSet[str]] = None
+    token_identifiers: Optional[FrozenSet[str]] = None
+    # names and identifiers as found in the data fields: the first function is not
+    # encoded, the endpoint called after transfers and the identifiers are hex
+    # encoded
+    _raw_endpoint_names: FrozenSet[bytes] = field(init=False, repr=False, compare=False)
+    _hex_endpoint_names: FrozenSet[bytes] = field(init=False, repr=False, compare=False)
+    _hex_token_identifiers: FrozenSet[bytes] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        endpoint_names = to_names_set(self.endpoint_names)
+        object.__setattr__(self, "endpoint_names", endpoint_names)
+        token_identifiers = to_names_set(self.token_identifiers)
+        object.__setattr__(self, "token_identifiers", token_identifiers)
+        raw_endpoint_names = frozenset(n.encode() for n in endpoint_names or ())
+        object.__setattr__(self, "_raw_endpoint_names", raw_endpoint_names)
+        object.__setattr__(
+            self,
+            "_hex_endpoint_names",
+            frozenset(binascii.hexlify(n) for n in raw_endpoint_names),
+        )
+        object.__setattr__(
+            self,
+            "_hex_token_identifiers",
+            frozenset(binascii.hexlify(t.encode()) for t in token_identifiers or ()),
+        )
+
+    def matches(self, raw_input_data: Union[str, bytes, bytearray, memoryview]) -> bool:
+        """
+        Check if the data field of a transaction satisfies the filter. Only the
+        first function is read for the direct calls, and only the parts up to the
+        endpoint name for the ESDT transfers: the arguments are neither split nor
+        decoded. Malformed transfers do not match.
+
+        :param raw_input_data: full input data (not b64 encoded)
+        :type raw_input_data: Union[str, bytes, bytearray, memoryview]
+        :return: True if the data field should be decoded
+        :rtype: bool
+        """
+        if self.endpoint_names is None and self.token_identifiers is None:
+            return True
+        if isinstance(raw_input_data, str):
+            raw_input_data = raw_input_data.encode()
+        elif not isinstance(raw_input_data, bytes):
+            raw_input_data = bytes(raw_input_data)
+        first_function = raw_input_data.partition(b"@")[0]
+
+        if first_function in (b"ESDTTransfer", b"ESDTNFTTransfer"):
+            endpoint_index = 3 if first_function == b"ESDTTransfer" else 5
+            parts = raw_input_data.split(b"@", endpoint_index + 1)
+            token_parts = parts[1:2]
+        elif first_function == b"MultiESDTNFTTransfer":
+            parts = raw_input_data.split(b"@", 3)
+            index = 1
+            if len(parts) > 1 and len(parts[1]) == 2 * bech32.PUBKEY_LENGTH:
+                index = 2  # receiver
+            if index >= len(parts):
+                return False
+            try:
+                # parsed as the decoder does, rejecting what int(..., 16) tolerates
+                n_transfers = int.from_bytes(binascii.unhexlify(parts[index]), "big")
+            except binascii.Error:
+                return False
+            endpoint_index = index + 1 + 3 * n_transfers
+            parts = raw_input_data.split(b"@", endpoint_index + 1)
+            token_parts = parts[index + 1 : endpoint_index : 3]
+        else:
+            if self.token_identifiers is not None:
+                return False
+            return first_function in self._raw_endpoint_names
+
+        if self.token_identifiers is not None:
+            hex_token_identifiers = self._hex_token_identifiers
+            if not any(p.lower() in hex_token_identifiers for p in token_parts):
+                return False
+        if self.endpoint_names is not None:
+            return (
+                endpoint_index < len(parts)
+                and parts[endpoint_index].lower() in self._hex_endpoint_names
+            )
+        return True
+
+
+def encode_input_data(
+    serializer: AbiSerializer,
+    endpoint_name: str,
+    values: Iterable,
+    transfers: Optional[List[Dict]] = None,
+    receiver: Optional[Any] = None,
+) -> str:
+    """
+    Build the input data of a transaction that calls an endpoint of the
+    smart-contract. This is the reverse of decode_input_data: a single fungible
+    transfer is sent with ESDTTransfer, a single transfer with a nonce with
+    ESDTNFTTransfer and several transfers with MultiESDTNFTTransfer. The transfer
+    parts are encoded directly with their basic types, without resolving a type
+    tree for each of them.
+
+    :param serializer: serializer holding the definitions of the contract
+    :type serializer: AbiSerializer
+    :param endpoint_name: name of the endpoint to call
+    :type endpoint_name: str
+    :param values: values of the inputs of the endpoint
+    :type values: Iterable
+    :param transfers: ESDT transfers, as dictionaries with the keys "identifier",
+        "amount" and optionally "nonce", defaults to None
+    :type transfers: Optional[List[Dict]], optional
+    :param receiver: address of the contract, required by the ESDTNFTTransfer and
+        MultiESDTNFTTransfer functions, defaults to None
+    :type receiver: Optional[Any], optional
+    :return: input data (not b64 encoded)
+    :rtype: str
+    """
+    plan = serializer.get_endpoint_plan(endpoint_name)
+    top_encode_basic = basic_type.top_encode_basic
+    parts = []
+
+    transfers = [] if transfers is None else transfers
+    if len(transfers) == 0:
+        first_function = endpoint_name
+    elif len(transfers) == 1 and transfers[0].get("nonce", 0) == 0:
+        first_function = "ESDTTransfer"
+        parts.append(top_encode_basic("TokenIdentifier", transfers[0]["identifier"]))
+        parts.append(top_encode_basic("BigUint", transfers[0]["amount"]))
+    else:
+        if receiver is None:
+            raise ValueError(
+                "A receiver is required by ESDTNFTTransfer and MultiESDTNFTTransfer"
+            )
+        if len(transfers) == 1:
+            first_function = "ESDTNFTTransfer"
+        else:
+            first_function = "MultiESDTNFTTransfer"
+            parts.append(top_encode_basic("Address", receiver))
+            parts.append(top_encode_basic("u32", len(transfers)))
+        for transfer in transfers:
+            parts.append(top_encode_basic("TokenIdentifier", transfer["identifier"]))
+            parts.append(top_encode_basic("u64", transfer.get("nonce", 0)))
+            parts.append(top_encode_basic("BigUint", transfer["amount"]))
+        if len(transfers) == 1:
+            parts.append(top_encode_basic("Address", receiver))
+    if len(transfers) > 0:
+        parts.append(top_encode_basic("utf-8 string", endpoint_name))
+
+    parts.extend(codec_plan.encode_values(serializer, plan.inputs, values))
+    return "@".join([first_function, *[part.hex() for part in parts]])
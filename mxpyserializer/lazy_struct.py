@@ -0,0 +1,86 @@
+"""
+author: Etienne Wallet
+
+This module contains the lazy views of the custom structs. A view keeps a reference
+to the encoded data and only decodes a field the first time it is read, so that
+reading a few fields of a large struct does not build the values of the others.
+"""
+
+from __future__ import annotations
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Dict, Iterator
+
+if TYPE_CHECKING:
+    from mxpyserializer.abi_serializer import AbiSerializer
+    from mxpyserializer.struct_layout import FieldsLayout
+
+
+# marks the fields that were not decoded yet
+NOT_DECODED = object()
+
+
+class LazyStruct(Mapping):
+    """
+    Read-only mapping over a nested encoded struct. The positions of the fields are
+    found when the view is created, by skipping over the encoded values, and each
+    field is decoded and memoized when it is first read. The encoded data must not
+    be modified while the view is in use.
+    """
+
+    __slots__ = (
+        "_serializer",
+        "_layout",
+        "_data",
+        "_segment_starts",
+        "_values",
+        "end",
+    )
+
+    def __init__(
+        self,
+        serializer: AbiSerializer,
+        layout: FieldsLayout,
+        data: memoryview,
+        offset: int,
+    ):
+        self._serializer = serializer
+        self._layout = layout
+        self._data = data
+        # offset following the struct in the data
+        self._segment_starts, self.end = layout.locate_at(serializer, data, offset)
+        self._values = [NOT_DECODED] * len(layout.names)
+
+    def __getitem__(self, key: str) -> Any:
+        index = self._layout.indexes[key]
+        value = self._values[index]
+        if value is NOT_DECODED:
+            segment_index, field_offset = self._layout.field_locations[index]
+            value, _ = self._layout.field_nodes[index].nested_decode_at(
+                self._serializer,
+                self._data,
+                self._segment_starts[segment_index] + field_offset,
+            )
+            self._values[index] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout.names)
+
+    def __len__(self) -> int:
+        return len(self._layout.names)
+
+    def __reduce__(self):
+        # the encoded data can not be pickled, the view is sent as a dict instead
+        return dict, (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        return f"LazyStruct({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Decode all the fields that were not read yet and return them as a dict
+
+        :return: values of the fields by name
+        :rtype: Dict[str, Any]
+        """
+        return {name: self[name] for name in self._layout.names}
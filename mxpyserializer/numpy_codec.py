@@ -0,0 +1,186 @@
+"""
+author: Etienne Wallet
+
+This module contains the optional NumPy support: lists and arrays of fixed size
+integers can be decoded directly into ndarrays and ndarrays can be encoded without
+converting each element. NumPy is only required, and only imported, when these
+features are used.
+"""
+
+from itertools import chain
+import sys
+from types import ModuleType
+from typing import Any, Iterable, List, Optional
+
+from mxpyserializer import errors
+
+
+# big endian dtypes of the integer types with a fixed nested encoding size
+NUMPY_DTYPES = {
+    "u8": ">u1",
+    "u16": ">u2",
+    "u32": ">u4",
+    "usize": ">u4",
+    "u64": ">u8",
+    "i8": ">i1",
+    "i16": ">i2",
+    "i32": ">i4",
+    "isize": ">i4",
+    "i64": ">i8",
+}
+
+# marks the end of the values read, as None can be a value
+MISSING_VALUE = object()
+
+
+def require_numpy(feature: str) -> ModuleType:
+    """
+    Import NumPy, raising an error if it is not installed
+
+    :param feature: feature needing NumPy, for the error message
+    :type feature: str
+    :return: numpy module
+    :rtype: ModuleType
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as err:  # pragma: no cover
+        raise errors.MissingOptionalDependency("numpy", feature) from err
+    return numpy
+
+
+def is_ndarray(value: Any) -> bool:
+    """
+    Check if a value is a NumPy ndarray, without requiring NumPy to be installed
+
+    :param value: value to check
+    :type value: Any
+    :return: if the value is an ndarray
+    :rtype: bool
+    """
+    # an ndarray can only exist if NumPy was already imported
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def decode_array_at(
+    type_name: str, data: memoryview, offset: int, count: int
+) -> Optional[Any]:
+    """
+    Decode consecutive nested encoded integers into an ndarray in native byte
+    order. Returns None if the data is too short so that the caller can fall back
+    to the element by element decoding and its detailed errors.
+
+    :param type_name: name of the integer type of the elements
+    :type type_name: str
+    :param data: data containing the elements
+    :type data: memoryview
+    :param offset: position of the first element in the data
+    :type offset: int
+    :param count: number of elements to decode
+    :type count: int
+    :return: decoded elements or None if the data is too short
+    :rtype: Optional[np.ndarray]
+    """
+    numpy = require_numpy("the NumPy decoding mode")
+    dtype = numpy.dtype(NUMPY_DTYPES[type_name])
+    if offset + count * dtype.itemsize > len(data):
+        return None
+    array = numpy.frombuffer(data, dtype=dtype, count=count, offset=offset)
+    # byteswap to the native order: the copy also detaches the result from the data
+    return array.astype(dtype.newbyteorder("="))
+
+
+def get_item_size(type_name: str) -> int:
+    """
+    Return the number of bytes of a nested encoded integer type
+
+    :param type_name: name of the integer type
+    :type type_name: str
+    :return: size in bytes
+    :rtype: int
+    """
+    numpy = require_numpy("the NumPy decoding mode")
+    return numpy.dtype(NUMPY_DTYPES[type_name]).itemsize
+
+
+def to_array(type_name: str, values: Iterable[int]) -> Any:
+    """
+    Convert decoded integers or booleans into an ndarray of the matching dtype
+
+    :param type_name: name of the integer type of the values or bool
+    :type type_name: str
+    :param values: decoded integers or booleans
+    :type values: Iterable[int]
+    :return: ndarray of the values
+    :rtype: np.ndarray
+    """
+    numpy = require_numpy("the NumPy decoding mode")
+    if type_name == "bool":
+        return numpy.array(values, dtype=numpy.bool_)
+    return numpy.array(
+        values, dtype=numpy.dtype(NUMPY_DTYPES[type_name]).newbyteorder("=")
+    )
+
+
+def encode_array_into(type_name: str, value: Any, buffer: bytearray) -> bool:
+    """
+    Append the big endian representation of an integer ndarray to the buffer.
+    Returns False without writing anything if the array can not be converted
+    safely, so that the caller can fall back to the element by element encoding.
+
+    :param type_name: name of the integer type of the elements
+    :type type_name: str
+    :param value: array to encode
+    :type value: np.ndarray
+    :param buffer: buffer to append the encoded elements to
+    :type buffer: bytearray
+    :return: if the array was encoded
+    :rtype: bool
+    """
+    numpy = require_numpy("the NumPy encoding")
+    dtype = numpy.dtype(NUMPY_DTYPES[type_name])
+    if value.ndim != 1 or value.dtype.kind not in "iub":
+        return False
+    if value.size > 0:
+        limits = numpy.iinfo(dtype)
+        if value.min() < limits.min or value.max() > limits.max:
+            return False
+    buffer += value.astype(dtype, copy=False).tobytes()
+    return True
+
+
+def to_python_values(value: Any) -> List[Any]:
+    """
+    Convert an ndarray into a list of Python scalars
+
+    :param value: array to convert
+    :type value: np.ndarray
+    :return: converted values
+    :rtype: List[Any]
+    """
+    return value.tolist()
+
+
+def unwrap_single_array(values: Iterable[Any]) -> Iterable[Any]:
+    """
+    Return the Python values of the ndarray given as the only element of the values,
+    or the values themselves otherwise. The values of an endpoint variadic input
+    are the values left after the other inputs: the ndarray decoded for it in NumPy
+    mode is then the only one. The values are read lazily when they do not start
+    with an ndarray.
+
+    :param values: values of a variadic of integers
+    :type values: Iterable[Any]
+    :return: values to encode
+    :rtype: Iterable[Any]
+    """
+    values_iterator = iter(values)
+    first_value = next(values_iterator, MISSING_VALUE)
+    if first_value is MISSING_VALUE:
+        return ()
+    if not is_ndarray(first_value):
+        return chain((first_value,), values_iterator)
+    if next(values_iterator, MISSING_VALUE) is not MISSING_VALUE:
+        raise TypeError("An ndarray must hold all the values of a variadic of integers")
+    return to_python_values(first_value)
@@ -0,0 +1,156 @@
+"""
+author: Etienne Wallet
+
+This module contains the bulk decoding of transactions input data over a pool of
+processes. The serializer is sent once to each worker, the input data are sent by
+chunks and the results are streamed back in the order of the inputs.
+"""
+
+from __future__ import annotations
+from collections import deque
+from itertools import islice
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from mxpyserializer.abi_serializer import AbiSerializer
+    from mxpyserializer.input_data import InputDataFilter
+
+
+DecodedInputData = Tuple[str, List[Dict], List[Any]]
+
+# serializer of the current worker process, set by the pool initializer
+_WORKER_SERIALIZER = None
+
+
+def init_worker(serializer: AbiSerializer):
+    """
+    Store the serializer in the worker process
+
+    :param serializer: serializer to use in the worker
+    :type serializer: AbiSerializer
+    """
+    global _WORKER_SERIALIZER  # pylint: disable=global-statement
+    _WORKER_SERIALIZER = serializer
+
+
+def decode_chunk(
+    raw_inputs: List[str], input_filter: Optional[InputDataFilter] = None
+) -> List[Optional[DecodedInputData]]:
+    """
+    Decode a chunk of input data with the serializer of the worker process
+
+    :param raw_inputs: input data to decode
+    :type raw_inputs: List[str]
+    :param input_filter: filter checked on the input data before decoding them,
+        defaults to None
+    :type input_filter: Optional[InputDataFilter], optional
+    :return: decoded input data, in the same order, None for the input data that
+        do not match the filter
+    :rtype: List[Optional[DecodedInputData]]
+    """
+    decode = _WORKER_SERIALIZER.decode_endpoint_input_data
+    return [decode(d, input_filter=input_filter) for d in raw_inputs]
+
+
+def iter_chunks(values: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most chunk_size elements
+
+    :param values: values to split
+    :type values: Iterable[Any]
+    :param chunk_size: maximum number of elements in a chunk
+    :type chunk_size: int
+    :return: chunks of values
+    :rtype: Iterator[List[Any]]
+    """
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def decode_many_input_data(
+    serializer: AbiSerializer,
+    raw_inputs: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    max_pending_chunks: Optional[int] = None,
+    input_filter: Optional[InputDataFilter] = None,
+) -> Iterator[Optional[DecodedInputData]]:
+    """
+    Decode the input data of many transactions over a pool of processes. The inputs
+    are consumed lazily: at most max_pending_chunks chunks are submitted and not yet
+    yielded at any time, which bounds the memory used for large backfills.
+
+    :param serializer: serializer to use for the decoding
+    :type serializer: AbiSerializer
+    :param raw_inputs: full input data of the transactions (not b64 encoded)
+    :type raw_inputs: Iterable[str]
+    :param workers: number of worker processes, defaults to the number of CPUs.
+        With 0, the inputs are decoded in the current process
+    :type workers: Optional[int], optional
+    :param chunk_size: number of inputs sent to a worker at once, defaults to 1000
+    :type chunk_size: int, optional
+    :param max_pending_chunks: maximum number of chunks being decoded or waiting
+        to be yielded, defaults to twice the number of workers
+    :type max_pending_chunks: Optional[int], optional
+    :param input_filter: filter checked on the input data before decoding them,
+        defaults to None
+    :type input_filter: Optional[InputDataFilter], optional
+    :return: endpoint name, Esdt transfers and decoded inputs of each transaction,
+        in the order of the inputs, None for the transactions that do not match the
+        filter
+    :rtype: Iterator[Optional[DecodedInputData]]
+    """
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive, got {chunk_size}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 0:
+        for raw_input in raw_inputs:
+            yield serializer.decode_endpoint_input_data(
+                raw_input, input_filter=input_filter
+            )
+        return
+    if max_pending_chunks is None:
+        max_pending_chunks = 2 * workers
+    if max_pending_chunks < 1:
+        raise ValueError(
+            f"The maximum of pending chunks must be positive, got {max_pending_chunks}"
+        )
+
+    # the process pool machinery is only imported when workers are used
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = iter_chunks(raw_inputs, chunk_size)
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(serializer,)
+    ) as executor:
+        try:
+            for chunk in islice(chunks, max_pending_chunks):
+                pending.append(executor.submit(decode_chunk, chunk, input_filter))
+            while len(pending) > 0:
+                results = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(decode_chunk, chunk, input_filter))
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
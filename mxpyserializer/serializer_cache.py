@@ -0,0 +1,127 @@
+"""
+author: Etienne Wallet
+
+This module contains the on-disk cache of the parsed serializers. The parsed models
+and type trees of an ABI are stored in a pickle file named after the SHA-256 of the
+ABI content, the version of the package and the format of the cache, so that
+entries written by another version are never read. When an entry is written, the
+entries of the same ABI written by other versions or formats are removed, so that
+upgrades do not pile up stale files. The codec plans and the fields layouts are
+not stored: restoring them costs more than building them on first use.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+import hashlib
+import os
+from pathlib import Path
+import pickle  # nosec B403
+import tempfile
+from typing import Dict, Optional
+
+# bumped when the layout of the cached data changes within a package version
+CACHE_FORMAT = 1
+
+# version returned when the package is not installed, for which nothing is cached
+UNKNOWN_VERSION = "unknown"
+
+
+@lru_cache(maxsize=1)
+def get_package_version() -> str:
+    """
+    Return the installed version of the package. The version is read once per
+    process, as reading the package metadata is slower than loading an entry.
+
+    :return: version of the package, "unknown" if it is not installed
+    :rtype: str
+    """
+    # imported here as the metadata machinery is only needed by the cache
+    from importlib import metadata  # pylint: disable=import-outside-toplevel
+
+    try:
+        return metadata.version("mxpyserializer")
+    except metadata.PackageNotFoundError:
+        return UNKNOWN_VERSION
+
+
+def get_cache_path(cache_dir: Path, abi_content: bytes) -> Optional[Path]:
+    """
+    Return the path of the cache entry of an ABI. Without an installed version,
+    the entries of a modified package could not be told apart, so nothing is
+    cached.
+
+    :param cache_dir: directory of the cache
+    :type cache_dir: Path
+    :param abi_content: raw content of the ABI file
+    :type abi_content: bytes
+    :return: path of the cache entry, None if the package version is unknown
+    :rtype: Optional[Path]
+    """
+    version = get_package_version()
+    if version == UNKNOWN_VERSION:
+        return None
+    abi_hash = hashlib.sha256(abi_content).hexdigest()
+    return cache_dir / f"{abi_hash}-{version}-{CACHE_FORMAT}.pickle"
+
+
+def load_state(cache_path: Path) -> Optional[Dict]:
+    """
+    Load the state of a parsed serializer from a cache entry. Unreadable entries
+    are removed.
+
+    :param cache_path: path of the cache entry
+    :type cache_path: Path
+    :return: state of the parsed serializer, None if there is no valid entry
+    :rtype: Optional[Dict]
+    """
+    # the cache directory only contains entries written by this module
+    try:
+        with open(cache_path, "rb") as file:
+            state = pickle.load(file)  # nosec B301
+    except FileNotFoundError:
+        return None
+    except Exception:  # pylint: disable=broad-except
+        state = None
+    if not isinstance(state, dict):
+        cache_path.unlink(missing_ok=True)
+        return None
+    return state
+
+
+def store_state(cache_path: Path, state: Dict):
+    """
+    Write the state of a parsed serializer in a cache entry and remove the stale
+    entries of the same ABI. The entry is written in a temporary file first, so
+    that concurrent processes never read a partial entry.
+
+    :param cache_path: path of the cache entry
+    :type cache_path: Path
+    :param state: state of the parsed serializer
+    :type state: Dict
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=cache_path.parent, suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    except BaseException:
+        Path(temporary_path).unlink(missing_ok=True)
+        raise
+    remove_stale_entries(cache_path)
+
+
+def remove_stale_entries(cache_path: Path):
+    """
+    Remove the entries of the same ABI as a cache entry that were written by other
+    versions of the package or other formats of the cache
+
+    :param cache_path: path of the current cache entry
+    :type cache_path: Path
+    """
+    abi_hash = cache_path.name.split("-", 1)[0]
+    for entry_path in cache_path.parent.glob(f"{abi_hash}-*.pickle"):
+        if entry_path != cache_path:
+            entry_path.unlink(missing_ok=True)
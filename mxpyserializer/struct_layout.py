@@ -0,0 +1,429 @@
+"""
+author: Etienne Wallet
+
+This module contains the layouts of the fields of structs and enum variants.
+Consecutive fields with a fixed size (integers, booleans and addresses) are grouped
+into runs that are decoded and encoded with a single precompiled struct format.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+import struct
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from mxpyserializer import basic_type
+from mxpyserializer.data_models import AbiField
+from mxpyserializer.type_tree import BasicTypeNode, TypeNode
+
+if TYPE_CHECKING:
+    from mxpyserializer.abi_serializer import AbiSerializer
+
+
+# struct format characters of the basic types with a fixed nested encoding size
+FIXED_SIZE_FORMATS = {
+    "u8": "B",
+    "u16": "H",
+    "u32": "I",
+    "usize": "I",
+    "u64": "Q",
+    "i8": "b",
+    "i16": "h",
+    "i32": "i",
+    "isize": "i",
+    "i64": "q",
+    "bool": "B",
+    "Address": "32s",
+}
+
+
+def decode_bool(value: int) -> bool:
+    """
+    Convert an unpacked byte into a boolean
+
+    :param value: unpacked byte
+    :type value: int
+    :return: boolean value
+    :rtype: bool
+    """
+    if value not in (0, 1):
+        raise ValueError(f"Expected a boolean but found the value {value}")
+    return bool(value)
+
+
+def encode_bool(value: Any) -> int:
+    """
+    Convert a boolean into the byte to pack
+
+    :param value: boolean value
+    :type value: Any
+    :return: byte to pack
+    :rtype: int
+    """
+    int_value = int(value)
+    if int_value not in (0, 1):
+        raise ValueError(f"Expected a boolean but found the value {value}")
+    return int_value
+
+
+DECODE_CONVERTERS = {"bool": decode_bool}
+ENCODE_CONVERTERS = {"bool": encode_bool, "Address": basic_type.encode_address}
+
+
+@dataclass(frozen=True)
+class FixedFieldsRun:
+    """
+    Consecutive fields with a fixed size, decoded and encoded with a single
+    precompiled struct format
+    """
+
+    nodes: Tuple[BasicTypeNode, ...]
+    codec: struct.Struct = field(init=False, repr=False, compare=False)
+    zeros: bytes = field(init=False, repr=False, compare=False)
+    decode_converters: Tuple[Tuple[int, Callable], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    encode_converters: Tuple[Tuple[int, Callable], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    address_indexes: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    # position of each field relative to the start of the run
+    field_offsets: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        type_names = [node.name for node in self.nodes]
+        formats = [FIXED_SIZE_FORMATS[t] for t in type_names]
+        codec = struct.Struct(">" + "".join(formats))
+        object.__setattr__(self, "codec", codec)
+        object.__setattr__(
+            self,
+            "field_offsets",
+            tuple(
+                struct.calcsize(">" + "".join(formats[:i])) for i in range(len(formats))
+            ),
+        )
+        object.__setattr__(self, "zeros", bytes(codec.size))
+        object.__setattr__(
+            self,
+            "decode_converters",
+            tuple(
+                (i, DECODE_CONVERTERS[t])
+                for i, t in enumerate(type_names)
+                if t in DECODE_CONVERTERS
+            ),
+        )
+        object.__setattr__(
+            self,
+            "address_indexes",
+            tuple(i for i, t in enumerate(type_names) if t == "Address"),
+        )
+        object.__setattr__(
+            self,
+            "encode_converters",
+            tuple(
+                (i, ENCODE_CONVERTERS[t])
+                for i, t in enumerate(type_names)
+                if t in ENCODE_CONVERTERS
+            ),
+        )
+
+    def __reduce__(self):
+        # the precompiled struct format can not be pickled, it is rebuilt instead
+        return self.__class__, (self.nodes,)
+
+    def decode_into(
+        self,
+        serializer: AbiSerializer,
+        data: memoryview,
+        offset: int,
+        values: List[Any],
+    ) -> int:
+        """
+        Decode the fields of the run and append their values to the given list
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the values to extract
+        :type data: memoryview
+        :param offset: position of the first field of the run
+        :type offset: int
+        :param values: list to append the decoded values to
+        :type values: List[Any]
+        :return: offset following the run
+        :rtype: int
+        """
+        try:
+            decoded_values = self.codec.unpack_from(data, offset)
+        except struct.error:
+            # not enough data: let the field by field decoding raise the error
+            for node in self.nodes:
+                value, offset = node.nested_decode_at(serializer, data, offset)
+                values.append(value)
+            return offset
+        if self.decode_converters or self.address_indexes:
+            decoded_values = list(decoded_values)
+            for i, converter in self.decode_converters:
+                decoded_values[i] = converter(decoded_values[i])
+            if self.address_indexes:
+                converter = basic_type.get_address_converter(serializer.address_format)
+                for i in self.address_indexes:
+                    decoded_values[i] = converter(decoded_values[i])
+        values.extend(decoded_values)
+        return offset + self.codec.size
+
+    def encode_into(
+        self, serializer: AbiSerializer, values: Sequence[Any], buffer: bytearray
+    ):
+        """
+        Encode the values of the fields of the run and append them to the buffer
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param values: values of the fields of the run, in order
+        :type values: Sequence[Any]
+        :param buffer: buffer to append the encoded values to
+        :type buffer: bytearray
+        """
+        prepared_values = list(values)
+        for i, converter in self.encode_converters:
+            prepared_values[i] = converter(prepared_values[i])
+        start = len(buffer)
+        buffer += self.zeros
+        try:
+            self.codec.pack_into(buffer, start, *prepared_values)
+        except struct.error:
+            # out of range or non integer value: let the field by field encoding
+            # handle the conversion or raise the detailed error
+            del buffer[start:]
+            for node, value in zip(self.nodes, values):
+                node.nested_encode_into(serializer, value, buffer)
+
+
+@dataclass(frozen=True)
+class FieldsLayout:
+    """
+    Layout of the fields of a struct or of an enum variant
+    """
+
+    names: Tuple[str, ...]
+    segments: Tuple[Union[FixedFieldsRun, TypeNode], ...]
+    # node of each field and index of each field name, for the lazy decoding
+    field_nodes: Tuple[TypeNode, ...] = field(init=False, repr=False, compare=False)
+    indexes: Dict[str, int] = field(init=False, repr=False, compare=False)
+    # size of each segment, None for the segments with a variable size
+    segment_sizes: Tuple[Optional[int], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # total size of the fields, when all of them have a fixed size
+    static_size: Optional[int] = field(init=False, repr=False, compare=False)
+    # segment of each field and position of the field in its segment. When all the
+    # fields have a fixed size, they are all located from the first field.
+    field_locations: Tuple[Tuple[int, int], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        field_nodes = []
+        segment_sizes = []
+        field_locations = []
+        for i, segment in enumerate(self.segments):
+            if isinstance(segment, FixedFieldsRun):
+                field_nodes.extend(segment.nodes)
+                segment_sizes.append(segment.codec.size)
+                field_locations.extend((i, o) for o in segment.field_offsets)
+            else:
+                field_nodes.append(segment)
+                segment_sizes.append(None)
+                field_locations.append((i, 0))
+        static_size = None
+        if None not in segment_sizes:
+            static_size = sum(segment_sizes)
+            segment_starts = [sum(segment_sizes[:i]) for i in range(len(segment_sizes))]
+            field_locations = [(0, segment_starts[i] + o) for i, o in field_locations]
+        object.__setattr__(self, "field_nodes", tuple(field_nodes))
+        object.__setattr__(self, "indexes", {n: i for i, n in enumerate(self.names)})
+        object.__setattr__(self, "segment_sizes", tuple(segment_sizes))
+        object.__setattr__(self, "static_size", static_size)
+        object.__setattr__(self, "field_locations", tuple(field_locations))
+
+    def decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[List[Any], int]:
+        """
+        Decode the values of the fields, in order
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the values to extract
+        :type data: memoryview
+        :param offset: position of the first field in the data
+        :type offset: int
+        :return: decoded values and the offset following them
+        :rtype: Tuple[List[Any], int]
+        """
+        values = []
+        for segment in self.segments:
+            if isinstance(segment, FixedFieldsRun):
+                offset = segment.decode_into(serializer, data, offset, values)
+            else:
+                value, offset = segment.nested_decode_at(serializer, data, offset)
+                values.append(value)
+        return values, offset
+
+    def check_end(self, data: memoryview, start: int, end: int):
+        """
+        Check that the data holds the fields located between two offsets
+
+        :param data: data containing the fields
+        :type data: memoryview
+        :param start: position of the first field in the data
+        :type start: int
+        :param end: offset following the fields
+        :type end: int
+        """
+        if len(data) < end:
+            raise ValueError(
+                f"Not enough data to skip the fields {self.names}: expected at least "
+                f"{end - start} bytes but got {len(data) - start}"
+            )
+
+    def skip_at(self, serializer: AbiSerializer, data: memoryview, offset: int) -> int:
+        """
+        Return the offset following the fields, without decoding them
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the fields to skip
+        :type data: memoryview
+        :param offset: position of the first field in the data
+        :type offset: int
+        :return: offset following the fields
+        :rtype: int
+        """
+        start = offset
+        if self.static_size is not None:
+            offset += self.static_size
+        else:
+            for segment, size in zip(self.segments, self.segment_sizes):
+                if size is None:
+                    offset = segment.nested_skip_at(serializer, data, offset)
+                else:
+                    offset += size
+        self.check_end(data, start, offset)
+        return offset
+
+    def get_static_size(self, serializer: AbiSerializer) -> Optional[int]:
+        """
+        Return the total size of the fields when it does not depend on their values,
+        including the fields of nested custom types and arrays with a static size
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :return: size of the fields, None if it depends on their values
+        :rtype: Optional[int]
+        """
+        if self.static_size is not None:
+            return self.static_size
+        total_size = 0
+        for segment, size in zip(self.segments, self.segment_sizes):
+            if size is None:
+                size = segment.get_static_size(serializer)
+                if size is None:
+                    return None
+            total_size += size
+        return total_size
+
+    def locate_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[List[int], int]:
+        """
+        Return the positions of the segments of fields, without decoding them. The
+        position of a field is the position of its segment plus its position in the
+        segment, as given by field_locations.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the fields
+        :type data: memoryview
+        :param offset: position of the first field in the data
+        :type offset: int
+        :return: positions of the segments and the offset following them
+        :rtype: Tuple[List[int], int]
+        """
+        start = offset
+        if self.static_size is not None:
+            offset += self.static_size
+            self.check_end(data, start, offset)
+            return [start], offset
+        segment_starts = []
+        for segment, size in zip(self.segments, self.segment_sizes):
+            segment_starts.append(offset)
+            if size is None:
+                offset = segment.nested_skip_at(serializer, data, offset)
+            else:
+                offset += size
+        self.check_end(data, start, offset)
+        return segment_starts, offset
+
+    def encode_into(
+        self, serializer: AbiSerializer, values: Sequence[Any], buffer: bytearray
+    ):
+        """
+        Encode the values of the fields, given in order, and append them to the
+        buffer
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param values: values of the fields, in order
+        :type values: Sequence[Any]
+        :param buffer: buffer to append the encoded values to
+        :type buffer: bytearray
+        """
+        index = 0
+        for segment in self.segments:
+            if isinstance(segment, FixedFieldsRun):
+                next_index = index + len(segment.nodes)
+                segment.encode_into(serializer, values[index:next_index], buffer)
+                index = next_index
+            else:
+                segment.nested_encode_into(serializer, values[index], buffer)
+                index += 1
+
+
+def build_fields_layout(
+    fields: Sequence[AbiField], get_type_node: Callable[[str], TypeNode]
+) -> FieldsLayout:
+    """
+    Build the layout of a sequence of fields by grouping the consecutive fields
+    with a fixed size into runs
+
+    :param fields: fields of a struct or of an enum variant
+    :type fields: Sequence[AbiField]
+    :param get_type_node: function returning the type tree of a type name
+    :type get_type_node: Callable[[str], TypeNode]
+    :return: layout of the fields
+    :rtype: FieldsLayout
+    """
+    segments = []
+    run = []
+    for abi_field in fields:
+        node = get_type_node(abi_field.type)
+        if isinstance(node, BasicTypeNode) and node.name in FIXED_SIZE_FORMATS:
+            run.append(node)
+            continue
+        if len(run) > 0:
+            segments.append(FixedFieldsRun(tuple(run)))
+            run = []
+        segments.append(node)
+    if len(run) > 0:
+        segments.append(FixedFieldsRun(tuple(run)))
+    return FieldsLayout(names=tuple(f.name for f in fields), segments=tuple(segments))
@@ -0,0 +1,874 @@
+"""
+author: Etienne Wallet
+
+This module contains the type tree used by the serializer: ABI type strings such as
+List<Option<u32>> are parsed once into a tree of nodes, and each node knows how to
+encode and decode the values of its type.
+"""
+
+from __future__ import annotations
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import zip_longest
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Container,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from mxpyserializer import basic_type, errors, numpy_codec
+
+if TYPE_CHECKING:
+    from mxpyserializer.abi_serializer import AbiSerializer
+
+
+# fills the last group of a streamed variadic<multi<...>> when parts are missing
+MISSING_PART = object()
+
+
+@dataclass(frozen=True)
+class TypeNode:
+    """
+    Base class of the type tree. Each node corresponds to an ABI type string.
+    By default, a node can only be nested encoded or decoded and the top encoding
+    relies on the nested encoding.
+    """
+
+    name: str
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[Any, int]:
+        """
+        Decodes a part of the input data assuming a nested-encoded
+        format, starting at the given offset. Returns the offset of the left over.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the value to extract
+        :type data: memoryview
+        :param offset: position of the value in the data
+        :type offset: int
+        :return: decoded value and the offset following it
+        :rtype: Tuple[Any, int]
+        """
+        raise errors.UnknownType(self.name)
+
+    def nested_skip_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> int:
+        """
+        Return the offset following a nested encoded value, without building the
+        value when the type allows it. By default, the value is decoded and
+        discarded.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the value to skip
+        :type data: memoryview
+        :param offset: position of the value in the data
+        :type offset: int
+        :return: offset following the value
+        :rtype: int
+        """
+        return self.nested_decode_at(serializer, data, offset)[1]
+
+    # pylint: disable-next=unused-argument
+    def get_static_size(self, serializer: AbiSerializer) -> Optional[int]:
+        """
+        Return the nested encoding size shared by all the values of the type, or
+        None if the size depends on the value
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :return: size of the nested encoded values
+        :rtype: Optional[int]
+        """
+        return None
+
+    def nested_encode(self, serializer: AbiSerializer, value: Any) -> bytes:
+        """
+        Encode the input value assuming a nested-encoded format.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param value: value to encode
+        :type value: Any
+        :return: encoded value
+        :rtype: bytes
+        """
+        buffer = bytearray()
+        self.nested_encode_into(serializer, value, buffer)
+        return bytes(buffer)
+
+    def nested_encode_into(
+        self, serializer: AbiSerializer, value: Any, buffer: bytearray
+    ):
+        """
+        Encode the input value assuming a nested-encoded format and append it
+        to the given buffer.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param value: value to encode
+        :type value: Any
+        :param buffer: buffer to append the encoded value to
+        :type buffer: bytearray
+        """
+        raise errors.UnknownType(self.name)
+
+    def top_decode(
+        self, serializer: AbiSerializer, data: Union[List[bytes], bytes, None]
+    ) -> Any:
+        """
+        Decodes the input data assuming a top-encoded format
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the value to extract
+        :type data: Union[List[bytes], bytes, None]
+        :return: decoded value
+        :rtype: Any
+        """
+        if isinstance(data, list):
+            # at this point, the data should not be a list of bytes
+            if len(data) == 0:
+                data = None
+            elif len(data) == 1:
+                data = data[0]
+            else:
+                raise TypeError(f"Data should not be a list for type {self.name}")
+        return self.top_decode_bytes(serializer, data)
+
+    def top_decode_bytes(self, serializer: AbiSerializer, data: bytes) -> Any:
+        """
+        Decodes a single top-encoded part. For most of the types, the top encoding
+        is the same as the nested encoding, provided that all the data is consumed.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the value to extract
+        :type data: bytes
+        :return: decoded value
+        :rtype: Any
+        """
+        data = memoryview(data)
+        result, offset = self.nested_decode_at(serializer, data, 0)
+        if offset != len(data):
+            raise errors.LeftOverData(bytes(data[offset:]))
+        return result
+
+    def iter_top_decode(
+        self, serializer: AbiSerializer, data: Union[Iterable[bytes], bytes, None]
+    ) -> Iterator[Any]:
+        """
+        Decodes the elements of a top encoded collection one by one, as they are
+        consumed. Only defined for the List and variadic types.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: data containing the values to extract
+        :type data: Union[Iterable[bytes], bytes, None]
+        :return: iterator over the decoded elements
+        :rtype: Iterator[Any]
+        """
+        raise TypeError(f"Type {self.name} can not be decoded element by element")
+
+    def top_encode(
+        self, serializer: AbiSerializer, value: Any
+    ) -> Union[bytes, List[bytes], None]:
+        """
+        Encode the input data assuming a top-encoded format
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param value: value to encode
+        :type value: Any
+        :return: encoded value (None if no encoding, for optional value for example)
+        :rtype: Union[bytes, List[bytes], None]
+        """
+        return self.nested_encode(serializer, value)
+
+    def top_encode_into(self, serializer: AbiSerializer, value: Any, buffer: bytearray):
+        """
+        Encode the input value assuming a top-encoded format and append it to the
+        given buffer. Only defined for the types encoded as a single part.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param value: value to encode
+        :type value: Any
+        :param buffer: buffer to append the encoded value to
+        :type buffer: bytearray
+        """
+        self.nested_encode_into(serializer, value, buffer)
+
+
+@dataclass(frozen=True)
+class BasicTypeNode(TypeNode):
+    """
+    Node of a basic type (integers, strings, addresses, ...)
+    """
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[Any, int]:
+        return basic_type.nested_decode_basic_at(self.name, data, offset)
+
+    def nested_skip_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> int:
+        return basic_type.nested_skip_basic_at(self.name, data, offset)
+
+    def get_static_size(self, serializer: AbiSerializer) -> Optional[int]:
+        return basic_type.get_fixed_size(self.name)
+
+    def nested_encode_into(
+        self, serializer: AbiSerializer, value: Any, buffer: bytearray
+    ):
+        basic_type.nested_encode_basic_into(self.name, value, buffer)
+
+    def top_decode_bytes(self, serializer: AbiSerializer, data: bytes) -> Any:
+        return basic_type.top_decode_basic(self.name, data)
+
+    def top_encode(self, serializer: AbiSerializer, value: Any) -> bytes:
+        return basic_type.top_encode_basic(self.name, value)
+
+    def top_encode_into(self, serializer: AbiSerializer, value: Any, buffer: bytearray):
+        buffer += basic_type.top_encode_basic(self.name, value)
+
+
+@dataclass(frozen=True)
+class AddressTypeNode(BasicTypeNode):
+    """
+    Node of the Address type: the decoded value follows the address format
+    of the serializer
+    """
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[Any, int]:
+        if serializer.address_format == "bech32":
+            return basic_type.nested_decode_basic_at(self.name, data, offset)
+        end = offset + 32
+        converter = basic_type.get_address_converter(serializer.address_format)
+        return converter(bytes(data[offset:end])), end
+
+    def top_decode_bytes(self, serializer: AbiSerializer, data: bytes) -> Any:
+        if serializer.address_format == "bech32":
+            return basic_type.top_decode_basic(self.name, data)
+        converter = basic_type.get_address_converter(serializer.address_format)
+        return converter(bytes(data))
+
+
+@dataclass(frozen=True)
+class ListTypeNode(TypeNode):
+    """
+    Node of a List<T> type: nested encoded elements prefixed by their number (u32)
+    """
+
+    inner: TypeNode
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[List[Any], int]:
+        list_size, offset = basic_type.nested_decode_basic_at("u32", data, offset)
+        if serializer.numpy_mode and self.inner.name in numpy_codec.NUMPY_DTYPES:
+            array = numpy_codec.decode_array_at(
+                self.inner.name, data, offset, list_size
+            )
+            if array is not None:
+                return array, offset + array.nbytes
+        inner_decode = self.inner.nested_decode_at
+        decoded_values = []
+        for _ in range(list_size):
+            result, offset = inner_decode(serializer, data, offset)
+            decoded_values.append(result)
+        return decoded_values, offset
+
+    def nested_skip_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> int:
+        list_size, offset = basic_type.nested_decode_basic_at("u32", data, offset)
+        return skip_elements(serializer, self, data, offset, list_size)
+
+    def nested_encode_into(
+        self, serializer: AbiSerializer, value: Any, buffer: bytearray
+    ):
+        if not isinstance(value, Iterable):
+            raise TypeError("Value to encode must be an iterable for List type")
+        basic_type.nested_encode_basic_into("u32", len(value), buffer)
+        encode_elements_into(serializer, self.inner, value, buffer)
+
+    def top_decode_bytes(self, serializer: AbiSerializer, data: bytes) -> List[Any]:
+        data = memoryview(data)
+        data_length = len(data)
+        if serializer.numpy_mode and self.inner.name in numpy_codec.NUMPY_DTYPES:
+            count, remainder = divmod(
+                data_length, numpy_codec.get_item_size(self.inner.name)
+            )
+            if remainder == 0:
+                return numpy_codec.decode_array_at(self.inner.name, data, 0, count)
+        inner_decode = self.inner.nested_decode_at
+        decoded_values = []
+        offset = 0
+        while offset < data_length:
+            result, offset = inner_decode(serializer, data, offset)
+            decoded_values.append(result)
+        return decoded_values
+
+    def iter_top_decode(
+        self, serializer: AbiSerializer, data: Union[Iterable[bytes], bytes, None]
+    ) -> Iterator[Any]:
+        if isinstance(data, list):
+            if len(data) > 1:
+                raise TypeError(f"Data should not be a list for type {self.name}")
+            data = data[0] if len(data) == 1 else None
+        data = memoryview(b"" if data is None else data)
+        data_length = len(data)
+        inner_decode = self.inner.nested_decode_at
+        offset = 0
+        while offset < data_length:
+            result, offset = inner_decode(serializer, data, offset)
+            yield result
+
+    def top_encode(self, serializer: AbiSerializer, value: Any) -> bytes:
+        if not isinstance(value, Iterable):
+            raise TypeError("Value to encode must be an iterable for List type")
+        buffer = bytearray()
+        encode_elements_into(serializer, self.inner, value, buffer)
+        return bytes(buffer)
+
+    def top_encode_into(self, serializer: AbiSerializer, value: Any, buffer: bytearray):
+        if not isinstance(value, Iterable):
+            raise TypeError("Value to encode must be an iterable for List type")
+        encode_elements_into(serializer, self.inner, value, buffer)
+
+
+@dataclass(frozen=True)
+class ArrayTypeNode(TypeNode):
+    """
+    Node of an arrayN<T> type: N nested encoded elements
+    """
+
+    size: int
+    inner: TypeNode
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[List[Any], int]:
+        if serializer.numpy_mode and self.inner.name in numpy_codec.NUMPY_DTYPES:
+            array = numpy_codec.decode_array_at(
+                self.inner.name, data, offset, self.size
+            )
+            if array is not None:
+                return array, offset + array.nbytes
+        inner_decode = self.inner.nested_decode_at
+        decoded_values = []
+        for _ in range(self.size):
+            result, offset = inner_decode(serializer, data, offset)
+            decoded_values.append(result)
+        return decoded_values, offset
+
+    def nested_skip_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> int:
+        return skip_elements(serializer, self, data, offset, self.size)
+
+    def get_static_size(self, serializer: AbiSerializer) -> Optional[int]:
+        # pylint: disable-next=assignment-from-none
+        inner_size = self.inner.get_static_size(serializer)
+        return None if inner_size is None else self.size * inner_size
+
+    def nested_encode_into(
+        self, serializer: AbiSerializer, value: Any, buffer: bytearray
+    ):
+        if not isinstance(value, Iterable):
+            raise TypeError("Value to encode must be an iterable for array type")
+        if len(value) != self.size:
+            raise errors.ElementsNumberMismatch(value, self.size * [self.inner.name])
+        encode_elements_into(serializer, self.inner, value, buffer)
+
+
+@dataclass(frozen=True)
+class TupleTypeNode(TypeNode):
+    """
+    Node of a tuple<T1, T2, ...> type: nested encoded elements of different types
+    """
+
+    inners: Tuple[TypeNode, ...]
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[List[Any], int]:
+        decoded_values = []
+        for inner in self.inners:
+            result, offset = inner.nested_decode_at(serializer, data, offset)
+            decoded_values.append(result)
+        return decoded_values, offset
+
+    def nested_skip_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> int:
+        for inner in self.inners:
+            offset = inner.nested_skip_at(serializer, data, offset)
+        return offset
+
+    def get_static_size(self, serializer: AbiSerializer) -> Optional[int]:
+        total_size = 0
+        for inner in self.inners:
+            inner_size = inner.get_static_size(serializer)
+            if inner_size is None:
+                return None
+            total_size += inner_size
+        return total_size
+
+    def nested_encode_into(
+        self, serializer: AbiSerializer, value: Any, buffer: bytearray
+    ):
+        if not isinstance(value, Iterable):
+            raise TypeError("Value to encode must be an iterable for tuple type")
+        if len(value) != len(self.inners):
+            raise errors.ElementsNumberMismatch(value, [i.name for i in self.inners])
+        for inner, inner_value in zip(self.inners, value):
+            inner.nested_encode_into(serializer, inner_value, buffer)
+
+
+@dataclass(frozen=True)
+class OptionTypeNode(TypeNode):
+    """
+    Node of an Option<T> type: a boolean flag followed by the value if any
+    """
+
+    inner: TypeNode
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[Any, int]:
+        is_some, offset = basic_type.nested_decode_basic_at("bool", data, offset)
+        if is_some:
+            return self.inner.nested_decode_at(serializer, data, offset)
+        return None, offset
+
+    def nested_skip_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> int:
+        is_some, offset = basic_type.nested_decode_basic_at("bool", data, offset)
+        if is_some:
+            return self.inner.nested_skip_at(serializer, data, offset)
+        return offset
+
+    def nested_encode_into(
+        self, serializer: AbiSerializer, value: Any, buffer: bytearray
+    ):
+        if value is None:
+            buffer.append(0)
+        else:
+            buffer.append(1)
+            self.inner.nested_encode_into(serializer, value, buffer)
+
+    def top_decode_bytes(self, serializer: AbiSerializer, data: bytes) -> Any:
+        if len(data) == 0:
+            return None
+        return super().top_decode_bytes(serializer, data)
+
+    def top_encode(self, serializer: AbiSerializer, value: Any) -> bytes:
+        if value is None:
+            return bytes()
+        return self.nested_encode(serializer, value)
+
+    def top_encode_into(self, serializer: AbiSerializer, value: Any, buffer: bytearray):
+        if value is not None:
+            self.nested_encode_into(serializer, value, buffer)
+
+
+@dataclass(frozen=True)
+class OptionalTypeNode(TypeNode):
+    """
+    Node of an optional<T> type: a top level argument or result that can be omitted
+    """
+
+    inner: TypeNode
+
+    def top_decode(
+        self, serializer: AbiSerializer, data: Union[List[bytes], bytes, None]
+    ) -> Any:
+        if isinstance(data, list) and len(data) > 1:
+            return self.inner.top_decode(serializer, data)
+        return super().top_decode(serializer, data)
+
+    def top_decode_bytes(self, serializer: AbiSerializer, data: bytes) -> Any:
+        if data is None or len(data) == 0:
+            return None
+        return self.inner.top_decode(serializer, data)
+
+    def top_encode(
+        self, serializer: AbiSerializer, value: Any
+    ) -> Union[bytes, List[bytes], None]:
+        if value is None:
+            return None
+        if isinstance(value, (list, tuple)):
+            if len(value) == 0:
+                return None
+            value = value[0]
+        return self.inner.top_encode(serializer, value)
+
+
+@dataclass(frozen=True)
+class MultiTypeNode(TypeNode):
+    """
+    Node of a multi<T1, T2, ...> type: several top encoded values
+    """
+
+    inners: Tuple[TypeNode, ...]
+
+    def top_decode(
+        self, serializer: AbiSerializer, data: Union[List[bytes], bytes, None]
+    ) -> List[Any]:
+        if not isinstance(data, list) or len(data) != len(self.inners):
+            raise errors.MultiElementsNumberMismatch(
+                data if isinstance(data, list) else [data],
+                [i.name for i in self.inners],
+            )
+        return [
+            inner.top_decode(serializer, inner_data)
+            for inner, inner_data in zip(self.inners, data)
+        ]
+
+    def top_decode_sequence(
+        self, serializer: AbiSerializer, data: List[bytes]
+    ) -> List[List[Any]]:
+        """
+        Decodes a sequence of multi values, as found in a variadic<multi<...>>
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: top encoded parts of all the multi values
+        :type data: List[bytes]
+        :return: decoded multi values
+        :rtype: List[List[Any]]
+        """
+        multi_size = len(self.inners)
+        if len(data) % multi_size != 0:
+            raise errors.MultiElementsNumberMismatch(
+                data, [i.name for i in self.inners]
+            )
+        # each multi value is read from consecutive parts, without slicing the data
+        inners = self.inners
+        data_iterator = iter(data)
+        return [
+            [
+                inner.top_decode(serializer, inner_data)
+                for inner, inner_data in zip(inners, multi_data)
+            ]
+            for multi_data in zip(*[data_iterator] * multi_size)
+        ]
+
+    def iter_top_decode_sequence(
+        self, serializer: AbiSerializer, data: Iterable[bytes]
+    ) -> Iterator[List[Any]]:
+        """
+        Decodes a sequence of multi values one by one, as they are consumed. The
+        parts are grouped as they are read, so the data can be any iterable.
+
+        :param serializer: serializer holding the custom types definitions
+        :type serializer: AbiSerializer
+        :param data: top encoded parts of all the multi values
+        :type data: Iterable[bytes]
+        :return: iterator over the decoded multi values
+        :rtype: Iterator[List[Any]]
+        """
+        inners = self.inners
+        data_iterator = iter(data)
+        for multi_data in zip_longest(
+            *[data_iterator] * len(inners), fillvalue=MISSING_PART
+        ):
+            if multi_data[-1] is MISSING_PART:
+                raise errors.MultiElementsNumberMismatch(
+                    [d for d in multi_data if d is not MISSING_PART],
+                    [i.name for i in inners],
+                )
+            yield [
+                inner.top_decode(serializer, inner_data)
+                for inner, inner_data in zip(inners, multi_data)
+            ]
+
+    def top_encode(self, serializer: AbiSerializer, value: Any) -> List[bytes]:
+        if not isinstance(value, Iterable):
+            raise TypeError("Value to encode must be an iterable for multi type")
+        if len(value) != len(self.inners):
+            raise errors.ElementsNumberMismatch(value, [i.name for i in self.inners])
+        return [
+            inner.top_encode(serializer, inner_value)
+            for inner, inner_value in zip(self.inners, value)
+        ]
+
+
+@dataclass(frozen=True)
+class VariadicTypeNode(TypeNode):
+    """
+    Node of a variadic<T> type: any number of top encoded values
+    """
+
+    inner: TypeNode
+
+    def top_decode(
+        self, serializer: AbiSerializer, data: Union[List[bytes], bytes, None]
+    ) -> List[Any]:
+        if not isinstance(data, list):
+            return super().top_decode(serializer, data)
+        inner = self.inner
+        if isinstance(inner, MultiTypeNode):
+            return inner.top_decode_sequence(serializer, data)
+        decoded_values = [inner.top_decode(serializer, sd) for sd in data]
+        if serializer.numpy_mode and inner.name in numpy_codec.NUMPY_DTYPES:
+            return numpy_codec.to_array(inner.name, decoded_values)
+        return decoded_values
+
+    def iter_top_decode(
+        self, serializer: AbiSerializer, data: Union[Iterable[bytes], bytes, None]
+    ) -> Iterator[Any]:
+        if data is None:
+            return
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = [data]
+        inner = self.inner
+        if isinstance(inner, MultiTypeNode):
+            yield from inner.iter_top_decode_sequence(serializer, data)
+            return
+        inner_decode = inner.top_decode
+        for inner_data in data:
+            yield inner_decode(serializer, inner_data)
+
+    def top_encode(self, serializer: AbiSerializer, value: Any) -> List[bytes]:
+        if not isinstance(value, Iterable):
+            raise TypeError("Value to encode must be an iterable for variadic type")
+        if numpy_codec.is_ndarray(value):
+            value = numpy_codec.to_python_values(value)
+        elif self.inner.name in numpy_codec.NUMPY_DTYPES:
+            # the values left to an endpoint variadic input can be a single ndarray
+            value = numpy_codec.unwrap_single_array(value)
+        encoded_value = []
+        if isinstance(self.inner, MultiTypeNode):
+            for multi in value:
+                encoded_value.extend(self.inner.top_encode(serializer, multi))
+        else:
+            for inner_value in value:
+                encoded_value.append(self.inner.top_encode(serializer, inner_value))
+        return encoded_value
+
+
+@dataclass(frozen=True)
+class StructTypeNode(TypeNode):
+    """
+    Node of a custom struct defined in the ABI
+    """
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[Any, int]:
+        return serializer.decode_custom_struct_at(self.name, data, offset)
+
+    def nested_skip_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> int:
+        static_size = serializer.get_static_size(self.name)
+        if static_size is not None:
+            return basic_type.check_skipped_size(self.name, data, offset, static_size)
+        return serializer.get_struct_layout(self.name).skip_at(serializer, data, offset)
+
+    def get_static_size(self, serializer: AbiSerializer) -> Optional[int]:
+        return serializer.get_static_size(self.name)
+
+    def nested_encode_into(
+        self, serializer: AbiSerializer, value: Any, buffer: bytearray
+    ):
+        serializer.encode_custom_struct_into(self.name, value, buffer)
+
+
+@dataclass(frozen=True)
+class EnumTypeNode(TypeNode):
+    """
+    Node of a custom enum defined in the ABI
+    """
+
+    def nested_decode_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> Tuple[Any, int]:
+        return serializer.decode_custom_enum_at(self.name, data, offset)
+
+    def nested_skip_at(
+        self, serializer: AbiSerializer, data: memoryview, offset: int
+    ) -> int:
+        static_size = serializer.get_static_size(self.name)
+        if static_size is not None and offset < len(data):
+            return basic_type.check_skipped_size(self.name, data, offset, static_size)
+        return serializer.skip_custom_enum_at(self.name, data, offset)
+
+    def get_static_size(self, serializer: AbiSerializer) -> Optional[int]:
+        return serializer.get_static_size(self.name)
+
+    def nested_encode_into(
+        self, serializer: AbiSerializer, value: Any, buffer: bytearray
+    ):
+        serializer.encode_custom_enum_into(self.name, value, buffer)
+
+    def top_encode(self, serializer: AbiSerializer, value: Any) -> bytes:
+        return serializer.encode_custom_enum(self.name, value, True)
+
+    def top_encode_into(self, serializer: AbiSerializer, value: Any, buffer: bytearray):
+        serializer.encode_custom_enum_into(self.name, value, buffer, True)
+
+
+def skip_elements(
+    serializer: AbiSerializer,
+    node: Union[ListTypeNode, ArrayTypeNode],
+    data: memoryview,
+    offset: int,
+    count: int,
+) -> int:
+    """
+    Return the offset following consecutive nested encoded elements of a List or an
+    array. Elements with a static size are jumped over at once.
+
+    :param serializer: serializer holding the custom types definitions
+    :type serializer: AbiSerializer
+    :param node: node of the List or of the array
+    :type node: Union[ListTypeNode, ArrayTypeNode]
+    :param data: data containing the elements to skip
+    :type data: memoryview
+    :param offset: position of the first element in the data
+    :type offset: int
+    :param count: number of elements to skip
+    :type count: int
+    :return: offset following the elements
+    :rtype: int
+    """
+    inner = node.inner
+    inner_size = inner.get_static_size(serializer)
+    if inner_size is not None:
+        return basic_type.check_skipped_size(
+            node.name, data, offset, count * inner_size
+        )
+    inner_skip = inner.nested_skip_at
+    for _ in range(count):
+        offset = inner_skip(serializer, data, offset)
+    return offset
+
+
+SINGLE_ARGUMENT_GENERICS = {
+    "List": ListTypeNode,
+    "Option": OptionTypeNode,
+    "optional": OptionalTypeNode,
+    "variadic": VariadicTypeNode,
+}
+
+MULTI_ARGUMENTS_GENERICS = {
+    "tuple": TupleTypeNode,
+    "multi": MultiTypeNode,
+}
+
+
+def encode_elements_into(
+    serializer: AbiSerializer,
+    inner: TypeNode,
+    values: Iterable[Any],
+    buffer: bytearray,
+):
+    """
+    Encode values of the same type as a concatenation of nested encoded elements
+    and append them to the given buffer. Integer ndarrays are written in one go.
+
+    :param serializer: serializer holding the custom types definitions
+    :type serializer: AbiSerializer
+    :param inner: type of the elements
+    :type inner: TypeNode
+    :param values: values to encode
+    :type values: Iterable[Any]
+    :param buffer: buffer to append the encoded values to
+    :type buffer: bytearray
+    """
+    if numpy_codec.is_ndarray(values):
+        if inner.name in numpy_codec.NUMPY_DTYPES and numpy_codec.encode_array_into(
+            inner.name, values, buffer
+        ):
+            return
+        values = numpy_codec.to_python_values(values)
+    inner_encode = inner.nested_encode_into
+    for value in values:
+        inner_encode(serializer, value, buffer)
+
+
+def split_generic_arguments(arguments: str) -> List[str]:
+    """
+    Split the arguments of a generic type on the top level commas only, so that
+    nested generic types such as tuple<List<u8>, multi<u8,u16>> are kept whole.
+
+    :param arguments: content between the outer chevrons of a generic type
+    :type arguments: str
+    :return: arguments of the generic type
+    :rtype: List[str]
+    """
+    results = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(arguments):
+        if char == "<":
+            depth += 1
+        elif char == ">":
+            depth -= 1
+        elif char == "," and depth == 0:
+            results.append(arguments[start:i].strip())
+            start = i + 1
+    results.append(arguments[start:].strip())
+    return results
+
+
+def parse_type(
+    type_name: str, structs: Container[str], enums: Container[str]
+) -> TypeNode:
+    """
+    Parse an ABI type string into a tree of type nodes
+
+    :param type_name: ABI type to parse, for example List<Option<u32>>
+    :type type_name: str
+    :param structs: names of the custom structs defined in the ABI
+    :type structs: Container[str]
+    :param enums: names of the custom enums defined in the ABI
+    :type enums: Container[str]
+    :return: root node of the type tree
+    :rtype: TypeNode
+    """
+    if type_name == "Address":
+        return AddressTypeNode(type_name)
+
+    if type_name in basic_type.BASIC_TYPES:
+        return BasicTypeNode(type_name)
+
+    generic_start = type_name.find("<")
+    if generic_start > 0 and type_name.endswith(">"):
+        generic_name = type_name[:generic_start]
+        arguments = tuple(
+            parse_type(argument, structs, enums)
+            for argument in split_generic_arguments(type_name[generic_start + 1 : -1])
+        )
+        if generic_name in MULTI_ARGUMENTS_GENERICS:
+            return MULTI_ARGUMENTS_GENERICS[generic_name](type_name, arguments)
+        if len(arguments) == 1:
+            if generic_name in SINGLE_ARGUMENT_GENERICS:
+                return SINGLE_ARGUMENT_GENERICS[generic_name](type_name, arguments[0])
+            if generic_name.startswith("array") and generic_name[5:].isdigit():
+                return ArrayTypeNode(type_name, int(generic_name[5:]), arguments[0])
+
+    if type_name in structs:
+        return StructTypeNode(type_name)
+
+    if type_name in enums:
+        return EnumTypeNode(type_name)
+
+    raise errors.UnknownType(type_name)
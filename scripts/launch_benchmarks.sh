@@ -0,0 +1,23 @@
+#!/bin/bash
+
+# Some colors
+BLUE='\033[0;94m'
+RED='\033[0;91m'
+GREEN='\033[0;92m'
+NC='\033[0m'
+
+printf "${BLUE}############\n# Benchmarks\n############${NC}\n"
+
+# benchmark the sources of the repository
+export PYTHONPATH="$(pwd):${PYTHONPATH}"
+
+for BENCHMARK in benchmarks/*.py
+do
+    printf "${BLUE}${BENCHMARK}${NC}\n"
+    if ! python "${BENCHMARK}";
+    then
+        printf "${RED}Benchmark ${BENCHMARK} failed${NC}\n"
+        exit 1
+    fi
+done
+printf "${GREEN}Benchmarks done${NC}\n\n\n"
@@ -0,0 +1,136 @@
+from pathlib import Path
+import pickle
+from typing import Any
+
+import pytest
+
+from mxpyserializer import errors
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.basic_type import LazyAddress
+
+
+PUBKEY = bytes.fromhex(
+    "000000000000000005008c68c31186c3d96fba3932f38d8541f25f89291b5483"
+)
+BECH32 = "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg"
+
+
+@pytest.mark.parametrize(
+    "address_format,expected_result",
+    [
+        ("bech32", BECH32),
+        ("bytes", PUBKEY),
+        ("hex", PUBKEY.hex()),
+        ("lazy", LazyAddress(PUBKEY)),
+    ],
+)
+def test_instance_address_format(address_format: str, expected_result: Any):
+    # Given
+    abi_serializer = AbiSerializer(address_format=address_format)
+
+    # When
+    top_result = abi_serializer.top_decode("Address", PUBKEY)
+    nested_result, left_over = abi_serializer.nested_decode(
+        "List<Address>", b"\x00\x00\x00\x01" + PUBKEY
+    )
+    tuple_result, _ = abi_serializer.nested_decode(
+        "tuple<u8, Address>", b"\x01" + PUBKEY
+    )
+
+    # Then
+    assert top_result == expected_result
+    assert nested_result == [expected_result]
+    assert tuple_result == [1, expected_result]
+    assert left_over == b""
+
+
+@pytest.mark.parametrize(
+    "address_format,expected_owner",
+    [(None, BECH32), ("bytes", PUBKEY), ("hex", PUBKEY.hex())],
+)
+def test_call_address_format(address_format: str, expected_owner: Any):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    value = [1, 0, True, BECH32, "A-123456", "B-123456", "AB-123456", 18, 1, 2, 3, 1]
+    encoded_value = abi_serializer.top_encode("Pair", value)
+
+    # When
+    result = abi_serializer.top_decode("Pair", encoded_value, address_format)
+
+    # Then
+    assert result["owner"] == expected_owner
+    assert abi_serializer.address_format == "bech32"
+
+
+def test_lazy_address():
+    # Given
+    abi_serializer = AbiSerializer(address_format="lazy")
+
+    # When
+    address = abi_serializer.top_decode("Address", PUBKEY)
+
+    # Then
+    assert isinstance(address, LazyAddress)
+    assert address._bech32 is None
+    assert address.bech32() == BECH32
+    assert str(address) == BECH32
+    assert address.hex() == PUBKEY.hex()
+    assert bytes(address) == PUBKEY
+    assert address == PUBKEY
+    assert {address: 1}[LazyAddress(PUBKEY)] == 1
+
+
+@pytest.mark.parametrize("value", [BECH32, PUBKEY, PUBKEY.hex(), LazyAddress(PUBKEY)])
+def test_encode_address_formats(value: Any):
+    # Given
+    abi_serializer = AbiSerializer()
+
+    # When
+    result = abi_serializer.top_encode("Address", value)
+
+    # Then
+    assert result == PUBKEY
+
+
+def test_with_options():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    same_serializer = abi_serializer.with_options(address_format="bech32")
+    other_serializer = abi_serializer.with_options(address_format="hex")
+    restored_serializer = pickle.loads(pickle.dumps(other_serializer))
+
+    # Then
+    assert same_serializer is abi_serializer
+    assert other_serializer.address_format == "hex"
+    assert other_serializer._type_nodes is abi_serializer._type_nodes
+    assert restored_serializer.address_format == "hex"
+
+
+def test_unknown_address_format():
+    # Given
+    abi_serializer = AbiSerializer()
+
+    # When
+    try:
+        abi_serializer.top_decode("Address", PUBKEY, address_format="base64")
+        raise RuntimeError("Above line should raise an error")
+    except errors.UnknownAddressFormat as err:
+        assert err.args[0] == (
+            "Unknown address format: base64, expected one of bech32, bytes, hex or lazy"
+        )
+
+
+def test_bytes_address_not_enough_data():
+    # Given
+    abi_serializer = AbiSerializer(address_format="bytes")
+
+    # When
+    try:
+        abi_serializer.nested_decode("Address", PUBKEY[:10])
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        assert err.args[0] == "Expected a public key of 32 bytes but got 10"
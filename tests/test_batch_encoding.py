@@ -0,0 +1,70 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.batch_encoding import EncodedRows
+
+
+@pytest.mark.parametrize(
+    "endpoint_name,rows",
+    [
+        (
+            "myEndpoint",
+            [[15, True, "TFK-15987", "TRE-abcdef"], [15, False], (0, True)],
+        ),
+        ("myEndpoint2", [[15], [15, 16], [0]]),
+        ("endpoint_5", [["WEGLD-abcdef", 789], ["USDC-123456", 0]]),
+        ("init", [["TFK-15987"]]),
+        ("myEndpoint", []),
+    ],
+)
+def test_encode_endpoint_inputs_many(endpoint_name: str, rows: List):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    expected_results = [
+        abi_serializer.encode_endpoint_inputs(endpoint_name, row) for row in rows
+    ]
+
+    # When
+    encoded_rows = abi_serializer.encode_endpoint_inputs_many(endpoint_name, rows)
+    data_fields = abi_serializer.encode_endpoint_inputs_many(
+        endpoint_name, iter(rows), data_fields=True
+    )
+
+    # Then
+    assert isinstance(encoded_rows, EncodedRows)
+    assert len(encoded_rows) == len(rows)
+    assert [
+        [bytes(part) for part in encoded_rows.get_parts(i)] for i in range(len(rows))
+    ] == expected_results
+    assert data_fields == [
+        "@".join([endpoint_name, *[part.hex() for part in parts]])
+        for parts in expected_results
+    ]
+    assert encoded_rows.part_offsets[-1] == len(encoded_rows.buffer)
+
+
+def test_data_fields_round_trip():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    rows = [
+        [i * 10**18, i % 2 == 0, *[f"TKN-{j:06d}" for j in range(i % 3)]]
+        for i in range(10)
+    ]
+
+    # When
+    data_fields = abi_serializer.encode_endpoint_inputs_many(
+        "myEndpoint", rows, data_fields=True
+    )
+
+    # Then
+    for row, data_field in zip(rows, data_fields):
+        assert abi_serializer.decode_endpoint_input_data(data_field) == (
+            "myEndpoint",
+            [],
+            row,
+        )
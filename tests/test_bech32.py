@@ -0,0 +1,87 @@
+import numpy as np
+from multiversx_sdk_core.address import Address
+import pytest
+
+from mxpyserializer import bech32, errors
+
+
+PUBKEYS = [
+    bytes(32),
+    bytes([255] * 32),
+    bytes.fromhex("000000000000000005008c68c31186c3d96fba3932f38d8541f25f89291b5483"),
+    bytes(range(32)),
+    bytes(range(100, 132)),
+]
+
+
+@pytest.mark.parametrize("pubkey", PUBKEYS)
+def test_sdk_parity(pubkey: bytes):
+    # Given
+    expected_address = Address(pubkey, "erd").bech32()
+
+    # When
+    address = bech32.pubkey_to_bech32(pubkey)
+    decoded_pubkey = bech32.bech32_to_pubkey(address)
+    decoded_upper_pubkey = bech32.bech32_to_pubkey(address.upper())
+
+    # Then
+    assert address == expected_address
+    assert decoded_pubkey == pubkey
+    assert decoded_upper_pubkey == pubkey
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        # wrong checksum
+        "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgx",
+        # mixed case
+        "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0KGG",
+        # other human readable part
+        "bc1qqqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg",
+        # character out of the charset
+        "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgb",
+        # too short
+        "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kg",
+        # padding bits set
+        "erd1llllllllllllllllllllllllllllllllllllllllllllllllllllu8xtpp",
+    ],
+)
+def test_bad_address(address: str):
+    # Given
+    # When
+    try:
+        bech32.bech32_to_pubkey(address)
+        raise RuntimeError("Above line should raise an error")
+    except errors.BadBech32Address as err:
+        assert err.args[0] == f"Bad bech32 address: {address}"
+
+
+def test_bad_pubkey_length():
+    # Given
+    pubkey = bytes(31)
+
+    # When
+    try:
+        bech32.pubkey_to_bech32(pubkey)
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        assert err.args[0] == "Expected a public key of 32 bytes but got 31"
+
+
+def test_batch_conversions():
+    # Given
+    expected_addresses = [Address(p, "erd").bech32() for p in PUBKEYS]
+    pubkeys_array = np.frombuffer(b"".join(PUBKEYS), dtype=np.uint8).reshape(-1, 32)
+
+    # When
+    addresses = bech32.pubkeys_to_bech32(PUBKEYS)
+    array_addresses = bech32.pubkeys_to_bech32(pubkeys_array)
+    empty_addresses = bech32.pubkeys_to_bech32(pubkeys_array[:0])
+    pubkeys = bech32.bech32_to_pubkeys(addresses)
+
+    # Then
+    assert addresses == expected_addresses
+    assert array_addresses == expected_addresses
+    assert empty_addresses == []
+    assert pubkeys == PUBKEYS
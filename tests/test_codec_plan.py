@@ -0,0 +1,129 @@
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+from mxpyserializer import errors
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.codec_plan import MultiValueReader
+from mxpyserializer.data_models import AbiIO
+
+
+def test_endpoint_plans_built_on_first_use():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    loaded_plans = dict(abi_serializer._endpoint_plans)
+
+    # When
+    plan = abi_serializer.get_endpoint_plan("myEndpoint")
+    abi_serializer.compile()
+
+    # Then
+    assert loaded_plans == {}
+    assert abi_serializer.get_endpoint_plan("myEndpoint") is plan
+    assert set(abi_serializer._endpoint_plans.keys()) == set(
+        abi_serializer.endpoints.values()
+    )
+
+
+@pytest.mark.parametrize(
+    "endpoint_name,expected_inputs,expected_outputs",
+    [
+        (
+            "myEndpoint",
+            [
+                ("BigUint", False, False),
+                ("bool", False, False),
+                ("variadic<TokenIdentifier>", True, False),
+            ],
+            [],
+        ),
+        (
+            "endpoint_5",
+            [("Option<TokenIdentifier>", False, False), ("optional<u64>", False, True)],
+            [("Option<TokenIdentifier>", False, False), ("optional<u64>", False, True)],
+        ),
+        ("getPairs", [], [("u32", False, False), ("variadic<Pair>", True, False)]),
+    ],
+)
+def test_endpoint_plan(endpoint_name: str, expected_inputs, expected_outputs):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    plan = abi_serializer.get_endpoint_plan(endpoint_name)
+
+    # Then
+    assert [(e.type_name, e.is_multi, e.is_optional) for e in plan.inputs] == (
+        expected_inputs
+    )
+    assert [(e.type_name, e.is_multi, e.is_optional) for e in plan.outputs] == (
+        expected_outputs
+    )
+    with pytest.raises(FrozenInstanceError):
+        plan.name = "other"
+
+
+def test_unknown_endpoint_plan():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    try:
+        abi_serializer.get_endpoint_plan("unknownEndpoint")
+        raise RuntimeError("Above line should raise an error")
+    except errors.UnknownEndpoint as err:
+        assert err.args[0] == "Unknown endpoint: unknownEndpoint"
+
+
+def test_multi_value_reader():
+    # Given
+    parts = [b"\x01", b"\x02", b"\x03"]
+    reader = MultiValueReader(parts)
+
+    # When
+    first_part = reader.read()
+    remaining_parts = reader.read_remaining()
+
+    # Then
+    assert first_part == b"\x01"
+    assert remaining_parts == [b"\x02", b"\x03"]
+    assert not reader.has_next()
+    assert parts == [b"\x01", b"\x02", b"\x03"]
+    try:
+        reader.read()
+        raise RuntimeError("Above line should raise an error")
+    except IndexError as err:
+        assert err.args[0] == "Expected at least 4 parts but got 3"
+
+
+def test_decode_io_does_not_mutate_parts():
+    # Given
+    abi_serializer = AbiSerializer()
+    io_list = [
+        AbiIO(type="u8"),
+        AbiIO(type="variadic<multi<u8,bool>>", multi_result=True),
+    ]
+    parts = [b"\x02", b"\x01", b"\x01", b"\x02", b""]
+
+    # When
+    results = abi_serializer.decode_io(io_list, parts)
+
+    # Then
+    assert results == [2, [1, True], [2, False]]
+    assert parts == [b"\x02", b"\x01", b"\x01", b"\x02", b""]
+
+
+def test_variadic_multi_count_mismatch():
+    # Given
+    abi_serializer = AbiSerializer()
+
+    # When
+    try:
+        abi_serializer.top_decode("variadic<multi<u8,bool>>", [b"\x01", b"\x01", b""])
+        raise RuntimeError("Above line should raise an error")
+    except errors.MultiElementsNumberMismatch:
+        pass
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+from mxpyserializer import errors
+from mxpyserializer.abi_serializer import AbiSerializer
+
+
+def get_pair_payload(abi_serializer: AbiSerializer, pair_id: int) -> bytes:
+    return abi_serializer.top_encode(
+        "Pair",
+        {
+            "pair_id": pair_id,
+            "state": {"name": "Active"},
+            "enabled": pair_id % 2 == 0,
+            "owner": "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg",
+            "first_token_id": "HYPE-619661",
+            "second_token_id": "LEGLD-d74da9",
+            "lp_token_id": "HYPELEGLD-d65493",
+            "lp_token_decimal": 18,
+            "first_token_reserve": 27675995026043458404845725 + pair_id,
+            "second_token_reserve": 586365485849411410,
+            "lp_token_supply": 1016042899275369744,
+            "lp_token_roles_are_set": True,
+        },
+    )
+
+
+def test_decode_columns():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    payloads = [get_pair_payload(abi_serializer, i) for i in range(3)]
+
+    # When
+    columns = abi_serializer.decode_columns("Pair", payloads)
+
+    # Then
+    assert list(columns.keys()) == [
+        f.name for f in abi_serializer.structs["Pair"].fields
+    ]
+    assert columns["pair_id"].dtype == np.uint32
+    assert columns["pair_id"].tolist() == [0, 1, 2]
+    assert columns["enabled"].dtype == np.bool_
+    assert columns["enabled"].tolist() == [True, False, True]
+    assert columns["lp_token_decimal"].tolist() == [18, 18, 18]
+    assert columns["first_token_id"] == ["HYPE-619661"] * 3
+    assert columns["first_token_reserve"] == [
+        27675995026043458404845725 + i for i in range(3)
+    ]
+    assert (
+        columns["state"] == [{"name": "Active", "discriminant": 1, "values": None}] * 3
+    )
+
+
+def test_decode_columns_empty():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    columns = abi_serializer.decode_columns("Pair", [])
+
+    # Then
+    assert len(columns) == len(abi_serializer.structs["Pair"].fields)
+    assert columns["pair_id"].dtype == np.uint32
+    assert len(columns["pair_id"]) == 0
+    assert columns["owner"] == []
+
+
+def test_decode_columns_record_batch():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    payloads = [get_pair_payload(abi_serializer, i) for i in range(2)]
+
+    # When
+    batch = abi_serializer.decode_columns("Pair", payloads, record_batch=True)
+
+    # Then
+    assert isinstance(batch, pa.RecordBatch)
+    assert batch.num_rows == 2
+    assert batch.schema.field("pair_id").type == pa.uint32()
+    assert batch.schema.field("first_token_reserve").type == pa.string()
+    assert batch.column("first_token_reserve").to_pylist() == [
+        "27675995026043458404845725",
+        "27675995026043458404845726",
+    ]
+    assert batch.column("state").to_pylist()[0]["name"] == "Active"
+
+
+def test_decode_columns_left_over():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    payload = get_pair_payload(abi_serializer, 1) + b"\x00"
+
+    # When
+    try:
+        abi_serializer.decode_columns("Pair", [payload])
+        raise RuntimeError("Above line should raise an error")
+    except errors.LeftOverData as err:
+        assert err.args[0] == "Some left over bytes were not decoded: b'\\x00'"
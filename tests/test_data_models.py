@@ -0,0 +1,130 @@
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+import pickle
+
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.data_models import AbiEnum, AbiIO
+
+
+def test_enum_indexes():
+    # Given
+    data = {
+        "name": "Status",
+        "variants": [
+            {"name": f"Status{i}", "discriminant": i, "fields": []} for i in range(50)
+        ]
+        + [
+            {
+                "name": "Custom",
+                "discriminant": 50,
+                "fields": [{"name": "0", "type": "u8"}, {"name": "1", "type": "bool"}],
+            }
+        ],
+    }
+
+    # When
+    abi_enum = AbiEnum.from_dict(data)
+
+    # Then
+    assert abi_enum.variants_by_discriminant[42].name == "Status42"
+    assert abi_enum.variants_by_name["Status7"].discriminant == 7
+    assert abi_enum.variants_by_name["Custom"].field_types == ("u8", "bool")
+    assert abi_enum.variants_by_name["Status0"].field_types == ()
+
+
+def test_enum_indexes_read_only():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_enum = AbiSerializer.from_abi(file_path).enums["State"]
+    enum_hash = hash(abi_enum)
+
+    # When
+    try:
+        abi_enum.variants_by_discriminant[0] = abi_enum.variants[1]
+        raise RuntimeError("Above line should raise an error")
+    except TypeError:
+        pass
+
+    # Then
+    assert abi_enum.variants_by_discriminant[0].name == "Inactive"
+    assert hash(abi_enum) == enum_hash
+    assert pickle.loads(pickle.dumps(abi_enum)).variants_by_name == (
+        abi_enum.variants_by_name
+    )
+
+
+def test_enum_variant_lookup():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(
+        {
+            "types": {
+                "Status": {
+                    "type": "enum",
+                    "variants": [
+                        {"name": f"Status{i}", "discriminant": i} for i in range(50)
+                    ],
+                }
+            }
+        }
+    )
+
+    # When
+    encoded_by_name = abi_serializer.nested_encode("Status", "Status45")
+    encoded_by_discriminant = abi_serializer.nested_encode("Status", 45)
+    decoded_value, _ = abi_serializer.nested_decode("Status", encoded_by_name)
+
+    # Then
+    assert encoded_by_name == encoded_by_discriminant == b"\x2d"
+    assert decoded_value == {"name": "Status45", "discriminant": 45, "values": None}
+
+
+def test_serializer_dict_round_trip():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    data = abi_serializer.to_dict()
+    restored_serializer = AbiSerializer.from_dict(data)
+
+    # Then
+    assert "variants_by_name" not in data["enums"]["State"]
+    assert "field_types" not in data["enums"]["MyAbiEnum"]["variants"][1]
+    assert restored_serializer.to_dict() == data
+    assert restored_serializer.enums == abi_serializer.enums
+
+
+def test_frozen_hashable_models():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    other_serializer = AbiSerializer.from_abi(file_path)
+    pair_struct = abi_serializer.structs["Pair"]
+
+    # When
+    try:
+        pair_struct.name = "Other"
+        raise RuntimeError("Above line should raise an error")
+    except FrozenInstanceError:
+        pass
+
+    # Then
+    assert not hasattr(pair_struct, "__dict__")
+    assert pair_struct == other_serializer.structs["Pair"]
+    assert hash(pair_struct) == hash(other_serializer.structs["Pair"])
+    assert pickle.loads(pickle.dumps(pair_struct)) == pair_struct
+    assert abi_serializer.endpoints["myEndpoint"].inputs[2] == AbiIO(
+        type="variadic<TokenIdentifier>", name="tokens", multi_arg=True
+    )
+
+
+def test_layouts_keyed_by_models():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    layout = abi_serializer.get_struct_layout("Pair")
+
+    # Then
+    assert abi_serializer._struct_layouts[abi_serializer.structs["Pair"]] is layout
@@ -1,4 +1,5 @@
 import base64
+import mmap
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
@@ -483,3 +484,52 @@ def test_decode_endpoint_input_data(b64_input_data: str, expected_results: List)
 
     # Then
     assert results == expected_results
+
+
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+def test_nested_decode_at(buffer_type: type):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    data = buffer_type(
+        b"\xaa\xaa"
+        b"\x00\x00\x00\x02\x1E\xA5"
+        b"\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x03"
+        b"\x01"
+        b"\x00\x00\x00\x0A"
+        b"TKN-abcdef"
+        b"\x00\x00\x00\x0A"
+    )
+
+    # When
+    results, offset = abi_serializer.nested_decode_at("MyAbiStruct2", data, 2)
+
+    # Then
+    assert results == {
+        "field1": 7845,
+        "field2": [1, 2, 3],
+        "field3": [True, "TKN-abcdef"],
+    }
+    assert offset == len(data) - 4
+
+
+def test_nested_decode_at_mmap(tmp_path: Path):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    data_path = tmp_path / "data.bin"
+    data_path.write_bytes(b"\x00\x00\x00\x03\x01\x02\x03" * 1000)
+
+    # When
+    with open(data_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_data:
+            offset = 0
+            results = []
+            while offset < len(mapped_data):
+                result, offset = abi_serializer.nested_decode_at(
+                    "List<u8>", mapped_data, offset
+                )
+                results.append(result)
+
+    # Then
+    assert results == 1000 * [[1, 2, 3]]
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Any, Iterator, Tuple
 import pytest
 from mxpyserializer import basic_type, errors
 
@@ -250,3 +250,76 @@ def test_top_decode_address():
 
     # Then
     assert expected_bech32_address == result
+
+
+@pytest.mark.parametrize(
+    "type_name, data, offset, expected_result",
+    [
+        ("u32", b"\xaa\x00\x00\x00\x0A", 1, (10, 5)),
+        ("i16", b"\xaa\xaa\x01\x04\xEF\x0A", 2, (260, 4)),
+        ("BigUint", b"\xaa\x00\x00\x00\x02\x01\xa2\xaa", 1, (418, 7)),
+        ("bool", b"\x00\x01\x0a", 1, (True, 2)),
+        ("TokenIdentifier", b"\xaa\x00\x00\x00\x04EGLD\x01", 1, ("EGLD", 9)),
+        ("bytes", b"\x00\x00\x00\x01\xAA\xEE", 0, (b"\xAA", 5)),
+    ],
+)
+def test_nested_decode_basic_at(
+    type_name: str, data: bytes, offset: int, expected_result: Tuple[Any, int]
+):
+    # Given
+    # When
+    result = basic_type.nested_decode_basic_at(type_name, memoryview(data), offset)
+
+    # Then
+    assert expected_result == result
+    assert isinstance(result[0], type(expected_result[0]))
+
+
+@pytest.fixture(name="address_cache_size")
+def fixture_address_cache_size() -> Iterator[int]:
+    # the address caches are global: restore their size even if the test fails
+    previous_size = basic_type.get_address_cache_stats()["decode"].maxsize
+    basic_type.set_address_cache_size(2)
+    try:
+        yield 2
+    finally:
+        basic_type.set_address_cache_size(previous_size)
+
+
+def test_address_cache_stats(address_cache_size: int):
+    # Given
+    pubkey = bytes.fromhex(
+        "000000000000000005008c68c31186c3d96fba3932f38d8541f25f89291b5483"
+    )
+    bech32 = "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg"
+
+    # When
+    decoded_addresses = [
+        basic_type.top_decode_basic("Address", pubkey) for _ in range(4)
+    ]
+    encoded_address = basic_type.top_encode_basic("Address", bech32)
+    stats = basic_type.get_address_cache_stats()
+
+    # Then
+    assert decoded_addresses == [bech32] * 4
+    assert encoded_address == pubkey
+    assert stats["decode"] == basic_type.CacheStats(
+        hits=3, misses=1, maxsize=address_cache_size, currsize=1
+    )
+    assert stats["decode"].hit_rate == 0.75
+    assert stats["encode"].misses == 1
+    assert stats["encode"].hit_rate == 0
+
+
+def test_clear_address_cache():
+    # Given
+    pubkey = bytes(32)
+    basic_type.top_decode_basic("Address", pubkey)
+
+    # When
+    basic_type.clear_address_cache()
+
+    # Then
+    assert basic_type.get_address_cache_stats()["decode"] == basic_type.CacheStats(
+        hits=0, misses=0, maxsize=basic_type.DEFAULT_ADDRESS_CACHE_SIZE, currsize=0
+    )
@@ -315,3 +315,73 @@ def test_inputs_encode(endpoint_name: str, values: List, expected_results: List[
 
     # Then
     assert expected_results == results
+
+
+def test_inputs_encode_from_iterables():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    tokens = ["TFK-15987", "TRE-abcdef"]
+    values = [15, True, *tokens]
+    expected_results = [b"\x0F", b"\x01", b"TFK-15987", b"TRE-abcdef"]
+
+    # When
+    generator_results = abi_serializer.encode_endpoint_inputs(
+        "myEndpoint", (v for v in [15, True, *tokens])
+    )
+    tuple_results = abi_serializer.encode_endpoint_inputs(
+        "myEndpoint", (15, True, *tokens)
+    )
+    list_results = abi_serializer.encode_endpoint_inputs("myEndpoint", values)
+
+    # Then
+    assert generator_results == expected_results
+    assert tuple_results == expected_results
+    assert list_results == expected_results
+    assert values == [15, True, "TFK-15987", "TRE-abcdef"]
+
+
+def test_encode_into():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    buffer = bytearray(b"\xaa")
+
+    # When
+    abi_serializer.encode_into("List<u16>", [1, 2], buffer)
+    abi_serializer.encode_into(
+        "MyAbiStruct2",
+        {"field1": 7845, "field2": [1, 2, 3], "field3": [True, "TKN-abcdef"]},
+        buffer,
+    )
+    abi_serializer.encode_into("Option<BigUint>", None, buffer)
+
+    # Then
+    assert buffer == bytearray(
+        b"\xaa"
+        b"\x00\x00\x00\x02\x00\x01\x00\x02"
+        b"\x00\x00\x00\x02\x1E\xA5"
+        b"\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x03"
+        b"\x01"
+        b"\x00\x00\x00\x0A"
+        b"TKN-abcdef"
+        b"\x00"
+    )
+
+
+def test_encode_into_list_of_addresses():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    address = "erd1qqqqqqqqqqqqqpgqahfmv4apudlzgawgcvp2zr65dtufqfmy6avsazkewu"
+    buffer = bytearray()
+
+    # When
+    abi_serializer.encode_into("List<Address>", 1000 * [address], buffer)
+
+    # Then
+    assert len(buffer) == 4 + 1000 * 32
+    assert abi_serializer.nested_decode("List<Address>", bytes(buffer)) == (
+        1000 * [address],
+        b"",
+    )
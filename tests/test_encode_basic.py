@@ -145,3 +145,19 @@ def test_top_encode_basic(type_name: str, value: Any, expected_result: bytes):
 
     # Then
     assert expected_result == result
+
+
+def test_nested_encode_basic_into():
+    # Given
+    buffer = bytearray(b"\xaa")
+
+    # When
+    basic_type.nested_encode_basic_into("u16", 260, buffer)
+    basic_type.nested_encode_basic_into("BigUint", 418, buffer)
+    basic_type.nested_encode_basic_into("bool", True, buffer)
+    basic_type.nested_encode_basic_into("TokenIdentifier", "EGLD", buffer)
+
+    # Then
+    assert buffer == bytearray(
+        b"\xaa\x01\x04\x00\x00\x00\x02\x01\xa2\x01\x00\x00\x00\x04EGLD"
+    )
@@ -0,0 +1,235 @@
+from pathlib import Path
+
+import pytest
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+
+PAIR_VALUE = [
+    1,
+    0,
+    True,
+    "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg",
+    "A-123456",
+    "B-123456",
+    "AB-123456",
+    18,
+    10**20,
+    2,
+    3,
+    1,
+]
+
+STATIC_ABI = {
+    "types": {
+        "Point": {
+            "type": "struct",
+            "fields": [
+                {"name": "x", "type": "i32"},
+                {"name": "active", "type": "bool"},
+                {"name": "y", "type": "u64"},
+            ],
+        },
+        "Segment": {
+            "type": "struct",
+            "fields": [
+                {"name": "start", "type": "Point"},
+                {"name": "end", "type": "Point"},
+                {"name": "kind", "type": "Kind"},
+                {"name": "weights", "type": "array3<u16>"},
+            ],
+        },
+        "Kind": {
+            "type": "enum",
+            "variants": [
+                {
+                    "name": "Line",
+                    "discriminant": 0,
+                    "fields": [{"name": "0", "type": "u32"}],
+                },
+                {
+                    "name": "Arc",
+                    "discriminant": 1,
+                    "fields": [
+                        {"name": "0", "type": "u16"},
+                        {"name": "1", "type": "u16"},
+                    ],
+                },
+            ],
+        },
+        "Shape": {
+            "type": "enum",
+            "variants": [
+                {"name": "Empty", "discriminant": 0},
+                {
+                    "name": "Dot",
+                    "discriminant": 1,
+                    "fields": [{"name": "0", "type": "Point"}],
+                },
+            ],
+        },
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "type_name,value",
+    [
+        ("u64", 123456),
+        ("BigUint", 10**30),
+        ("bytes", b"abcdef"),
+        ("TokenIdentifier", "WEGLD-abcdef"),
+        ("Address", "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg"),
+        ("List<u32>", [1, 2, 3]),
+        ("List<BigUint>", [1, 10**20, 0]),
+        ("List<Option<u32>>", [1, None, 3]),
+        ("array2<TokenIdentifier>", ["A-123456", "B-123456"]),
+        ("tuple<bool, TokenIdentifier>", [True, "A-123456"]),
+        ("Option<BigUint>", None),
+        ("Option<BigUint>", 5),
+        ("Pair", PAIR_VALUE),
+        ("List<Pair>", [PAIR_VALUE, PAIR_VALUE]),
+        ("State", "Active"),
+        ("MyAbiEnum", {"name": "Something", "values": [-5]}),
+        (
+            "MyAbiEnum",
+            {"name": "SomethingMore", "values": [1, [3, [1, 2], [True, "A-123"]]]},
+        ),
+    ],
+)
+def test_encoded_size_matches_decoding(type_name, value):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    data = b"\x01" + abi_serializer.nested_encode(type_name, value) + b"\x02"
+
+    # When
+    size = abi_serializer.encoded_size(type_name, data, 1)
+
+    # Then
+    _, end = abi_serializer.nested_decode_at(type_name, data, 1)
+    assert size == end - 1 == len(data) - 2
+
+
+@pytest.mark.parametrize(
+    "type_name,expected_size",
+    [
+        ("u8", 1),
+        ("Address", 32),
+        ("BigUint", None),
+        ("Point", 13),
+        ("Kind", 5),
+        ("Segment", 37),
+        ("array4<Point>", 52),
+        ("tuple<Point, bool>", 14),
+        ("Shape", None),
+        ("List<Point>", None),
+        ("Option<Point>", None),
+    ],
+)
+def test_static_sizes(type_name, expected_size):
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(STATIC_ABI)
+
+    # When
+    static_size = abi_serializer.get_static_size(type_name)
+
+    # Then
+    assert static_size == expected_size
+    if type_name in abi_serializer.structs or type_name in abi_serializer.enums:
+        assert abi_serializer._static_sizes[type_name] == expected_size
+
+
+def test_static_sizes_compiled():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(STATIC_ABI)
+
+    # When
+    abi_serializer.compile()
+
+    # Then
+    assert abi_serializer._static_sizes == {
+        "Point": 13,
+        "Segment": 37,
+        "Kind": 5,
+        "Shape": None,
+    }
+
+
+def test_index_list_of_structs():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path).with_options(
+        address_format="hex"
+    )
+    pairs = []
+    for i in range(5):
+        pair = list(PAIR_VALUE)
+        pair[0] = i
+        pair[4] = f"TOKEN{i}-123456"
+        pair[8] = 10 ** (10 * i)
+        pairs.append(pair)
+    data = abi_serializer.nested_encode("List<Pair>", pairs)
+
+    # When
+    offsets = []
+    offset = 4
+    for _ in range(len(pairs)):
+        offsets.append(offset)
+        offset += abi_serializer.encoded_size("Pair", data, offset)
+    third_pair, _ = abi_serializer.nested_decode_at("Pair", data, offsets[3])
+
+    # Then
+    assert offset == len(data)
+    assert third_pair["pair_id"] == 3
+    assert third_pair["first_token_id"] == "TOKEN3-123456"
+    assert third_pair["first_token_reserve"] == 10**30
+
+
+def test_encoded_size_static_list():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(STATIC_ABI)
+    point = {"x": -1, "active": True, "y": 2}
+    data = abi_serializer.nested_encode("List<Point>", [point] * 10)
+
+    # When
+    size = abi_serializer.encoded_size("List<Point>", data)
+
+    # Then
+    assert size == len(data) == 4 + 10 * 13
+
+
+@pytest.mark.parametrize(
+    "type_name,data,error_message",
+    [
+        (
+            "List<Point>",
+            b"\x00\x00\x00\x02" + b"\x00" * 20,
+            "Not enough data to skip a value of type List<Point>: expected 26 bytes"
+            " but got 20",
+        ),
+        (
+            "Segment",
+            b"\x00" * 36,
+            "Not enough data to skip a value of type Segment: expected 37 bytes"
+            " but got 36",
+        ),
+        (
+            "List<bytes>",
+            b"\x00\x00\x00\x01\x00\x00\x00\x05abc",
+            "Not enough data to skip a value of type bytes: expected 5 bytes"
+            " but got 3",
+        ),
+    ],
+)
+def test_encoded_size_not_enough_data(type_name, data, error_message):
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(STATIC_ABI)
+
+    # When
+    try:
+        abi_serializer.encoded_size(type_name, data)
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        # Then
+        assert str(err) == error_message
@@ -0,0 +1,191 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+from multiversx_sdk_network_providers.contract_query_response import (
+    ContractQueryResponse,
+)
+import pytest
+
+from mxpyserializer import errors
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.field_projection import parse_projection
+
+
+PAIR_VALUE = [
+    1,
+    1,
+    True,
+    "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg",
+    "A-123456",
+    "B-123456",
+    "AB-123456",
+    18,
+    10**20,
+    2,
+    3,
+    1,
+]
+
+
+@pytest.mark.parametrize(
+    "paths,expected_tree",
+    [
+        (["a", "b.c"], {"a": None, "b": {"c": None}}),
+        (["b.c", "b"], {"b": None}),
+        (["b", "b.c"], {"b": None}),
+        (["b.c", "b.d.e"], {"b": {"c": None, "d": {"e": None}}}),
+    ],
+)
+def test_parse_projection(paths: List[str], expected_tree: Dict):
+    # Given
+    # When
+    tree = parse_projection(paths)
+
+    # Then
+    assert tree == expected_tree
+
+
+@pytest.mark.parametrize(
+    "type_name,projection,expected_result",
+    [
+        (
+            "Pair",
+            ["first_token_reserve", "second_token_reserve", "state.name"],
+            {
+                "state": {"name": "Active"},
+                "first_token_reserve": 10**20,
+                "second_token_reserve": 2,
+            },
+        ),
+        ("Pair", ["lp_token_supply"], {"lp_token_supply": 3}),
+        (
+            "Pair",
+            ["pair_id", "enabled", "owner", "lp_token_decimal"],
+            {
+                "pair_id": 1,
+                "enabled": True,
+                "owner": (
+                    "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg"
+                ),
+                "lp_token_decimal": 18,
+            },
+        ),
+        ("Option<Pair>", ["lp_token_id"], {"lp_token_id": "AB-123456"}),
+    ],
+)
+def test_top_decode_projection(
+    type_name: str, projection: List[str], expected_result: Dict[str, Any]
+):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    data = abi_serializer.top_encode(type_name, PAIR_VALUE)
+
+    # When
+    result = abi_serializer.top_decode(type_name, data, projection=projection)
+
+    # Then
+    assert result == expected_result
+
+
+def test_decode_query_response_projection():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    response = ContractQueryResponse()
+    response.return_data = [
+        "AAAACg==",
+        "AAAAeAEBY5L6MvMp/IWpWRnnjdLAMHLbORq20nPy6yGGe14/NtwAAAALTU1MRy05YTkwN2"
+        "IAAAAMV0VHTEQtYmQ0ZDc5AAAAEE1NTEdXRUdMRC04MzBkZjIAAAASAAAAC2s2F3MlLnj1"
+        "2ET3AAAACQED3roTHjjYfQAAAAgeTdFH8A0BhQE=",
+        "AAAAeQIA7ZTU+9847vZKnJJ/1vFolYMeqSpPJgNwQT7GIeCKbwgAAAAOUEFEQVdBTi1hMT"
+        "dmNTgAAAAKVEdSLTY4ZGExZQAAABFQQURBV0FOVEdSLTM1Y2YwMgAAABIAAAAKEOV6kSUp"
+        "6VwAAAAAAAsaDmJr8jc9T4AAAAAAAAoQ5XqRJSnpXAAAAQ==",
+    ]
+    response.return_code = "ok"
+
+    # When
+    results = abi_serializer.decode_contract_query_response(
+        "getPairs", response, projection=["state.name", "first_token_reserve"]
+    )
+
+    # Then
+    assert results == [
+        10,
+        {
+            "state": {"name": "Active"},
+            "first_token_reserve": 129610503061042963410339063,
+        },
+        {
+            "state": {"name": "ActiveButNoSwap"},
+            "first_token_reserve": 79791000000000000000000,
+        },
+    ]
+
+
+def test_projected_outputs_plan_cached():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    projection = ["state.name", "first_token_reserve"]
+    outputs_plan = abi_serializer.get_projected_outputs_plan("getPairs", projection)
+
+    # When
+    cached_plan = abi_serializer.get_projected_outputs_plan(
+        "getPairs", tuple(projection)
+    )
+    other_plan = abi_serializer.get_projected_outputs_plan("getPairs", ["state"])
+
+    # Then
+    assert cached_plan is outputs_plan
+    assert other_plan is not outputs_plan
+    assert len(abi_serializer._projected_plans) == 2
+
+
+def test_single_path_projection():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    response = ContractQueryResponse()
+    response.return_data = [
+        "AAAACg==",
+        "AAAAeAEBY5L6MvMp/IWpWRnnjdLAMHLbORq20nPy6yGGe14/NtwAAAALTU1MRy05YTkwN2"
+        "IAAAAMV0VHTEQtYmQ0ZDc5AAAAEE1NTEdXRUdMRC04MzBkZjIAAAASAAAAC2s2F3MlLnj1"
+        "2ET3AAAACQED3roTHjjYfQAAAAgeTdFH8A0BhQE=",
+    ]
+    response.return_code = "ok"
+    outputs_plan = abi_serializer.get_projected_outputs_plan("getPairs", ["state.name"])
+
+    # When
+    results = abi_serializer.decode_contract_query_response(
+        "getPairs", response, projection="pair_id"
+    )
+    single_path_plan = abi_serializer.get_projected_outputs_plan(
+        "getPairs", "state.name"
+    )
+
+    # Then
+    assert results == [10, {"pair_id": 120}]
+    assert single_path_plan is outputs_plan
+
+
+@pytest.mark.parametrize(
+    "type_name,projection,expected_message",
+    [
+        ("Pair", ["unknown"], "The type Pair has no field unknown to select"),
+        ("Pair", ["state.label"], "The type State has no field label to select"),
+        ("Pair", ["owner.hrp"], "The type Address has no field hrp to select"),
+        ("u32", ["value"], "The type u32 has no field value to select"),
+    ],
+)
+def test_bad_projection(type_name: str, projection: List[str], expected_message: str):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    try:
+        abi_serializer.top_decode(type_name, b"", projection=projection)
+        raise RuntimeError("Above line should raise an error")
+    except errors.BadProjection as err:
+        assert err.args[0] == expected_message
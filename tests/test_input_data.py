@@ -0,0 +1,295 @@
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from mxpyserializer import errors
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.input_data import InputDataFilter
+
+
+@pytest.mark.parametrize(
+    "endpoint_name,values,transfers,receiver,expected_result",
+    [
+        (
+            "myEndpoint",
+            [15, True, "TFK-15987"],
+            None,
+            None,
+            "myEndpoint@0f@01@54464b2d3135393837",
+        ),
+        (
+            "swapMultiTokensFixedInput",
+            [105039000000000000, True, "XLH-8daa50", "WEGLD-bd4d79"],
+            [{"identifier": "XLH-8daa50", "amount": 1214524100000000000000}],
+            None,
+            "ESDTTransfer@584c482d386461613530@41d6e8622023004000"
+            "@737761704d756c7469546f6b656e734669786564496e707574@01752c69fa8ff000@01"
+            "@584c482d386461613530@5745474c442d626434643739",
+        ),
+        (
+            "addLiquidity",
+            [1, 1],
+            [
+                {"identifier": "ZOG-c66239", "nonce": 0, "amount": 10772407300},
+                {"identifier": "WEGLD-bd4d79", "nonce": 0, "amount": 6182113405711666},
+            ],
+            "erd1qqqqqqqqqqqqqpgqqz6vp9y50ep867vnr296mqf3dduh6guvmvlsu3sujc",
+            "MultiESDTNFTTransfer"
+            "@0000000000000000050000b4c094947e427d79931a8bad81316b797d238cdb3f@02"
+            "@5a4f472d633636323339@@028215e404@5745474c442d626434643739@"
+            "@15f69971823532@6164644c6971756964697479@01@01",
+        ),
+        (
+            "setSwapEnabledByUser",
+            ["erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg"],
+            [
+                {
+                    "identifier": "LKESDT-fc19ba",
+                    "nonce": 55,
+                    "amount": 885649999999999999000,
+                }
+            ],
+            bytes.fromhex(
+                "0000000000000000050006b46b15091d730e5f3b8c87c3e9c8a5d818c7ba5483"
+            ),
+            "ESDTNFTTransfer@4c4b455344542d666331396261@37@3002dcdea00cb4fc18"
+            "@0000000000000000050006b46b15091d730e5f3b8c87c3e9c8a5d818c7ba5483"
+            "@73657453776170456e61626c6564427955736572"
+            "@000000000000000005008c68c31186c3d96fba3932f38d8541f25f89291b5483",
+        ),
+    ],
+)
+def test_encode_endpoint_input_data(
+    endpoint_name: str,
+    values: List,
+    transfers: Optional[List[Dict]],
+    receiver,
+    expected_result: str,
+):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    result = abi_serializer.encode_endpoint_input_data(
+        endpoint_name, values, transfers, receiver
+    )
+    decoded_result = abi_serializer.decode_endpoint_input_data(result)
+
+    # Then
+    assert result == expected_result
+    assert decoded_result[0] == endpoint_name
+    assert decoded_result[2] == values
+    assert [t["amount"] for t in decoded_result[1]] == [
+        t["amount"] for t in transfers or []
+    ]
+
+
+def test_encode_endpoint_input_data_without_receiver():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    transfers = [{"identifier": "LKESDT-fc19ba", "nonce": 55, "amount": 1}]
+
+    # When
+    try:
+        abi_serializer.encode_endpoint_input_data("myEndpoint", [1, True], transfers)
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        assert (
+            err.args[0]
+            == "A receiver is required by ESDTNFTTransfer and MultiESDTNFTTransfer"
+        )
+
+
+@pytest.mark.parametrize(
+    "input_data",
+    [
+        "myEndpoint@0f@01@54464b2d3135393837",
+        "myEndpoint@0f@@",
+        "ESDTTransfer@584c482d386461613530@41d6e8622023004000"
+        "@737761704d756c7469546f6b656e734669786564496e707574@01752c69fa8ff000@01"
+        "@584c482d386461613530@5745474c442d626434643739",
+        "MultiESDTNFTTransfer"
+        "@0000000000000000050000b4c094947e427d79931a8bad81316b797d238cdb3f@02"
+        "@5a4f472d633636323339@@028215e404@5745474c442d626434643739@"
+        "@15f69971823532@6164644c6971756964697479@01@01",
+        "MultiESDTNFTTransfer@01@5a4f472d633636323339@@028215e404"
+        "@6164644c6971756964697479@01@01",
+    ],
+)
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+def test_decode_endpoint_input_data_bytes(input_data: str, buffer_type: type):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    expected_result = abi_serializer.decode_endpoint_input_data(input_data)
+    buffer = buffer_type(b"@@" + input_data.encode() + b"@@")
+
+    # When
+    result = abi_serializer.decode_endpoint_input_data(buffer[2:-2])
+
+    # Then
+    assert result == expected_result
+
+
+def test_decode_endpoint_input_data_missing_parts():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    try:
+        abi_serializer.decode_endpoint_input_data(b"ESDTTransfer@584c482d386461613530")
+        raise RuntimeError("Above line should raise an error")
+    except IndexError as err:
+        assert err.args[0] == "Expected at least 3 parts but got 2"
+
+
+SWAP_INPUT_DATA = (
+    "ESDTTransfer@584c482d386461613530@41d6e8622023004000"
+    "@737761704d756c7469546f6b656e734669786564496e707574@01752c69fa8ff000@01"
+    "@584c482d386461613530@5745474c442d626434643739"
+)
+ADD_LIQUIDITY_INPUT_DATA = (
+    "MultiESDTNFTTransfer"
+    "@0000000000000000050000b4c094947e427d79931a8bad81316b797d238cdb3f@02"
+    "@5a4f472d633636323339@@028215e404@5745474c442d626434643739@"
+    "@15f69971823532@6164644c6971756964697479@01@01"
+)
+NFT_TRANSFER_INPUT_DATA = (
+    "ESDTNFTTransfer@4c4b455344542d666331396261@37@3002dcdea00cb4fc18"
+    "@0000000000000000050006b46b15091d730e5f3b8c87c3e9c8a5d818c7ba5483"
+    "@73657453776170456e61626c6564427955736572"
+    "@000000000000000005008c68c31186c3d96fba3932f38d8541f25f89291b5483"
+)
+
+
+@pytest.mark.parametrize(
+    "input_filter,input_data,expected_result",
+    [
+        (InputDataFilter(), "anything@01", True),
+        (InputDataFilter({"myEndpoint"}), "myEndpoint@0f@01", True),
+        (InputDataFilter({"myEndpoint"}), "otherEndpoint@0f@01", False),
+        (InputDataFilter({"myEndpoint"}), "myEndpointBis", False),
+        (InputDataFilter(token_identifiers={"XLH-8daa50"}), "myEndpoint@0f", False),
+        (InputDataFilter({"swapMultiTokensFixedInput"}), SWAP_INPUT_DATA, True),
+        (InputDataFilter({"addLiquidity"}), SWAP_INPUT_DATA, False),
+        (InputDataFilter(token_identifiers={"XLH-8daa50"}), SWAP_INPUT_DATA, True),
+        (InputDataFilter(token_identifiers={"WEGLD-bd4d79"}), SWAP_INPUT_DATA, False),
+        (InputDataFilter({"addLiquidity"}), ADD_LIQUIDITY_INPUT_DATA, True),
+        (
+            InputDataFilter(token_identifiers={"WEGLD-bd4d79"}),
+            ADD_LIQUIDITY_INPUT_DATA,
+            True,
+        ),
+        (
+            InputDataFilter({"addLiquidity"}, {"XLH-8daa50"}),
+            ADD_LIQUIDITY_INPUT_DATA,
+            False,
+        ),
+        (
+            InputDataFilter(token_identifiers={"ZOG-c66239"}),
+            "MultiESDTNFTTransfer@01@5a4f472d633636323339@@028215e404",
+            True,
+        ),
+        (
+            InputDataFilter({"addLiquidity"}),
+            "MultiESDTNFTTransfer@01@5a4f472d633636323339@@028215e404",
+            False,
+        ),
+        (InputDataFilter({"setSwapEnabledByUser"}), NFT_TRANSFER_INPUT_DATA, True),
+        (
+            InputDataFilter(token_identifiers={"LKESDT-fc19ba"}),
+            NFT_TRANSFER_INPUT_DATA.upper().replace(
+                "ESDTNFTTRANSFER", "ESDTNFTTransfer"
+            ),
+            True,
+        ),
+        (InputDataFilter(token_identifiers={"ZOG-c66239"}), "ESDTTransfer", False),
+        (
+            InputDataFilter(token_identifiers={"ZOG-c66239"}),
+            "MultiESDTNFTTransfer@zz@5a4f472d633636323339@@028215e404",
+            False,
+        ),
+        (
+            InputDataFilter({"addLiquidity"}),
+            "MultiESDTNFTTransfer@-1@6164644c6971756964697479",
+            False,
+        ),
+        *[
+            (
+                InputDataFilter({"addLiquidity"}),
+                f"MultiESDTNFTTransfer@{count}@5a4f472d633636323339@@028215e404"
+                "@6164644c6971756964697479",
+                count == "01",
+            )
+            for count in ("01", "1", "0x01", "+1", "0_1", " 01")
+        ],
+        (InputDataFilter("myEndpoint"), "myEndpoint@0f@01", True),
+        (InputDataFilter("myEndpoint"), "m@0f@01", False),
+        (
+            InputDataFilter(token_identifiers="XLH-8daa50"),
+            SWAP_INPUT_DATA,
+            True,
+        ),
+    ],
+)
+def test_input_data_filter(
+    input_filter: InputDataFilter, input_data: str, expected_result: bool
+):
+    # Given
+    # When
+    results = [
+        input_filter.matches(input_data),
+        input_filter.matches(input_data.encode()),
+        input_filter.matches(memoryview(input_data.encode())),
+    ]
+
+    # Then
+    assert results == [expected_result] * 3
+
+
+def test_decode_endpoint_input_data_filtered():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    input_filter = InputDataFilter(endpoint_names=["swapMultiTokensFixedInput"])
+
+    # When
+    result = abi_serializer.decode_endpoint_input_data(
+        SWAP_INPUT_DATA, input_filter=input_filter
+    )
+    # the unknown endpoint is not decoded, so no error is raised
+    filtered_result = abi_serializer.decode_endpoint_input_data(
+        "unknownEndpoint@01", input_filter=input_filter
+    )
+
+    # Then
+    assert input_filter.endpoint_names == frozenset(["swapMultiTokensFixedInput"])
+    assert InputDataFilter("add", "WEGLD-bd4d79") == InputDataFilter(
+        {"add"}, {"WEGLD-bd4d79"}
+    )
+    assert result == abi_serializer.decode_endpoint_input_data(SWAP_INPUT_DATA)
+    assert filtered_result is None
+
+
+@pytest.mark.parametrize("buffer_type", [str, bytes, bytearray, memoryview])
+def test_decode_endpoint_input_data_left_over(buffer_type: type):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    input_data = "addLiquidity@01@02@0a@0b"
+    if buffer_type is not str:
+        input_data = buffer_type(input_data.encode())
+
+    # When
+    try:
+        abi_serializer.decode_endpoint_input_data(input_data)
+        raise RuntimeError("Above line should raise an error")
+    except errors.LeftOverData as err:
+        # Then
+        assert err.args[0] == (
+            "Some left over bytes were not decoded: [b'\\n', b'\\x0b']"
+        )
@@ -0,0 +1,190 @@
+import base64
+from pathlib import Path
+from typing import Any, Iterator, List, Union
+
+from multiversx_sdk_network_providers.contract_query_response import (
+    ContractQueryResponse,
+)
+import pytest
+
+from mxpyserializer import errors
+from mxpyserializer.abi_serializer import AbiSerializer
+
+
+@pytest.mark.parametrize(
+    "type_name,data",
+    [
+        ("List<u32>", b"\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\x03"),
+        ("List<u32>", [b"\x00\x00\x00\x01\x00\x00\x00\x02"]),
+        ("List<u32>", b""),
+        ("List<TokenIdentifier>", b"\x00\x00\x00\x03ABC\x00\x00\x00\x02DE"),
+        ("variadic<u8>", [b"\x01", b"\x02", b""]),
+        ("variadic<multi<u8,TokenIdentifier>>", [b"\x01", b"ABC", b"\x02", b"DE"]),
+        ("variadic<u8>", []),
+    ],
+)
+def test_iter_top_decode(type_name: str, data: Union[List[bytes], bytes]):
+    # Given
+    abi_serializer = AbiSerializer()
+    expected_results = abi_serializer.top_decode(type_name, data)
+
+    # When
+    results = abi_serializer.iter_top_decode(type_name, data)
+
+    # Then
+    assert isinstance(results, Iterator)
+    assert list(results) == expected_results
+
+
+def test_iter_top_decode_early_stop():
+    # Given
+    abi_serializer = AbiSerializer()
+    read_parts = []
+
+    def get_parts() -> Iterator[bytes]:
+        for i in range(1000):
+            read_parts.append(i)
+            yield i.to_bytes(4, "big")
+
+    # When
+    results = abi_serializer.iter_top_decode("variadic<multi<u32,u32>>", get_parts())
+    first_results = [next(results), next(results)]
+
+    # Then
+    assert first_results == [[0, 1], [2, 3]]
+    assert len(read_parts) == 4
+
+
+@pytest.mark.parametrize(
+    "return_data,endpoint_name",
+    [
+        (
+            [
+                "AAAACg==",
+                "AAAAeAEBY5L6MvMp/IWpWRnnjdLAMHLbORq20nPy6yGGe14/NtwAAAALTU1MRy05YTkwN2"
+                "IAAAAMV0VHTEQtYmQ0ZDc5AAAAEE1NTEdXRUdMRC04MzBkZjIAAAASAAAAC2s2F3MlLnj1"
+                "2ET3AAAACQED3roTHjjYfQAAAAgeTdFH8A0BhQE=",
+                "AAAAeQIA7ZTU+9847vZKnJJ/1vFolYMeqSpPJgNwQT7GIeCKbwgAAAAOUEFEQVdBTi1hMT"
+                "dmNTgAAAAKVEdSLTY4ZGExZQAAABFQQURBV0FOVEdSLTM1Y2YwMgAAABIAAAAKEOV6kSUp"
+                "6VwAAAAAAAsaDmJr8jc9T4AAAAAAAAoQ5XqRJSnpXAAAAQ==",
+            ],
+            "getPairs",
+        ),
+        (["AQAAAAxXRUdMRC1hYmNkZWY="], "endpoint_5"),
+    ],
+)
+def test_iter_decode_contract_query_response(
+    return_data: List[str], endpoint_name: str
+):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    response = ContractQueryResponse()
+    response.return_data = return_data
+    response.return_code = "ok"
+    expected_results = abi_serializer.decode_contract_query_response(
+        endpoint_name, response, address_format="hex"
+    )
+
+    # When
+    results = abi_serializer.iter_decode_contract_query_response(
+        endpoint_name, response, address_format="hex"
+    )
+
+    # Then
+    assert list(results) == expected_results
+
+
+@pytest.mark.parametrize(
+    "type_name,data,expected_error,expected_message",
+    [
+        (
+            "u32",
+            b"\x00\x00\x00\x01",
+            TypeError,
+            "Type u32 can not be decoded element by element",
+        ),
+        (
+            "variadic<multi<u8,u8>>",
+            [b"\x01", b"\x02", b"\x03"],
+            errors.MultiElementsNumberMismatch,
+            "The number of elements (1) is not coherent with the multi value size (2)",
+        ),
+    ],
+)
+def test_iter_top_decode_errors(
+    type_name: str, data: Any, expected_error: type, expected_message: str
+):
+    # Given
+    abi_serializer = AbiSerializer()
+
+    # When
+    try:
+        list(abi_serializer.iter_top_decode(type_name, data))
+        raise RuntimeError("Above line should raise an error")
+    except expected_error as err:
+        assert err.args[0] == expected_message
+
+
+LIST_ABI = {
+    "endpoints": [
+        {
+            "name": "getPositions",
+            "mutability": "readonly",
+            "inputs": [],
+            "outputs": [
+                {"type": "u32"},
+                {"type": "List<TokenIdentifier>"},
+                {"type": "List<u8>"},
+            ],
+        }
+    ],
+    "types": {},
+}
+
+
+def test_iter_decode_list_result():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(LIST_ABI)
+    response = ContractQueryResponse()
+    response.return_data = ["Ag==", "AAAAA0FCQwAAAAJERQ==", ""]
+    response.return_code = "ok"
+    expected_results = abi_serializer.decode_contract_query_response(
+        "getPositions", response
+    )
+
+    # When
+    results = list(
+        abi_serializer.iter_decode_contract_query_response("getPositions", response)
+    )
+
+    # Then
+    assert expected_results == [2, ["ABC", "DE"], []]
+    assert results[0] == 2
+    assert isinstance(results[1], Iterator)
+    assert [list(r) for r in results[1:]] == expected_results[1:]
+
+
+def test_iter_decode_list_result_early_stop():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(LIST_ABI)
+    # the third element is truncated: decoding the whole list would fail
+    list_data = b"\x00\x00\x00\x03ABC\x00\x00\x00\x02DE\x00\x00"
+    response = ContractQueryResponse()
+    response.return_data = ["Ag==", base64.b64encode(list_data).decode(), ""]
+    response.return_code = "ok"
+
+    # When
+    results = abi_serializer.iter_decode_contract_query_response(
+        "getPositions", response
+    )
+    _, elements, _ = results
+    first_elements = [next(elements), next(elements)]
+
+    # Then
+    assert first_elements == ["ABC", "DE"]
+    try:
+        next(elements)
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        assert err.args[0].startswith("Not enough data to decode")
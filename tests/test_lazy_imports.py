@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["multiversx_sdk_core", "multiversx_sdk_network_providers", "numpy", "pyarrow"],
+)
+def test_heavy_modules_not_imported(module: str):
+    # Given
+    code = (
+        "import sys; import mxpyserializer.abi_serializer; "
+        f"print({module!r} in sys.modules)"
+    )
+
+    # When
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+
+    # Then
+    assert output.stdout.strip() == "False"
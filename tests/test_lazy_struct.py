@@ -0,0 +1,118 @@
+from pathlib import Path
+import pickle
+
+import pytest
+
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.lazy_struct import NOT_DECODED, LazyStruct
+
+
+PAIR_VALUE = [
+    1,
+    0,
+    True,
+    "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg",
+    "A-123456",
+    "B-123456",
+    "AB-123456",
+    18,
+    10**20,
+    2,
+    3,
+    1,
+]
+
+FIXED_STRUCT_ABI = {
+    "types": {
+        "Point": {
+            "type": "struct",
+            "fields": [
+                {"name": "x", "type": "i32"},
+                {"name": "active", "type": "bool"},
+                {"name": "y", "type": "u64"},
+            ],
+        },
+    },
+}
+
+
+def test_lazy_struct_fields():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path).with_options(
+        address_format="hex"
+    )
+    lazy_serializer = abi_serializer.with_options(lazy_structs=True)
+    data = abi_serializer.nested_encode("Pair", PAIR_VALUE)
+    expected_result = abi_serializer.top_decode("Pair", data)
+
+    # When
+    result = lazy_serializer.top_decode("Pair", data)
+    reserve = result["first_token_reserve"]
+    token_id = result["lp_token_id"]
+
+    # Then
+    assert isinstance(result, LazyStruct)
+    assert reserve == 10**20
+    assert token_id == "AB-123456"
+    assert [v is NOT_DECODED for v in result._values].count(False) == 2
+    assert result["lp_token_id"] is token_id
+    assert result == expected_result
+    assert result.to_dict() == expected_result
+    assert list(result) == list(expected_result)
+    assert "owner" in result and "unknown" not in result
+
+
+def test_lazy_struct_nested():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    lazy_serializer = abi_serializer.with_options(lazy_structs=True)
+    data = abi_serializer.nested_encode("Pair", PAIR_VALUE)
+    expected_results = abi_serializer.top_decode("List<Pair>", data * 3)
+
+    # When
+    results = lazy_serializer.top_decode("List<Pair>", data * 3)
+    restored_results = pickle.loads(pickle.dumps(results))
+
+    # Then
+    assert [r["second_token_reserve"] for r in results] == [2, 2, 2]
+    assert results == expected_results
+    assert restored_results == expected_results
+    assert isinstance(restored_results[0], dict)
+
+
+def test_lazy_struct_static_offsets():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(FIXED_STRUCT_ABI)
+    lazy_serializer = abi_serializer.with_options(lazy_structs=True)
+    data = abi_serializer.nested_encode("Point", [-5, True, 2**40])
+
+    # When
+    layout = abi_serializer.get_struct_layout("Point")
+    result, left_over = lazy_serializer.nested_decode("Point", data + b"\x01")
+
+    # Then
+    assert layout.field_locations == ((0, 0), (0, 4), (0, 5))
+    assert layout.static_size == 13
+    assert result["y"] == 2**40
+    assert result == {"x": -5, "active": True, "y": 2**40}
+    assert left_over == b"\x01"
+
+
+@pytest.mark.parametrize("type_name,data_size", [("Pair", 60), ("Point", 12)])
+def test_lazy_struct_not_enough_data(type_name: str, data_size: int):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    abi_serializer.structs.update(AbiSerializer.from_abi_dict(FIXED_STRUCT_ABI).structs)
+    lazy_serializer = abi_serializer.with_options(lazy_structs=True)
+    values = {"Pair": PAIR_VALUE, "Point": [-5, True, 2**40]}[type_name]
+    data = abi_serializer.nested_encode(type_name, values)[:data_size]
+
+    # When
+    try:
+        lazy_serializer.nested_decode(type_name, data)
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        assert err.args[0].startswith("Not enough data to skip")
@@ -0,0 +1,279 @@
+from pathlib import Path
+from typing import Any, List
+
+from multiversx_sdk_network_providers.contract_query_response import (
+    ContractQueryResponse,
+)
+import numpy as np
+import pytest
+
+from mxpyserializer.abi_serializer import AbiSerializer
+
+
+@pytest.mark.parametrize(
+    "type_name,data,expected_results,expected_dtype",
+    [
+        (
+            "List<u64>",
+            "00000002000000000000000cffffffffffffffff",
+            [12, 2**64 - 1],
+            np.uint64,
+        ),
+        ("List<i16>", "00000003fffe00000100", [-2, 0, 256], np.int16),
+        ("array3<u8>", "01ff02", [1, 255, 2], np.uint8),
+        ("List<u32>", "00000000", [], np.uint32),
+    ],
+)
+def test_nested_decode_numpy(
+    type_name: str, data: str, expected_results: List[int], expected_dtype: Any
+):
+    # Given
+    abi_serializer = AbiSerializer(numpy_mode=True)
+
+    # When
+    result, left_over = abi_serializer.nested_decode(type_name, bytes.fromhex(data))
+
+    # Then
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == expected_dtype
+    assert result.dtype.isnative
+    assert result.tolist() == expected_results
+    assert left_over == b""
+
+
+@pytest.mark.parametrize(
+    "type_name,data,expected_results",
+    [
+        ("List<u32>", b"\x00\x00\x00\x01\x00\x00\x00\x02", [1, 2]),
+        ("variadic<u64>", [b"\x01", b"", b"\x01\x00"], [1, 0, 256]),
+    ],
+)
+def test_top_decode_numpy(type_name: str, data: Any, expected_results: List[int]):
+    # Given
+    abi_serializer = AbiSerializer(numpy_mode=True)
+
+    # When
+    result = abi_serializer.top_decode(type_name, data)
+
+    # Then
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == expected_results
+
+
+def test_numpy_mode_disabled():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    result, _ = abi_serializer.nested_decode("List<u8>", b"\x00\x00\x00\x01\x05")
+
+    # Then
+    assert result == [5]
+
+
+def test_numpy_decode_not_enough_data():
+    # Given
+    abi_serializer = AbiSerializer(numpy_mode=True)
+
+    # When
+    try:
+        abi_serializer.nested_decode("List<u16>", bytes.fromhex("000000020001"))
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        assert err.args[0].startswith("Not enough data to decode")
+
+
+@pytest.mark.parametrize(
+    "type_name,value,expected_results",
+    [
+        (
+            "List<u64>",
+            np.array([1, 2], dtype=np.int64),
+            "0000000200000000000000010000000000000002",
+        ),
+        ("array2<i16>", np.array([-1, 3], dtype=np.int8), "ffff0003"),
+        ("List<u8>", np.array([1.0, 2.0]), "000000020102"),
+        ("List<BigUint>", np.array([1, 256]), "000000020000000101000000020100"),
+    ],
+)
+def test_nested_encode_ndarray(type_name: str, value: Any, expected_results: str):
+    # Given
+    abi_serializer = AbiSerializer()
+
+    # When
+    result = abi_serializer.nested_encode(type_name, value)
+
+    # Then
+    assert result.hex() == expected_results
+
+
+@pytest.mark.parametrize(
+    "type_name,value,expected_results",
+    [
+        ("List<u16>", np.array([1, 2], dtype=np.uint16), b"\x00\x01\x00\x02"),
+        ("variadic<u64>", np.array([1, 0, 256]), [b"\x01", b"", b"\x01\x00"]),
+    ],
+)
+def test_top_encode_ndarray(type_name: str, value: Any, expected_results: Any):
+    # Given
+    abi_serializer = AbiSerializer()
+
+    # When
+    result = abi_serializer.top_encode(type_name, value)
+
+    # Then
+    assert result == expected_results
+
+
+def test_encode_ndarray_out_of_range():
+    # Given
+    abi_serializer = AbiSerializer()
+
+    # When
+    try:
+        abi_serializer.nested_encode("List<u8>", np.array([1, -1]))
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        assert err.args[0] == "Can not encode a negative number as an unsigned integer"
+
+
+VARIADIC_ABI = {
+    "endpoints": [
+        {
+            "name": "setValues",
+            "mutability": "mutable",
+            "inputs": [
+                {"name": "offset", "type": "i64"},
+                {"name": "scale", "type": "BigInt"},
+                {"name": "values", "type": "variadic<u64>", "multi_arg": True},
+            ],
+            "outputs": [],
+        }
+    ],
+    "types": {},
+}
+
+QUERY_ABI = {
+    "endpoints": [
+        {
+            "name": "getPrices",
+            "mutability": "readonly",
+            "inputs": [],
+            "outputs": [
+                {"type": "u32"},
+                {"type": "variadic<u64>", "multi_result": True},
+            ],
+        }
+    ],
+    "types": {},
+}
+
+
+@pytest.mark.parametrize(
+    "type_name,value,expected_results",
+    [
+        ("i64", np.int64(-5), b"\xfb"),
+        ("i8", np.int8(-1), b"\xff"),
+        ("BigInt", np.int64(-256), b"\xff\x00"),
+        ("u64", np.uint64(2**64 - 1), b"\xff" * 8),
+        ("variadic<i32>", np.array([-1, 2], dtype=np.int32), [b"\xff", b"\x02"]),
+    ],
+)
+def test_top_encode_numpy_scalars(type_name: str, value: Any, expected_results: Any):
+    # Given
+    abi_serializer = AbiSerializer(numpy_mode=True)
+
+    # When
+    result = abi_serializer.top_encode(type_name, value)
+
+    # Then
+    assert result == expected_results
+    decoded_value = abi_serializer.top_decode(type_name, result)
+    assert abi_serializer.top_encode(type_name, decoded_value) == result
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [-5, -2, 1, 2],
+        [np.int64(-5), np.int64(-2), np.uint64(1), np.uint64(2)],
+    ],
+)
+def test_encode_endpoint_numpy_values(values: List[Any]):
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(VARIADIC_ABI)
+
+    # When
+    data = abi_serializer.encode_endpoint_input_data("setValues", values)
+
+    # Then
+    assert data == "setValues@fb@fe@01@02"
+
+
+def test_encode_endpoint_ndarray_mixed_values():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(VARIADIC_ABI)
+    values = [-5, -2, np.array([1, 2], dtype=np.uint64), 3]
+
+    # When
+    try:
+        abi_serializer.encode_endpoint_input_data("setValues", values)
+        raise RuntimeError("Above line should raise an error")
+    except TypeError as err:
+        # Then
+        assert err.args[0] == (
+            "An ndarray must hold all the values of a variadic of integers"
+        )
+
+
+def test_decode_query_response_numpy():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(QUERY_ABI).with_options(
+        numpy_mode=True
+    )
+    response = ContractQueryResponse()
+    response.return_data = ["Ag==", "AQ==", "", "AQA="]
+    response.return_code = "ok"
+
+    # When
+    results = abi_serializer.decode_contract_query_response("getPrices", response)
+
+    # Then
+    assert len(results) == 2
+    assert results[0] == 2
+    assert isinstance(results[1], np.ndarray)
+    assert results[1].dtype == np.uint64
+    assert results[1].tolist() == [1, 0, 256]
+
+
+def test_decode_io_numpy():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(QUERY_ABI).with_options(
+        numpy_mode=True
+    )
+    outputs = abi_serializer.endpoints["getPrices"].outputs
+
+    # When
+    results = abi_serializer.decode_io(outputs, [b"\x02", b"\x01", b"\x02"])
+
+    # Then
+    assert results[0] == 2
+    assert isinstance(results[1], np.ndarray)
+    assert results[1].tolist() == [1, 2]
+
+
+def test_encode_numpy_decoded_input_data():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(VARIADIC_ABI).with_options(
+        numpy_mode=True
+    )
+    data = "setValues@fb@ff00@01@0200"
+    endpoint_name, _, values = abi_serializer.decode_endpoint_input_data(data)
+
+    # When
+    result = abi_serializer.encode_endpoint_input_data(endpoint_name, values)
+
+    # Then
+    assert isinstance(values[2], np.ndarray)
+    assert result == data
@@ -0,0 +1,118 @@
+from pathlib import Path
+import pickle
+from typing import List
+
+import pytest
+
+from mxpyserializer import errors
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.input_data import InputDataFilter
+from mxpyserializer.parallel import iter_chunks
+
+
+def get_raw_inputs(abi_serializer: AbiSerializer, n_inputs: int) -> List[str]:
+    raw_inputs = []
+    for i in range(n_inputs):
+        encoded_inputs = abi_serializer.encode_endpoint_inputs(
+            "myEndpoint",
+            [i * 10**18, i % 2 == 0, *[f"TKN-{j:06d}" for j in range(i % 3)]],
+        )
+        raw_inputs.append("@".join(["myEndpoint", *[e.hex() for e in encoded_inputs]]))
+    return raw_inputs
+
+
+def test_pickle_serializer():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    abi_serializer.numpy_mode = True
+    abi_serializer.get_struct_layout("Pair")
+
+    # When
+    restored_serializer = pickle.loads(pickle.dumps(abi_serializer))
+
+    # Then
+    assert restored_serializer.to_dict() == abi_serializer.to_dict()
+    assert restored_serializer.numpy_mode
+    assert set(restored_serializer._endpoint_plans) == set(
+        abi_serializer._endpoint_plans
+    )
+
+
+@pytest.mark.parametrize(
+    "values,chunk_size,expected_results",
+    [
+        (range(5), 2, [[0, 1], [2, 3], [4]]),
+        (range(4), 2, [[0, 1], [2, 3]]),
+        ([], 3, []),
+    ],
+)
+def test_iter_chunks(values, chunk_size: int, expected_results: List):
+    # Given
+    # When
+    results = list(iter_chunks(values, chunk_size))
+
+    # Then
+    assert results == expected_results
+
+
+@pytest.mark.parametrize(
+    "workers,chunk_size,max_pending_chunks",
+    [(0, 1000, None), (2, 7, None), (2, 3, 1)],
+)
+def test_decode_many_input_data(workers: int, chunk_size: int, max_pending_chunks: int):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    raw_inputs = get_raw_inputs(abi_serializer, 50)
+    expected_results = [
+        abi_serializer.decode_endpoint_input_data(d) for d in raw_inputs
+    ]
+
+    # When
+    results = abi_serializer.decode_many_input_data(
+        iter(raw_inputs),
+        workers=workers,
+        chunk_size=chunk_size,
+        max_pending_chunks=max_pending_chunks,
+    )
+
+    # Then
+    assert list(results) == expected_results
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_decode_many_input_data_filtered(workers: int):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    raw_inputs = get_raw_inputs(abi_serializer, 10)
+    raw_inputs[3] = "unknownEndpoint@01"
+    input_filter = InputDataFilter(endpoint_names={"myEndpoint"})
+
+    # When
+    results = abi_serializer.decode_many_input_data(
+        raw_inputs, workers=workers, chunk_size=4, input_filter=input_filter
+    )
+
+    # Then
+    expected_results = [
+        abi_serializer.decode_endpoint_input_data(d) if i != 3 else None
+        for i, d in enumerate(raw_inputs)
+    ]
+    assert list(results) == expected_results
+
+
+def test_decode_many_input_data_error():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+    raw_inputs = get_raw_inputs(abi_serializer, 4) + ["unknownEndpoint@01"]
+
+    # When
+    results = abi_serializer.decode_many_input_data(raw_inputs, workers=2, chunk_size=2)
+    try:
+        list(results)
+        raise RuntimeError("Above line should raise an error")
+    except errors.UnknownEndpoint as err:
+        assert err.args[0] == "Unknown endpoint: unknownEndpoint"
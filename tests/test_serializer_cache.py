@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+from mxpyserializer import serializer_cache
+from mxpyserializer.abi_serializer import AbiSerializer
+
+
+@pytest.fixture(name="package_version")
+def fixture_package_version(monkeypatch) -> str:
+    # the tests run on the sources, for which the package version is unknown
+    monkeypatch.setattr(serializer_cache, "get_package_version", lambda: "1.2.3")
+    return "1.2.3"
+
+
+def test_cache_miss_then_hit(tmp_path: Path, package_version: str):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    reference_serializer = AbiSerializer.from_abi(file_path)
+    value = [
+        1,
+        0,
+        True,
+        "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2jpswk0kgg",
+    ]
+    value += ["A-123456", "B-123456", "AB-123456", 18, 1, 2, 3, 1]
+    encoded_value = reference_serializer.top_encode("Pair", value)
+
+    # When
+    compiled_serializer = AbiSerializer.from_abi(file_path, cache_dir=tmp_path)
+    cached_serializer = AbiSerializer.from_abi(file_path, cache_dir=tmp_path)
+
+    # Then
+    cache_paths = list(tmp_path.glob("*.pickle"))
+    assert len(cache_paths) == 1
+    assert cache_paths[0].name.endswith(
+        f"-{package_version}-{serializer_cache.CACHE_FORMAT}.pickle"
+    )
+    assert cached_serializer is not compiled_serializer
+    assert cached_serializer.to_dict() == reference_serializer.to_dict()
+    assert "Pair" in cached_serializer._type_nodes
+    assert "variadic<TokenIdentifier>" in cached_serializer._type_nodes
+    assert cached_serializer._endpoint_plans == {}
+    assert cached_serializer.top_decode("Pair", encoded_value) == (
+        reference_serializer.top_decode("Pair", encoded_value)
+    )
+    assert cached_serializer.top_encode("Pair", value) == encoded_value
+
+
+def test_stale_entries_removed(tmp_path: Path, monkeypatch):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_content = file_path.read_bytes()
+    monkeypatch.setattr(serializer_cache, "get_package_version", lambda: "1.0.0")
+    AbiSerializer.from_abi(file_path, cache_dir=tmp_path)
+    old_cache_path = serializer_cache.get_cache_path(tmp_path, abi_content)
+
+    # When
+    monkeypatch.setattr(serializer_cache, "get_package_version", lambda: "2.0.0")
+    AbiSerializer.from_abi(file_path, cache_dir=tmp_path)
+    new_cache_path = serializer_cache.get_cache_path(tmp_path, abi_content)
+
+    # Then
+    assert old_cache_path != new_cache_path
+    assert not old_cache_path.exists()
+    assert new_cache_path.exists()
+
+
+def test_other_abi_entries_kept(tmp_path: Path, package_version: str):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    other_entry_path = tmp_path / f"{'0' * 64}-0.0.1-1.pickle"
+    other_entry_path.write_bytes(b"")
+
+    # When
+    AbiSerializer.from_abi(file_path, cache_dir=tmp_path)
+
+    # Then
+    assert other_entry_path.exists()
+    assert len(list(tmp_path.glob(f"*-{package_version}-*.pickle"))) == 1
+
+
+def test_unknown_version_not_cached(tmp_path: Path, monkeypatch):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    monkeypatch.setattr(
+        serializer_cache,
+        "get_package_version",
+        lambda: serializer_cache.UNKNOWN_VERSION,
+    )
+
+    # When
+    abi_serializer = AbiSerializer.from_abi(file_path, cache_dir=tmp_path)
+
+    # Then
+    assert serializer_cache.get_cache_path(tmp_path, file_path.read_bytes()) is None
+    assert "Pair" in abi_serializer.structs
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_corrupted_entry_invalidated(tmp_path: Path, package_version: str):
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    cache_path = serializer_cache.get_cache_path(tmp_path, file_path.read_bytes())
+    cache_path.write_bytes(b"not a pickle")
+
+    # When
+    abi_serializer = AbiSerializer.from_abi(file_path, cache_dir=tmp_path)
+
+    # Then
+    assert package_version in cache_path.name
+    assert "Pair" in abi_serializer.structs
+    assert serializer_cache.load_state(cache_path) is not None
+    assert list(tmp_path.glob("*.tmp")) == []
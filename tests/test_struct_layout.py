@@ -0,0 +1,131 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.struct_layout import FixedFieldsRun
+from mxpyserializer.type_tree import AddressTypeNode, BasicTypeNode, EnumTypeNode
+
+
+FIXED_FIELDS_ABI = {
+    "endpoints": [],
+    "types": {
+        "Position": {
+            "type": "struct",
+            "fields": [
+                {"name": "id", "type": "u64"},
+                {"name": "delta", "type": "i16"},
+                {"name": "active", "type": "bool"},
+                {"name": "owner", "type": "Address"},
+                {"name": "label", "type": "utf-8 string"},
+                {"name": "rank", "type": "u8"},
+            ],
+        },
+        "Action": {
+            "type": "enum",
+            "variants": [
+                {"name": "Wait", "discriminant": 0},
+                {
+                    "name": "Move",
+                    "discriminant": 1,
+                    "fields": [
+                        {"name": "0", "type": "i32"},
+                        {"name": "1", "type": "u16"},
+                    ],
+                },
+            ],
+        },
+    },
+}
+
+
+def test_struct_layout_segments():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    layout = abi_serializer.get_struct_layout("Pair")
+
+    # Then
+    assert layout.segments[0] == FixedFieldsRun((BasicTypeNode("u32"),))
+    assert layout.segments[1] == EnumTypeNode("State")
+    assert layout.segments[2] == FixedFieldsRun(
+        (BasicTypeNode("bool"), AddressTypeNode("Address"))
+    )
+    assert layout.segments[2].codec.format == ">B32s"
+    assert abi_serializer.get_struct_layout("Pair") is layout
+
+
+@pytest.mark.parametrize(
+    "type_name,value,expected_results",
+    [
+        (
+            "Position",
+            {
+                "id": 12,
+                "delta": -2,
+                "active": True,
+                "owner": "erd1qqqqqqqqqqqqqpgq335vxyvxc0vklw3extecmp2p7f0cj2gm2j"
+                "pswk0kgg",
+                "label": "abc",
+                "rank": 255,
+            },
+            "000000000000000c"
+            "fffe"
+            "01"
+            "000000000000000005008c68c31186c3d96fba3932f38d8541f25f89291b5483"
+            "00000003616263"
+            "ff",
+        ),
+        ("Action", {"name": "Move", "values": [-1, 7]}, "01ffffffff0007"),
+    ],
+)
+def test_fixed_fields_round_trip(
+    type_name: str, value: Dict[str, Any], expected_results: str
+):
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(FIXED_FIELDS_ABI)
+
+    # When
+    encoded_value = abi_serializer.nested_encode(type_name, value)
+    decoded_value, left_over = abi_serializer.nested_decode(type_name, encoded_value)
+
+    # Then
+    assert encoded_value.hex() == expected_results
+    assert left_over == b""
+    if "values" in value:
+        assert decoded_value["values"] == value["values"]
+    else:
+        assert decoded_value == value
+
+
+def test_fixed_fields_encode_fallback():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(FIXED_FIELDS_ABI)
+    buffer = bytearray(b"\x01")
+
+    # When
+    try:
+        abi_serializer.encode_into(
+            "Action", {"name": "Move", "values": [1, -7]}, buffer
+        )
+        raise RuntimeError("Above line should raise an error")
+    except ValueError:
+        pass
+
+    # Then
+    assert buffer == bytearray(b"\x01\x01\x00\x00\x00\x01")
+
+
+def test_fixed_fields_decode_not_enough_data():
+    # Given
+    abi_serializer = AbiSerializer.from_abi_dict(FIXED_FIELDS_ABI)
+
+    # When
+    try:
+        abi_serializer.nested_decode("Action", bytes.fromhex("01ffffffff00"))
+        raise RuntimeError("Above line should raise an error")
+    except ValueError as err:
+        assert err.args[0].startswith("Not enough data to decode")
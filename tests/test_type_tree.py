@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+
+from mxpyserializer import errors
+from mxpyserializer.abi_serializer import AbiSerializer
+from mxpyserializer.type_tree import (
+    ArrayTypeNode,
+    BasicTypeNode,
+    EnumTypeNode,
+    ListTypeNode,
+    MultiTypeNode,
+    OptionTypeNode,
+    OptionalTypeNode,
+    StructTypeNode,
+    TupleTypeNode,
+    TypeNode,
+    VariadicTypeNode,
+    parse_type,
+    split_generic_arguments,
+)
+
+
+@pytest.mark.parametrize(
+    "arguments,expected_results",
+    [
+        ("u8", ["u8"]),
+        ("bool, i32", ["bool", "i32"]),
+        (
+            "List<u8>, multi<u8,u16>, utf-8 string",
+            ["List<u8>", "multi<u8,u16>", "utf-8 string"],
+        ),
+    ],
+)
+def test_split_generic_arguments(arguments: str, expected_results: list):
+    # Given
+    # When
+    results = split_generic_arguments(arguments)
+
+    # Then
+    assert expected_results == results
+
+
+@pytest.mark.parametrize(
+    "type_name,expected_node",
+    [
+        ("u32", BasicTypeNode("u32")),
+        ("utf-8 string", BasicTypeNode("utf-8 string")),
+        (
+            "List<Option<u32>>",
+            ListTypeNode(
+                "List<Option<u32>>", OptionTypeNode("Option<u32>", BasicTypeNode("u32"))
+            ),
+        ),
+        ("array5<u8>", ArrayTypeNode("array5<u8>", 5, BasicTypeNode("u8"))),
+        (
+            "tuple<bool, i32>",
+            TupleTypeNode(
+                "tuple<bool, i32>", (BasicTypeNode("bool"), BasicTypeNode("i32"))
+            ),
+        ),
+        (
+            "optional<Pair>",
+            OptionalTypeNode("optional<Pair>", StructTypeNode("Pair")),
+        ),
+        (
+            "variadic<multi<State,List<u8>>>",
+            VariadicTypeNode(
+                "variadic<multi<State,List<u8>>>",
+                MultiTypeNode(
+                    "multi<State,List<u8>>",
+                    (
+                        EnumTypeNode("State"),
+                        ListTypeNode("List<u8>", BasicTypeNode("u8")),
+                    ),
+                ),
+            ),
+        ),
+    ],
+)
+def test_parse_type(type_name: str, expected_node: TypeNode):
+    # Given
+    structs = {"Pair"}
+    enums = {"State"}
+
+    # When
+    node = parse_type(type_name, structs, enums)
+
+    # Then
+    assert expected_node == node
+
+
+@pytest.mark.parametrize(
+    "type_name", ["UnknownStruct", "List<u8, u16>", "arrayX<u8>", "Option<Unknown>"]
+)
+def test_parse_unknown_type(type_name: str):
+    # Given
+    # When
+    try:
+        parse_type(type_name, set(), set())
+        raise RuntimeError("Above line should raise an error")
+    except errors.UnknownType as err:
+        assert err.args[0].startswith("Unknown type: ")
+
+
+def test_type_node_cache():
+    # Given
+    file_path = Path("tests/data/mycontract.abi.json")
+    abi_serializer = AbiSerializer.from_abi(file_path)
+
+    # When
+    first_node = abi_serializer.get_type_node("List<Pair>")
+    second_node = abi_serializer.get_type_node("List<Pair>")
+
+    # Then
+    assert first_node is second_node
+    assert first_node == ListTypeNode("List<Pair>", StructTypeNode("Pair"))